@@ -50,6 +50,7 @@ setup(
     include_package_data=True,  # see MANIFEST.in
     dependency_links=[],
     install_requires=[],
+    extras_require={'capture': ['numpy']},
     cmdclass={},
     license='LICENSE.txt',
     long_description=open(os.path.join(script_directory, 'README.md')).read(),
@@ -0,0 +1,132 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from typing import List, Tuple, Final
+from vsomeip_py import codec
+
+HEADER: Final[List[Tuple[str, str]]] = [('timestamp', '=f8'), ('event', '=u2'), ('session', '=u2'), ('length', '=u4')]  # native, per record
+
+_KINDS: Final[dict] = {'?': '?', 'B': 'u1', 'H': 'u2', 'I': 'u4', 'Q': 'u8', 'b': 'i1', 'h': 'i2', 'i': 'i4', 'q': 'i8', 'f': 'f4', 'd': 'f8'}
+
+
+def _numpy():
+    """
+    :return: numpy, imported once capturing
+    :except: 'ImportError'
+    """
+    try:
+        import numpy
+    except ImportError as ex:
+        raise ImportError("capture requires numpy, see: pip install vsomeip_py[capture]") from ex
+    return numpy
+
+
+def dtype(schema: codec.Type, little_endian: bool = False):
+    """
+    :param schema: fixed size payload, ex: Struct(('speed', FLOAT32), ('rpm', UINT16))
+    :param little_endian: byte order, else SOME/IP network (big endian)
+    :return: numpy dtype of the payload (packed, fields in payload byte order)
+    :except: 'ValueError'
+    """
+    numpy = _numpy()
+    order = '<' if little_endian else '>'
+
+    def _dtype(element: codec.Type):
+        if isinstance(element, codec.Primitive):
+            return numpy.dtype(order + _KINDS[element.format])
+        if isinstance(element, codec.Struct) and element.length is None:
+            return numpy.dtype([(name, _dtype(member)) for name, member in element.members])
+        if isinstance(element, codec.Array) and element.count is not None:
+            return numpy.dtype(f"S{element.count}") if element.element is codec.UINT8 else numpy.dtype((_dtype(element.element), (element.count,)))
+        if isinstance(element, codec.String) and element.size is not None:
+            return numpy.dtype(f"S{element.size}")  # with byte order mark, see 'String.decode'
+        raise ValueError(f"not fixed size: {type(element).__name__}")
+
+    return _dtype(schema)
+
+
+class Capture:
+    """
+    events recorded instead of callbacks: fixed layout payloads appended (with timestamp and session) by the
+    dispatcher thread to preallocated buffers without the GIL, read as NumPy structured arrays without copying
+    """
+
+    def __init__(self, someip, events: List[int], payload, groups: List[int] = None, capacity: int = 65536):
+        """
+        create capture (see 'start')
+        :param someip: client application ('vSOMEIP') subscribing
+        :param events: event ids (ex: 0x8???)
+        :param payload: numpy dtype of payloads, fixed size schema (see 'vsomeip_py.codec') or bytes per payload
+        :param groups: groups of all the events, else default
+        :param capacity: records per buffer, once full later ones dropped until 'swap'
+        :except: 'ImportError', 'ValueError'
+        """
+        numpy = _numpy()
+        if isinstance(payload, int):
+            payload = numpy.dtype(('u1', (payload,)))
+        elif isinstance(payload, codec.Type):
+            payload = dtype(payload)
+        self.dtype = numpy.dtype(HEADER + [('payload', payload)])  # packed, as written natively
+        self._someip = someip
+        self._events = events
+        self._groups = groups if groups else [someip.ANY]
+        self._capacity = capacity
+        self._capture = None
+        self._buffer = None
+        self.dropped = 0  # records dropped so far, see 'swap'
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def _allocate(self):
+        return _numpy().empty(self._capacity, dtype=self.dtype)
+
+    def start(self):
+        """
+        subscribe and record, application created (and started)
+        """
+        if self._capture is None:
+            self._buffer = self._allocate()
+            self._capture = self._someip.module.capture(self._someip._handle, self._someip._id, self._someip._instance, self._events, self._groups,
+                                                        self._someip._version[0], self.dtype['payload'].itemsize, self._buffer)
+
+    def swap(self):
+        """
+        :return: records since started/last swap (structured array, see 'dtype'), recording continues into a new buffer
+        """
+        buffer, self._buffer = self._buffer, self._allocate()
+        count, self.dropped = self._someip.module.capture_swap(self._capture, self._buffer)
+        return buffer[:count]
+
+    def stop(self):
+        """
+        :return: records since started/last swap, later events dropped (still subscribed until application stopped)
+        """
+        if self._capture is None:
+            return _numpy().empty(0, dtype=self.dtype)
+        buffer, self._buffer = self._buffer, None
+        count, self.dropped = self._someip.module.capture_swap(self._capture, None)
+        self._capture = None
+        return buffer[:count]
@@ -0,0 +1,614 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import struct
+import itertools
+from typing import Any, Dict, List, Optional, Tuple, Final
+
+_LENGTHS: Final[Dict[int, str]] = {8: 'B', 16: 'H', 32: 'I'}  # length/type field bits -> struct format
+
+_ENCODINGS: Final[Dict[str, Tuple[bytes, bytes]]] = {  # string encoding -> (BOM, terminator)
+    'utf-8': (b'\xef\xbb\xbf', b'\x00'),
+    'utf-16le': (b'\xff\xfe', b'\x00\x00'),
+    'utf-16be': (b'\xfe\xff', b'\x00\x00'),
+}
+
+
+def _length(bits: int, name: str, optional: bool = False) -> Optional[str]:
+    """
+    :param bits: length/type field size
+    :param name: field described, for errors
+    :param optional: 0 (no field) allowed
+    :return: struct format, None if no field
+    :except: 'ValueError'
+    """
+    if optional and bits == 0:
+        return None
+    if bits not in _LENGTHS:
+        raise ValueError(f"{name} field of {bits} bits, expected {'0, ' if optional else ''}8, 16 or 32")
+    return _LENGTHS[bits]
+
+
+def _indent(lines: List[str]) -> List[str]:
+    return ['    ' + line for line in lines]
+
+
+def _read_end(end: str, header: str, size: int, fields: str = '') -> List[str]:
+    """
+    :param end: name assigned the offset after the data
+    :param header: name of struct of length field (first) and 'fields'
+    :param size: of header
+    :param fields: names assigned the other header fields, ex: ', _k1'
+    :return: statements reading the header at 'offset', advancing 'offset'
+    """
+    return [f"{end}{fields or ','} = {header}.unpack_from(view, offset)",
+            f"offset += {size}",
+            f"{end} += offset",
+            f"if {end} > len(view):",
+            f"    raise ValueError(f'length {{{end} - offset}} exceeds {{len(view) - offset}} bytes left')"]
+
+
+class _Context:
+    """
+    one codec being compiled: byte order and the namespace (structs, helpers) its generated functions run in
+    """
+
+    def __init__(self, order: str):
+        self.order = order
+        self.namespace = {'_pack': struct.pack, '_unpack_from': struct.unpack_from, '_chain': itertools.chain}
+        self._count = 0
+
+    def local(self, prefix: str = '_v') -> str:
+        """
+        :return: unique name
+        """
+        self._count += 1
+        return f"{prefix}{self._count}"
+
+    def constant(self, value: Any, prefix: str = '_c') -> str:
+        """
+        :return: name of value in the namespace
+        """
+        name = self.local(prefix)
+        self.namespace[name] = value
+        return name
+
+    def struct(self, format: str) -> Tuple[str, int]:
+        """
+        :param format: struct format, without byte order
+        :return: name of compiled struct in the namespace, its size
+        """
+        compiled = struct.Struct(self.order + format)
+        return self.constant(compiled, '_S'), compiled.size
+
+    def function(self, arguments: List[str], lines: List[str]):
+        """
+        :param arguments: argument names
+        :param lines: body, not indented
+        :return: function compiled in the namespace
+        """
+        name = self.local('_f')
+        source = f"def {name}({', '.join(arguments)}):\n" + ''.join(f"    {line}\n" for line in lines or ['pass'])
+        exec(compile(source, f"<vsomeip_py.codec {name}>", 'exec'), self.namespace)
+        return self.namespace[name]
+
+
+class Type:
+    """
+    schema element, compiled by 'Codec' into statements writing to 'out' (bytearray) and reading from 'view'
+    (memoryview) at 'offset'; fixed size elements also into struct formats packed with their neighbours
+    """
+
+    def _format(self, ctx: _Context) -> Optional[str]:
+        """
+        :return: struct format (without byte order) if fixed size, else None
+        """
+        return None
+
+    def _flat(self, src: str, ctx: _Context) -> List[str]:
+        """
+        :param src: expression of the value
+        :return: expressions of the values packed with '_format', fixed size only
+        """
+        raise NotImplementedError
+
+    def _build(self, values: str, index: int, ctx: _Context) -> Tuple[str, int]:
+        """
+        :param values: name of the unpacked tuple
+        :param index: first of the values
+        :return: expression of the value from the unpacked values, index after them, fixed size only
+        """
+        raise NotImplementedError
+
+    def _write(self, src: str, ctx: _Context) -> List[str]:
+        """
+        :param src: expression of the value
+        :return: statements appending the value to 'out'
+        """
+        name, _ = ctx.struct(self._format(ctx))
+        return [f"out += {name}.pack({', '.join(self._flat(src, ctx))})"]
+
+    def _read(self, target: str, ctx: _Context) -> List[str]:
+        """
+        :param target: name assigned the value
+        :return: statements reading the value from 'view' at 'offset', advancing 'offset'
+        """
+        name, size = ctx.struct(self._format(ctx))
+        values = ctx.local('_t')
+        value, _ = self._build(values, 0, ctx)
+        return [f"{values} = {name}.unpack_from(view, offset)", f"{target} = {value}", f"offset += {size}"]
+
+
+class Primitive(Type):
+    """
+    boolean, integer or float
+    """
+
+    def __init__(self, format: str):
+        """
+        :param format: struct format character
+        """
+        self.format = format
+
+    def _format(self, ctx: _Context) -> Optional[str]:
+        return self.format
+
+    def _flat(self, src: str, ctx: _Context) -> List[str]:
+        return [src]
+
+    def _build(self, values: str, index: int, ctx: _Context) -> Tuple[str, int]:
+        return f"{values}[{index}]", index + 1
+
+
+BOOL: Final[Primitive] = Primitive('?')
+UINT8: Final[Primitive] = Primitive('B')
+UINT16: Final[Primitive] = Primitive('H')
+UINT32: Final[Primitive] = Primitive('I')
+UINT64: Final[Primitive] = Primitive('Q')
+SINT8: Final[Primitive] = Primitive('b')
+SINT16: Final[Primitive] = Primitive('h')
+SINT32: Final[Primitive] = Primitive('i')
+SINT64: Final[Primitive] = Primitive('q')
+FLOAT32: Final[Primitive] = Primitive('f')
+FLOAT64: Final[Primitive] = Primitive('d')
+
+
+class Struct(Type):
+    """
+    members in order as 'dict' (name -> value), with length field (extensible: unknown trailing members skipped) or without
+    """
+
+    def __init__(self, *members: Tuple[str, Type], length: int = 0):
+        """
+        :param members: (name, type)
+        :param length: bits of length field, 0 if none
+        :except: 'ValueError'
+        """
+        names = [name for name, _ in members]
+        if len(set(names)) != len(names):
+            raise ValueError(f"duplicate struct members: {names}")
+        self.members = members
+        self.length = _length(length, 'struct length', optional=True)
+
+    def _format(self, ctx: _Context) -> Optional[str]:
+        if self.length is not None:
+            return None
+        formats = [member._format(ctx) for _, member in self.members]
+        return None if None in formats else ''.join(formats)
+
+    def _flat(self, src: str, ctx: _Context) -> List[str]:
+        return [flat for name, member in self.members for flat in member._flat(f"{src}[{name!r}]", ctx)]
+
+    def _build(self, values: str, index: int, ctx: _Context) -> Tuple[str, int]:
+        fields = []
+        for name, member in self.members:
+            value, index = member._build(values, index, ctx)
+            fields.append(f"{name!r}: {value}")
+        return f"{{{', '.join(fields)}}}", index
+
+    def _segments(self, ctx: _Context) -> List[Tuple[bool, List[Tuple[str, Type]]]]:
+        """
+        :return: (fixed, members), neighbouring fixed size members packed at once
+        """
+        segments = []
+        for name, member in self.members:
+            is_fixed = member._format(ctx) is not None
+            if is_fixed and segments and segments[-1][0]:
+                segments[-1][1].append((name, member))
+            else:
+                segments.append((is_fixed, [(name, member)]))
+        return segments
+
+    def _write(self, src: str, ctx: _Context) -> List[str]:
+        if self._format(ctx) is not None:
+            return super()._write(src, ctx)
+
+        value = ctx.local()
+        lines = [f"{value} = {src}"]
+        if self.length is not None:
+            length, size = ctx.struct(self.length)
+            start = ctx.local('_s')
+            lines += [f"{start} = len(out)", f"out += bytes({size})"]
+        for is_fixed, members in self._segments(ctx):
+            if is_fixed:
+                name, _ = ctx.struct(''.join(member._format(ctx) for _, member in members))
+                flats = [flat for member_name, member in members for flat in member._flat(f"{value}[{member_name!r}]", ctx)]
+                lines.append(f"out += {name}.pack({', '.join(flats)})")
+            else:
+                member_name, member = members[0]
+                lines += member._write(f"{value}[{member_name!r}]", ctx)
+        if self.length is not None:
+            lines.append(f"{length}.pack_into(out, {start}, len(out) - {start} - {size})")
+        return lines
+
+    def _read(self, target: str, ctx: _Context) -> List[str]:
+        if self._format(ctx) is not None:
+            return super()._read(target, ctx)
+
+        lines = []
+        if self.length is not None:
+            length, size = ctx.struct(self.length)
+            end = ctx.local('_e')
+            lines += _read_end(end, length, size)
+        fields = []
+        for is_fixed, members in self._segments(ctx):
+            if is_fixed:
+                name, size = ctx.struct(''.join(member._format(ctx) for _, member in members))
+                values = ctx.local('_t')
+                lines += [f"{values} = {name}.unpack_from(view, offset)", f"offset += {size}"]
+                index = 0
+                for member_name, member in members:
+                    value, index = member._build(values, index, ctx)
+                    fields.append(f"{member_name!r}: {value}")
+            else:
+                member_name, member = members[0]
+                value = ctx.local()
+                lines += member._read(value, ctx)
+                fields.append(f"{member_name!r}: {value}")
+        lines.append(f"{target} = {{{', '.join(fields)}}}")
+        if self.length is not None:
+            lines.append(f"offset = {end}")  # newer members skipped
+        return lines
+
+
+class Array(Type):
+    """
+    'list' of elements ('bytes' if of 'UINT8'), fixed count without length field or dynamic with length field (bytes)
+    """
+
+    def __init__(self, element: Type, count: int = None, length: int = 32):
+        """
+        :param element: type of elements
+        :param count: elements of fixed array, else dynamic
+        :param length: bits of length field, dynamic only
+        :except: 'ValueError'
+        """
+        if count is not None and count <= 0:
+            raise ValueError(f"array count {count}, expected positive")
+        self.element = element
+        self.count = count
+        self.length = None if count is not None else _length(length, 'array length')
+
+    def _is_bytes(self) -> bool:
+        return self.element is UINT8
+
+    def _format(self, ctx: _Context) -> Optional[str]:
+        element = self.element._format(ctx)
+        if self.count is None or element is None:
+            return None
+        if self._is_bytes():
+            return f"{self.count}s"
+        if isinstance(self.element, Primitive):
+            return f"{self.count}{element}"
+        return element * self.count
+
+    def _flat(self, src: str, ctx: _Context) -> List[str]:
+        if self._is_bytes():
+            return [f"{ctx.constant(_exact, '_exact')}({src}, {self.count})"]
+        if isinstance(self.element, Primitive):
+            return [f"*{src}"]
+        return [f"*_chain.from_iterable(map({self._flatten(ctx)}, {src}))"]
+
+    def _build(self, values: str, index: int, ctx: _Context) -> Tuple[str, int]:
+        if self._is_bytes():
+            return f"{values}[{index}]", index + 1
+        if isinstance(self.element, Primitive):
+            return f"list({values}[{index}:{index + self.count}])", index + self.count
+        _, step = self.element._build('t', 0, ctx)
+        end = index + step * self.count
+        return f"[{self._builder(ctx)}({values}[i:i + {step}]) for i in range({index}, {end}, {step})]", end
+
+    def _flatten(self, ctx: _Context) -> str:
+        """
+        :return: name of function flattening one (fixed size) element
+        """
+        return ctx.constant(ctx.function(['v'], [f"return ({', '.join(self.element._flat('v', ctx))},)"]), '_flatten')
+
+    def _builder(self, ctx: _Context) -> str:
+        """
+        :return: name of function building one (fixed size) element from its values
+        """
+        value, _ = self.element._build('t', 0, ctx)
+        return ctx.constant(ctx.function(['t'], [f"return {value}"]), '_builder')
+
+    def _write(self, src: str, ctx: _Context) -> List[str]:
+        if self._format(ctx) is not None:
+            return super()._write(src, ctx)
+
+        value = ctx.local()
+        lines = [f"{value} = {src}"]
+        element = self.element._format(ctx)
+        if self.count is not None:  # fixed count of dynamic size elements
+            lines += [f"if len({value}) != {self.count}:",
+                      f"    raise ValueError(f'array of {{len({value})}} elements, expected {self.count}')"]
+        elif element is not None:  # dynamic count of fixed size elements, length known upfront
+            length, _ = ctx.struct(self.length)
+            name, size = ctx.struct(element)
+            lines.append(f"out += {length}.pack(len({value}) * {size})")
+            if self._is_bytes():
+                lines.append(f"out += {value}")
+            elif isinstance(self.element, Primitive):
+                lines.append(f"out += _pack('{ctx.order}%d{element}' % len({value}), *{value})")
+            else:
+                item = ctx.local('_i')
+                lines += [f"for {item} in {value}:"] + _indent([f"out += {name}.pack({', '.join(self.element._flat(item, ctx))})"])
+            return lines
+
+        if self.length is not None:
+            length, size = ctx.struct(self.length)
+            start = ctx.local('_s')
+            lines += [f"{start} = len(out)", f"out += bytes({size})"]
+        item = ctx.local('_i')
+        lines += [f"for {item} in {value}:"] + _indent(self.element._write(item, ctx))
+        if self.length is not None:
+            lines.append(f"{length}.pack_into(out, {start}, len(out) - {start} - {size})")
+        return lines
+
+    def _read(self, target: str, ctx: _Context) -> List[str]:
+        if self._format(ctx) is not None:
+            return super()._read(target, ctx)
+
+        element = self.element._format(ctx)
+        item = ctx.local('_i')
+        if self.count is not None:  # fixed count of dynamic size elements
+            return [f"{target} = []", f"for _ in range({self.count}):"] + _indent(self.element._read(item, ctx) + [f"{target}.append({item})"])
+
+        length, size = ctx.struct(self.length)
+        end = ctx.local('_e')
+        lines = _read_end(end, length, size)
+        if self._is_bytes():
+            lines.append(f"{target} = bytes(view[offset:{end}])")
+        elif isinstance(self.element, Primitive):
+            element_size = struct.calcsize(element)
+            lines.append(f"{target} = list(_unpack_from('{ctx.order}%d{element}' % (({end} - offset) // {element_size}), view, offset))")
+        elif element is not None:
+            name, _ = ctx.struct(element)
+            lines.append(f"{target} = [{self._builder(ctx)}(t) for t in {name}.iter_unpack(view[offset:{end}])]")
+        else:
+            lines += [f"{target} = []", f"while offset < {end}:"] + _indent(self.element._read(item, ctx) + [f"{target}.append({item})"])
+        lines.append(f"offset = {end}")
+        return lines
+
+
+def _exact(data: bytes, count: int) -> bytes:
+    """
+    :return: data if count bytes, packing would pad/truncate silently
+    :except: 'ValueError'
+    """
+    if len(data) != count:
+        raise ValueError(f"array of {len(data)} bytes, expected {count}")
+    return data
+
+
+class String(Type):
+    """
+    'str' with byte order mark and terminator, fixed size (bytes, zero padded) without length field or dynamic with
+    length field (bytes)
+    """
+
+    def __init__(self, size: int = None, encoding: str = 'utf-8', length: int = 32):
+        """
+        :param size: bytes of fixed string (including byte order mark and terminator), else dynamic
+        :param encoding: 'utf-8', 'utf-16le' or 'utf-16be'
+        :param length: bits of length field, dynamic only
+        :except: 'ValueError'
+        """
+        if encoding not in _ENCODINGS:
+            raise ValueError(f"unknown encoding: {encoding}")
+        bom, terminator = _ENCODINGS[encoding]
+        if size is not None and size < len(bom) + len(terminator):
+            raise ValueError(f"string of {size} bytes, too small for byte order mark and terminator")
+        self.size = size
+        self.encoding = encoding
+        self.length = None if size is not None else _length(length, 'string length')
+
+    def encode(self, text: str) -> bytes:
+        """
+        :return: text with byte order mark and terminator, zero padded if fixed size
+        :except: 'ValueError'
+        """
+        bom, terminator = _ENCODINGS[self.encoding]
+        data = bom + text.encode(self.encoding) + terminator
+        if self.size is not None:
+            if len(data) > self.size:
+                raise ValueError(f"string of {len(data)} bytes, fixed to {self.size}")
+            data += bytes(self.size - len(data))
+        return data
+
+    def decode(self, data) -> str:
+        """
+        :param data: bytes-like, byte order mark optional
+        :return: text up to its terminator
+        """
+        data = bytes(data)
+        bom, _ = _ENCODINGS[self.encoding]
+        if data.startswith(bom):
+            data = data[len(bom):]
+        return data.decode(self.encoding).split('\x00', 1)[0]
+
+    def _format(self, ctx: _Context) -> Optional[str]:
+        return None if self.size is None else f"{self.size}s"
+
+    def _flat(self, src: str, ctx: _Context) -> List[str]:
+        return [f"{ctx.constant(self.encode, '_encode')}({src})"]
+
+    def _build(self, values: str, index: int, ctx: _Context) -> Tuple[str, int]:
+        return f"{ctx.constant(self.decode, '_decode')}({values}[{index}])", index + 1
+
+    def _write(self, src: str, ctx: _Context) -> List[str]:
+        if self.size is not None:
+            return super()._write(src, ctx)
+        length, _ = ctx.struct(self.length)
+        data = ctx.local('_b')
+        return [f"{data} = {ctx.constant(self.encode, '_encode')}({src})", f"out += {length}.pack(len({data}))", f"out += {data}"]
+
+    def _read(self, target: str, ctx: _Context) -> List[str]:
+        if self.size is not None:
+            return super()._read(target, ctx)
+        length, size = ctx.struct(self.length)
+        end = ctx.local('_e')
+        return _read_end(end, length, size) + [f"{target} = {ctx.constant(self.decode, '_decode')}(view[offset:{end}])", f"offset = {end}"]
+
+
+class Union(Type):
+    """
+    one of the options as (name, value), None if empty; type field selects options in order from 1 (0 empty),
+    unknown types read as (type, bytes)
+    """
+
+    def __init__(self, *options: Tuple[str, Type], length: int = 32, selector: int = 32):
+        """
+        :param options: (name, type)
+        :param length: bits of length field
+        :param selector: bits of type field
+        :except: 'ValueError'
+        """
+        names = [name for name, _ in options]
+        if len(set(names)) != len(names):
+            raise ValueError(f"duplicate union options: {names}")
+        self.options = options
+        self.length = _length(length, 'union length')
+        self.selector = _length(selector, 'union type')
+
+    def _write(self, src: str, ctx: _Context) -> List[str]:
+        header, size = ctx.struct(self.length + self.selector)
+        selectors = {name: index for index, (name, _) in enumerate(self.options, 1)}
+        selectors.update({index: index for index in selectors.values()})
+        value, key, option, start = ctx.local(), ctx.local('_k'), ctx.local('_o'), ctx.local('_s')
+        lines = [f"{value} = {src}",
+                 f"if {value} is None:",
+                 f"    out += {header}.pack(0, 0)",
+                 "else:",
+                 f"    {key}, {option} = {value}",
+                 f"    {key} = {ctx.constant(selectors, '_selectors')}[{key}]",
+                 f"    {start} = len(out)",
+                 f"    out += bytes({size})"]
+        for index, (_, member) in enumerate(self.options, 1):
+            lines += _indent([f"{'if' if index == 1 else 'elif'} {key} == {index}:"] + _indent(member._write(option, ctx)))
+        lines.append(f"    {header}.pack_into(out, {start}, len(out) - {start} - {size}, {key})")
+        return lines
+
+    def _read(self, target: str, ctx: _Context) -> List[str]:
+        header, size = ctx.struct(self.length + self.selector)
+        end, key, option = ctx.local('_e'), ctx.local('_k'), ctx.local('_o')
+        lines = _read_end(end, header, size, f", {key}") + [f"if {key} == 0:", f"    {target} = None"]
+        for index, (name, member) in enumerate(self.options, 1):
+            lines += [f"elif {key} == {index}:"] + _indent(member._read(option, ctx) + [f"{target} = ({name!r}, {option})"])
+        lines += ["else:", f"    {target} = ({key}, bytes(view[offset:{end}]))", f"offset = {end}"]
+        return lines
+
+
+class Codec:
+    """
+    schema compiled once into functions packing/unpacking whole runs of fixed size members with one precompiled
+    'struct.Struct', encoding to payload buffers and decoding straight from received buffers (including zero copy views)
+    """
+
+    def __init__(self, schema: Type, little_endian: bool = False):
+        """
+        :param schema: type of the payload, ex: Struct(('id', UINT16), ('name', String()))
+        :param little_endian: byte order, else SOME/IP network (big endian)
+        :except: 'ValueError'
+        """
+        ctx = _Context('<' if little_endian else '>')
+        self.schema = schema
+        self._encode = ctx.function(['value', 'out'], schema._write('value', ctx))
+        self._decode = ctx.function(['view', 'offset'], schema._read('value', ctx) + ['return value, offset'])
+        format = schema._format(ctx)
+        self.size = None if format is None else struct.calcsize(ctx.order + format)  # bytes if fixed size
+        self._pack_into = None
+        if format is not None:
+            name, _ = ctx.struct(format)
+            self._pack_into = ctx.function(['buffer', 'offset', 'value'], [f"{name}.pack_into(buffer, offset, {', '.join(schema._flat('value', ctx))})"])
+
+    def encode(self, value: Any, out: bytearray = None) -> bytearray:
+        """
+        :param value: value of the schema
+        :param out: appended to, else new
+        :return: payload, ex: for 'request' or 'notify'
+        :except: 'ValueError'
+        """
+        if out is None:
+            out = bytearray()
+        try:
+            self._encode(value, out)
+        except (struct.error, KeyError, IndexError, TypeError) as ex:
+            raise ValueError(f"cannot encode: {ex}") from ex
+        return out
+
+    def encode_into(self, buffer, offset: int, value: Any) -> int:
+        """
+        :param buffer: writable buffer, ex: frame of 'notify_frame'
+        :param offset: where written
+        :param value: value of the schema
+        :return: offset after the value
+        :except: 'ValueError'
+        """
+        if self._pack_into is None:
+            data = self.encode(value)
+            memoryview(buffer)[offset:offset + len(data)] = data
+            return offset + len(data)
+        try:
+            self._pack_into(buffer, offset, value)
+        except (struct.error, KeyError, IndexError, TypeError) as ex:
+            raise ValueError(f"cannot encode: {ex}") from ex
+        return offset + self.size
+
+    def decode(self, data, offset: int = 0) -> Any:
+        """
+        :param data: bytes-like, ex: received 'data'
+        :param offset: where read
+        :return: value of the schema
+        :except: 'ValueError'
+        """
+        return self.decode_from(data, offset)[0]
+
+    def decode_from(self, data, offset: int = 0) -> Tuple[Any, int]:
+        """
+        :param data: bytes-like, ex: received 'data'
+        :param offset: where read
+        :return: value of the schema, offset after it
+        :except: 'ValueError'
+        """
+        try:
+            return self._decode(memoryview(data), offset)
+        except (struct.error, UnicodeDecodeError) as ex:  # truncated/malformed
+            raise ValueError(f"cannot decode: {ex}") from ex
@@ -0,0 +1,313 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+import copy
+import json
+import hashlib
+import shutil
+import tempfile
+import threading
+import atexit
+from typing import Final, Tuple, Dict
+
+
+class Configuration:
+    """
+    vsomeip configuration files, kept in memory and written (content addressed) under a private
+    temporary directory only when changed, applications pointed at it with 'VSOMEIP_CONFIGURATION'
+    """
+
+    ENVIRONMENT: Final[str] = 'VSOMEIP_CONFIGURATION'
+
+    def __init__(self, directory: str = None):
+        """
+        :param directory: where files are written, else private temporary directory (removed at exit)
+        """
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._digest = None
+        self._path = None
+
+    @property
+    def directory(self) -> str:
+        """
+        :return: directory files are written
+        """
+        if not self._directory:
+            self._directory = tempfile.mkdtemp(prefix='vsomeip_py_')
+            atexit.register(shutil.rmtree, self._directory, True)
+        return self._directory
+
+    @property
+    def path(self) -> str:
+        """
+        :return: file last written, None if none
+        """
+        return self._path
+
+    @staticmethod
+    def serialize(configuration: dict) -> bytes:
+        """
+        :param configuration: json style dictionary of vsomeip configuration file
+        :return: canonical (sorted, compact) content
+        """
+        return json.dumps(configuration, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+    def write(self, configuration: dict) -> str:
+        """
+        write configuration if content changed and point applications created afterwards at it
+        :param configuration: json style dictionary of vsomeip configuration file
+        :return: file path
+        """
+        content = Configuration.serialize(configuration)
+        digest = hashlib.sha1(content).hexdigest()
+
+        with self._lock:
+            if digest != self._digest:
+                path = os.path.join(self.directory, f"vsomeip_{digest}.json")
+                if not os.path.exists(path):
+                    temporary = f"{path}.{os.getpid()}.tmp"
+                    with open(temporary, "wb") as file_handle:
+                        file_handle.write(content)
+                    os.replace(temporary, path)  # atomic, readers never see partial content
+                self._digest = digest
+                self._path = path
+            os.environ[Configuration.ENVIRONMENT] = self._path
+        return self._path
+
+
+class ConfigurationBuilder:
+    """
+    vsomeip configuration, applications, services and clients indexed by key (duplicates merged, conflicts
+    detected when added) with application ids and ports allocated, emitted as json style dictionary with 'build'
+    """
+
+    def __init__(self, configuration: dict = None, application_id: int = 0x1000, port: int = 30500, service_id: int = 0x1000):
+        """
+        :param configuration: json style dictionary of vsomeip configuration file, any entries indexed
+        :param application_id: first application id allocated
+        :param port: first port allocated
+        :param service_id: first service id allocated
+        :except: 'ValueError' (conflicting entries)
+        """
+        configuration = copy.deepcopy(configuration) if configuration else {}
+        self._applications: Dict[str, dict] = {}  # name -> entry
+        self._application_ids: Dict[int, str] = {}  # id -> name
+        self._services: Dict[Tuple[int, int], dict] = {}  # (service, instance) -> entry
+        self._clients: Dict[Tuple[int, int], dict] = {}  # (service, instance) -> entry
+        self._ports: Dict[str, Dict[int, Tuple[int, int]]] = {'unreliable': {}, 'reliable': {}}  # port -> (service, instance)
+        self._next_id = application_id
+        self._next_port = port
+        self._next_service = service_id
+
+        discovery = configuration.get("service-discovery", {})
+        if "port" in discovery:
+            self._ports['unreliable'][int(discovery["port"])] = None  # reserved, service discovery
+
+        for entry in configuration.pop("applications", []):
+            entry = dict(entry)
+            self.application(entry.pop('name'), ConfigurationBuilder._int(entry.pop('id', None)), **entry)
+        for entry in configuration.pop("services", []):
+            entry = dict(entry)
+            self.service(ConfigurationBuilder._int(entry.pop('service')), ConfigurationBuilder._int(entry.pop('instance')),
+                         entry.pop('unreliable', None), entry.pop('reliable', None), **entry)
+        for entry in configuration.pop("clients", []):
+            entry = dict(entry)
+            self.client(ConfigurationBuilder._int(entry.pop('service')), ConfigurationBuilder._int(entry.pop('instance')),
+                        entry.pop('unreliable', None), entry.pop('reliable', None), **entry)
+        self._base = configuration
+
+    @staticmethod
+    def _int(value):
+        """ configuration files may hold ids as (hex) strings """
+        return int(value, 0) if isinstance(value, str) else value
+
+    @staticmethod
+    def _port(value):
+        """ port of 'unreliable' (int) or 'reliable' ({'port': int}) entry """
+        if isinstance(value, dict):
+            value = value.get('port')
+        return ConfigurationBuilder._int(value)
+
+    def application(self, name: str, id: int = None, **options) -> int:
+        """
+        add application (same again ignored)
+        :param name: application name
+        :param id: application id, else allocated
+        :param options: any other entries of the application
+        :return: application id
+        :except: 'ValueError' (name or id used with other)
+        """
+        entry = self._applications.get(name)
+        if entry:
+            if id is not None and id != entry['id']:
+                raise ValueError(f"application '{name}' has id: {hex(entry['id'])}, not {hex(id)}")
+            entry.update(options)
+            return entry['id']
+
+        if id is None:
+            while self._next_id in self._application_ids:
+                self._next_id = self._next_id + 1
+            id = self._next_id
+        elif id in self._application_ids:
+            raise ValueError(f"application id {hex(id)} used by '{self._application_ids[id]}'")
+
+        self._applications[name] = {'name': name, 'id': id, **options}
+        self._application_ids[id] = name
+        return id
+
+    def _allocate(self, protocol: str, port, key: Tuple[int, int]) -> int:
+        """
+        reserve port for service
+        :param protocol: 'unreliable' or 'reliable'
+        :param port: port, True allocated, None (no port)
+        :param key: (service, instance)
+        :return: port
+        :except: 'ValueError' (port used)
+        """
+        if port is None or port is False:
+            return None
+        ports = self._ports[protocol]
+        if port is True:
+            while self._next_port in ports:
+                self._next_port = self._next_port + 1
+            port = self._next_port
+        elif port in ports:
+            used = ports[port]
+            raise ValueError(f"{protocol} port {port} used by " +
+                             (f"service {hex(used[0])}.{hex(used[1])}" if used else "service discovery"))
+        ports[port] = key
+        return port
+
+    def service(self, service: int, instance: int, unreliable=True, reliable=None, **options) -> dict:
+        """
+        add offered service (same again merged, ports only added where none so far)
+        :param service: service id, None allocated (unused by services and clients of any instance)
+        :param instance: service instance
+        :param unreliable: udp port, True allocated, None (no port)
+        :param reliable: tcp port ('port' of dict entry), True allocated, None (no port)
+        :param options: any other entries of the service
+        :return: service entry
+        :except: 'ValueError' (ports conflicting)
+        """
+        if service is None:
+            used = {each[0] for each in self._services} | {each[0] for each in self._clients}
+            while self._next_service in used:
+                self._next_service = self._next_service + 1
+            service = self._next_service
+        key = (service, instance)
+        unreliable = ConfigurationBuilder._port(unreliable)
+        reliable_options = reliable if isinstance(reliable, dict) else {}
+        reliable = ConfigurationBuilder._port(reliable)
+
+        entry = self._services.get(key)
+        if entry:
+            added = {}  # protocol -> port, of those without port so far
+            for protocol, port in (('unreliable', unreliable), ('reliable', reliable)):
+                if not isinstance(port, int) or isinstance(port, bool):
+                    continue  # allocated only when added, see 'True'
+                if protocol not in entry:
+                    added[protocol] = port
+                elif port != ConfigurationBuilder._port(entry[protocol]):
+                    raise ValueError(f"service {hex(service)}.{hex(instance)} has {protocol} port: "
+                                     f"{ConfigurationBuilder._port(entry[protocol])}, not {port}")
+            if 'unreliable' in added:
+                self._allocate('unreliable', added['unreliable'], key)
+            if 'reliable' in added:
+                try:
+                    self._allocate('reliable', added['reliable'], key)
+                except ValueError:
+                    self._ports['unreliable'].pop(added.get('unreliable'), None)
+                    raise
+            if 'unreliable' in added:
+                entry['unreliable'] = added['unreliable']
+            if 'reliable' in added:
+                entry['reliable'] = {**reliable_options, 'port': added['reliable']}
+            entry.update(options)
+            return entry
+
+        entry = {'service': service, 'instance': instance}
+        unreliable = self._allocate('unreliable', unreliable, key)
+        try:
+            reliable = self._allocate('reliable', reliable, key)
+        except ValueError:
+            self._ports['unreliable'].pop(unreliable, None)
+            raise
+        if unreliable is not None:
+            entry['unreliable'] = unreliable
+        if reliable is not None:
+            entry['reliable'] = {**reliable_options, 'port': reliable}
+        entry.update(options)
+
+        self._services[key] = entry
+        return entry
+
+    def client(self, service: int, instance: int, unreliable=None, reliable=None, **options) -> dict:
+        """
+        add consumed service (same again merged, ports only added where none so far)
+        :param service: service id
+        :param instance: service instance
+        :param unreliable: udp port, else as service offered (if added)
+        :param reliable: tcp port ('port' of dict entry), else as service offered (if added)
+        :param options: any other entries of the client
+        :return: client entry
+        :except: 'ValueError' (ports conflicting)
+        """
+        key = (service, instance)
+        offered = self._services.get(key, {})
+        if unreliable is None:
+            unreliable = offered.get('unreliable')
+        if reliable is None:
+            reliable = offered.get('reliable')
+
+        entry = self._clients.get(key)
+        if entry:
+            for protocol, port in (('unreliable', unreliable), ('reliable', reliable)):
+                if port is not None and protocol in entry and ConfigurationBuilder._port(port) != ConfigurationBuilder._port(entry[protocol]):
+                    raise ValueError(f"client {hex(service)}.{hex(instance)} has {protocol} port: "
+                                     f"{ConfigurationBuilder._port(entry[protocol])}, not {ConfigurationBuilder._port(port)}")
+            if unreliable is not None and 'unreliable' not in entry:
+                entry['unreliable'] = unreliable  # none so far, merged
+            if reliable is not None and 'reliable' not in entry:
+                entry['reliable'] = copy.deepcopy(reliable)
+            entry.update(options)
+            return entry
+
+        entry = {'service': service, 'instance': instance}
+        if unreliable is not None:
+            entry['unreliable'] = unreliable
+        if reliable is not None:
+            entry['reliable'] = copy.deepcopy(reliable)
+        entry.update(options)
+
+        self._clients[key] = entry
+        return entry
+
+    def build(self) -> dict:
+        """
+        :return: json style dictionary of vsomeip configuration file
+        """
+        configuration = copy.deepcopy(self._base)
+        configuration["applications"] = copy.deepcopy(list(self._applications.values()))
+        configuration["services"] = copy.deepcopy(list(self._services.values()))
+        configuration["clients"] = copy.deepcopy(list(self._clients.values()))
+        return configuration
@@ -0,0 +1,158 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+import traceback
+import concurrent.futures
+from collections import deque
+from typing import Callable, Final
+
+REQUEST: Final[int] = 0x00  # 'vSOMEIP.Message_Type.REQUEST', only those are responded
+
+
+class Dispatcher:
+    """
+    Callbacks off the vsomeip dispatcher thread: inline, thread pool or process pool (CPU heavy, callbacks
+    picklable), in order per (service, method) and responded once done (see 'vSOMEIP.respond')
+    """
+
+    INLINE: Final[str] = 'inline'
+    THREAD: Final[str] = 'thread'
+    PROCESS: Final[str] = 'process'
+
+    def __init__(self, someip, mode: str = THREAD, workers: int = None, executor: concurrent.futures.Executor = None):
+        """
+        create dispatcher
+        :param someip: application ('vSOMEIP') receiving and responding
+        :param mode: 'inline' (on the dispatcher thread), 'thread' or 'process'
+        :param workers: executor workers, else executor default
+        :param executor: executor used instead of creating one (not shut down by 'shutdown')
+        :except: 'ValueError'
+        """
+        if mode not in (Dispatcher.INLINE, Dispatcher.THREAD, Dispatcher.PROCESS):
+            raise ValueError(f"unknown mode: {mode}")
+        self._someip = someip
+        self._mode = mode
+        self._is_owner = executor is None and mode != Dispatcher.INLINE
+        if executor is None and mode == Dispatcher.THREAD:
+            executor = concurrent.futures.ThreadPoolExecutor(workers, thread_name_prefix='vsomeip_py_dispatch')
+        elif executor is None and mode == Dispatcher.PROCESS:
+            executor = concurrent.futures.ProcessPoolExecutor(workers)
+        self._executor = executor
+        self._pending = {}  # (service, method) -> deque of calls waiting, present while one running
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)  # nothing pending
+        self._chained = threading.local()  # calls submitted by '_run' of this thread, see '_run'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.shutdown()
+
+    def wrap(self, callback: Callable[[int, int, int, int, bytearray, int], bytearray]) -> Callable[..., bytearray]:
+        """
+        :param callback: function for on message, its returned data responds to requests
+        :return: function for 'on_message'/'on_event' dispatching to callback, registered with 'message=True'
+         responses are sent over the transport of the request, else unreliable (udp)
+        """
+        if self._mode == Dispatcher.INLINE:
+            return callback
+
+        def _dispatch(*received) -> bytearray:
+            is_tcp = False
+            if len(received) == 1:  # 'vSOMEIP.Message'
+                message = received[0]
+                received = (message.type.value, message.service, message.instance, message.id, message.data, message.request_id)
+                is_tcp = message.is_reliable
+            type, service, instance, id, data, request_id = received
+            if self._mode == Dispatcher.PROCESS and not isinstance(data, (bytes, bytearray)):
+                data = bytes(data)  # received views do not cross processes
+            self._submit((service, id), callback, (type, service, instance, id, data, request_id), is_tcp)
+            return None  # responded when done
+        return _dispatch
+
+    def on_message(self, id: int, callback: Callable[[int, int, int, int, bytearray, int], bytearray]):
+        """
+        register for message, dispatched (responded over the transport of the request)
+        :param id: message id
+        :param callback: function for on message, its returned data responds to requests
+        """
+        self._someip.on_message(id, self.wrap(callback), message=self._mode != Dispatcher.INLINE)
+
+    def _submit(self, key, callback, arguments, is_tcp: bool):
+        with self._lock:
+            waiting = self._pending.get(key)
+            if waiting is not None:  # one running, keep order
+                waiting.append((callback, arguments, is_tcp))
+                return
+            self._pending[key] = deque()
+        self._run(key, callback, arguments, is_tcp)
+
+    def _run(self, key, callback, arguments, is_tcp: bool):
+        chained = getattr(self._chained, 'calls', None)
+        if chained is not None:  # done at once, called back from 'add_done_callback' below: looped, not recursed
+            chained.append((key, callback, arguments, is_tcp))
+            return
+
+        self._chained.calls = chained = deque([(key, callback, arguments, is_tcp)])
+        try:
+            while chained:
+                key, callback, arguments, is_tcp = chained.popleft()
+                try:
+                    future = self._executor.submit(callback, *arguments)
+                except RuntimeError:  # shut down
+                    with self._lock:
+                        self._pending.pop(key, None)
+                        self._idle.notify_all()
+                    continue
+                future.add_done_callback(lambda done, key=key, arguments=arguments, is_tcp=is_tcp: self._done(key, arguments, is_tcp, done))
+        finally:
+            self._chained.calls = None
+
+    def _done(self, key, arguments, is_tcp: bool, future: concurrent.futures.Future):
+        type, service, instance, id, data, request_id = arguments
+        try:
+            result = future.result()
+            if result is not None and type == REQUEST:
+                self._someip.respond(id, request_id, result, is_tcp=is_tcp, service=service, instance=instance)
+        except Exception:
+            traceback.print_exc()  # as failing callbacks on the dispatcher thread
+
+        with self._lock:
+            waiting = self._pending[key]
+            if not waiting:
+                del self._pending[key]
+                self._idle.notify_all()
+                return
+            callback, arguments, is_tcp = waiting.popleft()
+        self._run(key, callback, arguments, is_tcp)
+
+    def shutdown(self, wait: bool = True):
+        """
+        stop dispatching, executor shut down if created here
+        :param wait: until dispatched callbacks done
+        """
+        if wait:
+            with self._lock:
+                self._idle.wait_for(lambda: not self._pending)
+        if self._is_owner:
+            self._executor.shutdown(wait)
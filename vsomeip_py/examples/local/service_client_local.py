@@ -85,8 +85,7 @@ class client:
 
     def activate(self):
         self.someip.create()
-        for service_event in self.service_events:
-            self.someip.on_event(service_event, self.test)
+        self.someip.subscribe_events(self.service_events, callback=self.test)
 
         self.someip.register()
         self.someip.start()
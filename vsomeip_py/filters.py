@@ -0,0 +1,133 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import math
+from vsomeip_py import codec
+
+
+class Filter:
+    """
+    declarative message filter, evaluated natively before the GIL is taken (messages discarded never reach the
+    interpreter); filters of an id apply to all its callbacks, in order, payloads too short never pass
+    """
+
+    def spec(self) -> tuple:
+        """
+        :return: native form, ('kind', parameters...)
+        """
+        raise NotImplementedError
+
+
+class Mask(Filter):
+    """
+    payload bytes at offset, masked, equal to value
+    """
+
+    def __init__(self, offset: int, value: bytes, mask: bytes = None):
+        """
+        :param offset: of the bytes in the payload
+        :param value: bytes compared
+        :param mask: bits compared of each byte, else all
+        :except: 'ValueError'
+        """
+        if mask is None:
+            mask = bytes([0xFF] * len(value))
+        if offset < 0 or len(mask) != len(value):
+            raise ValueError(f"mask of {len(mask)} bytes at {offset}, value of {len(value)}")
+        self.offset = offset
+        self.mask = bytes(mask)
+        self.value = bytes(v & m for v, m in zip(value, mask))
+
+    def spec(self) -> tuple:
+        return 'mask', self.offset, self.mask, self.value
+
+
+class Range(Filter):
+    """
+    value at offset (decoded as primitive) within minimum and maximum, inclusive
+    """
+
+    def __init__(self, offset: int, type: codec.Primitive = codec.UINT8, minimum: float = None, maximum: float = None, little_endian: bool = False):
+        """
+        :param offset: of the value in the payload
+        :param type: of the value, ex: 'codec.UINT16'
+        :param minimum: lowest passing, else unbounded
+        :param maximum: highest passing, else unbounded
+        :param little_endian: byte order, else SOME/IP network (big endian)
+        :except: 'ValueError'
+        """
+        if offset < 0 or not isinstance(type, codec.Primitive):
+            raise ValueError(f"range of {type} at {offset}, expected primitive")
+        self.offset = offset
+        self.type = type
+        self.minimum = -math.inf if minimum is None else float(minimum)
+        self.maximum = math.inf if maximum is None else float(maximum)
+        self.little_endian = little_endian
+
+    def spec(self) -> tuple:
+        return 'range', self.offset, self.type.format, self.little_endian, self.minimum, self.maximum
+
+
+class Decimate(Filter):
+    """
+    every Nth message (first included)
+    """
+
+    def __init__(self, every: int):
+        """
+        :param every: messages per one passing
+        :except: 'ValueError'
+        """
+        if every < 1:
+            raise ValueError(f"decimate every {every}, expected positive")
+        self.every = every
+
+    def spec(self) -> tuple:
+        return 'decimate', self.every
+
+
+class RateLimit(Filter):
+    """
+    at most rate messages per second (token bucket), bursts up to burst
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        :param rate: messages per second
+        :param burst: messages passing at once after idle
+        :except: 'ValueError'
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"rate {rate} burst {burst}, expected positive")
+        self.rate = rate
+        self.burst = burst
+
+    def spec(self) -> tuple:
+        return 'rate', float(self.rate), float(self.burst)
+
+
+class Changed(Filter):
+    """
+    payload differs from the last one passed (deduplication)
+    """
+
+    def spec(self) -> tuple:
+        return 'changed',
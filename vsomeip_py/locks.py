@@ -0,0 +1,131 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os, sys
+import tempfile
+from typing import List, Iterable
+
+is_windows = sys.platform.startswith('win')
+
+if not is_windows:
+    import fcntl
+
+NETWORK: str = 'vsomeip'  # default 'network' of configuration (prefix of vsomeip files)
+
+
+def base_path() -> str:
+    """
+    :return: directory vsomeip keeps lock files, 'VSOMEIP_BASE_PATH' environment if set, else its build default
+    """
+    return os.environ.get('VSOMEIP_BASE_PATH') or (tempfile.gettempdir() if is_windows else '/tmp')
+
+
+def lock_files(configuration: dict = None, directory: str = None, applications: Iterable[str] = None) -> List[str]:
+    """
+    known lock files of configuration, no directory listing
+    :param configuration: json style dictionary of vsomeip configuration file
+    :param directory: where lock files are kept, else vsomeip base path
+    :param applications: names of those included (routing ones only if any), else all
+    :return: paths
+    """
+    configuration = configuration or {}
+    network = configuration.get("network", NETWORK)
+    directory = directory or base_path()
+
+    names = [f"{network}.lck", f"{network}-.lck"]  # routing / configuration, per vsomeip version
+    if applications is not None:
+        applications = set(applications)
+        if not applications:
+            return []
+    for application in configuration.get("applications", []):
+        if applications is not None and application.get('name') not in applications:
+            continue
+        id = application.get('id')
+        if isinstance(id, str):
+            id = int(id, 0)
+        if id is not None:
+            names.append(f"{network}-{id:x}.lck")
+    return [os.path.join(directory, name) for name in dict.fromkeys(names)]
+
+
+def is_locked(path: str) -> bool:
+    """
+    non-blocking liveness check of lock file, not for those of this process (see 'purge')
+    :param path: lock file
+    :return: held by a running process (False if not found)
+    """
+    if is_windows:
+        return os.path.exists(path)  # only removal tells, see 'release'
+
+    try:
+        fd = os.open(path, os.O_RDWR)
+    except FileNotFoundError:
+        return False
+    except PermissionError:
+        return True  # someone else's, assume alive
+    try:
+        fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return False
+    except OSError:  # EACCES/EAGAIN, held
+        return True
+    finally:
+        os.close(fd)  # releases probe lock
+
+
+def release(path: str) -> bool:
+    """
+    remove lock file if stale, no retries (nor sleeps)
+    :param path: lock file
+    :return: removed
+    """
+    if is_windows:
+        try:
+            os.remove(path)  # fails while open by the owner
+            return True
+        except OSError:
+            return False
+
+    try:
+        fd = os.open(path, os.O_RDWR)
+    except OSError:
+        return False
+    try:
+        fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        os.remove(path)  # holding the lock, nobody takes it in between
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+def purge(configuration: dict = None, directory: str = None, hosted: Iterable[str] = ()) -> List[str]:
+    """
+    remove stale lock files of configuration
+    note: record locks are per process, held ones of this process look stale (and probing drops them),
+    hence those of applications hosted here (and routing, connected to by them) are skipped
+    :param configuration: json style dictionary of vsomeip configuration file
+    :param directory: where lock files are kept, else vsomeip base path
+    :param hosted: names of applications created by this process
+    :return: paths removed
+    """
+    kept = set(lock_files(configuration, directory, hosted))
+    return [path for path in lock_files(configuration, directory) if path not in kept and release(path)]
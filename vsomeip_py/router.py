@@ -0,0 +1,87 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import sys
+import json
+import signal
+import argparse
+import threading
+from typing import Final, List
+from vsomeip_py.vsomeip import vSOMEIP
+
+NAME: Final[str] = 'vsomeip_py_router'  # default routing application name
+
+
+def serve(configuration: dict = None, name: str = NAME, stopping: threading.Event = None, ready: threading.Event = None,
+          timeout: float = 10.0):
+    """
+    host the routing manager (only) until stopped, applications elsewhere use 'vSOMEIP.external_routing(name)'
+    :param configuration: json style dictionary of vsomeip configuration file, else template
+    :param name: routing application name
+    :param stopping: set to stop, else runs forever
+    :param ready: set once registered as routing manager
+    :param timeout: seconds waiting to register
+    :except: 'RuntimeError' (not registered within timeout)
+    """
+    vSOMEIP.external_routing(name)
+    router = vSOMEIP(name, 0x0000, 0x0000, configuration=configuration or {})
+    router.create()
+    if not router.start(timeout=timeout):
+        router.stop()
+        raise RuntimeError(f"routing manager '{name}' not registered within {timeout} seconds")
+
+    if ready:
+        ready.set()
+    try:
+        (stopping or threading.Event()).wait()
+    finally:
+        router.stop()
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    python -m vsomeip_py.router --config vsomeip.json --name vsomeip_py_router
+    """
+    parser = argparse.ArgumentParser(prog='python -m vsomeip_py.router', description='vsomeip routing manager host')
+    parser.add_argument('--config', help='vsomeip configuration file (json), else template')
+    parser.add_argument('--name', default=NAME, help='routing application name')
+    parser.add_argument('--timeout', type=float, default=10.0, help='seconds waiting to register, else exits non-zero')
+    arguments = parser.parse_args(argv)
+
+    configuration = None
+    if arguments.config:
+        with open(arguments.config, "r") as handle:
+            configuration = json.load(handle)
+
+    stopping = threading.Event()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signal_number, lambda *_: stopping.set())
+
+    try:
+        serve(configuration, arguments.name, stopping, timeout=arguments.timeout)
+    except RuntimeError as ex:
+        print(ex, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
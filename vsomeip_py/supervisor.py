@@ -0,0 +1,251 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import time
+import threading
+import multiprocessing
+from typing import Callable, List
+
+
+class Stopping:
+    """
+    'threading.Event' like stop signal for workers (pipe, setting never waits on workers exited,
+    unlike 'multiprocessing.Event')
+    """
+
+    def __init__(self, context: multiprocessing.context.BaseContext = None):
+        self._reader, self._writer = (context or multiprocessing.get_context()).Pipe(duplex=False)
+
+    def set(self):
+        try:
+            self._writer.send_bytes(b'\x00')
+        except OSError:
+            pass  # nobody listening anymore
+
+    def is_set(self) -> bool:
+        return self._reader.poll()
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        :param timeout: seconds, None forever
+        :return: set
+        """
+        return self._reader.poll(timeout)
+
+
+def _heartbeat(heartbeat, stopping, interval: float):
+    """ worker alive (and its GIL not starved) while beating """
+    while not stopping.wait(interval):
+        heartbeat.value = time.time()
+
+
+def _worker(target: Callable, configuration: dict, routing: str, stopping, heartbeat, interval: float):
+    """ worker process entry, applications of the shard are clients of the shared routing manager """
+    if routing:
+        from vsomeip_py.vsomeip import vSOMEIP
+        vSOMEIP.external_routing(routing)
+
+    heartbeat.value = time.time()
+    threading.Thread(target=_heartbeat, args=(heartbeat, stopping, interval), daemon=True).start()
+    target(configuration, stopping)
+
+
+def _router(configuration: dict, name: str, stopping, ready, timeout: float):
+    """ routing manager process entry, exits (non-zero) if not registered """
+    from vsomeip_py import router
+    router.serve(configuration, name, stopping, ready, timeout)
+
+
+class Supervisor:
+    """
+    Worker processes (one core each) owning a shard of applications, sharing one routing manager
+    process, restarted when exited or not heart beating, see 'start' and 'stop'
+    """
+
+    class Worker:
+        def __init__(self, index: int, configuration: dict):
+            self.index = index
+            self.configuration = configuration
+            self.process = None
+            self.stopping = None
+            self.heartbeat = None
+            self.restarts = 0
+
+    def __init__(self, target: Callable[[dict, object], None], shards: List[dict], routing: dict = None,
+                 name: str = 'vsomeip_py_router', use_router: bool = True, interval: float = 1.0, timeout: float = 10.0,
+                 restart: bool = True, context: multiprocessing.context.BaseContext = None):
+        """
+        create supervisor
+        :param target: worker 'target(configuration, stopping)' creating the applications of its shard, returning once 'stopping' set
+        :param shards: json style dictionaries of vsomeip configuration file, one per worker
+        :param routing: configuration of the routing manager, else shards combined
+        :param name: routing application name
+        :param use_router: start routing manager process, else routing as configured by the shards
+        :param interval: seconds between heartbeats (and health checks)
+        :param timeout: seconds without heartbeat worker is restarted
+        :param restart: restart exited or unhealthy workers
+        :param context: multiprocessing context, else default
+        """
+        self._target = target
+        self._name = name if use_router else None
+        self._routing = routing
+        self._interval = interval
+        self._timeout = timeout
+        self._restart = restart
+        self._context = context or multiprocessing.get_context()
+        self._workers = [Supervisor.Worker(index, configuration) for index, configuration in enumerate(shards)]
+        self._router = None
+        self._router_stopping = None
+        self._stopping = threading.Event()
+        self._monitor = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def _routing_configuration(self) -> dict:
+        """ shards combined, so routing knows all the routes """
+        if self._routing:
+            return self._routing
+        from vsomeip_py.configuration import ConfigurationBuilder
+        builder = ConfigurationBuilder(self._workers[0].configuration if self._workers else None)
+        for worker in self._workers[1:]:
+            shard = ConfigurationBuilder(worker.configuration).build()  # ids and ports parsed (ex: "0x1111")
+            for entry in shard["applications"]:
+                builder.application(**entry)
+            for entry in shard["services"]:
+                builder.service(**entry)
+            for entry in shard["clients"]:
+                builder.client(**entry)
+        return builder.build()
+
+    def _start_router(self, timeout: float) -> bool:
+        self._router_stopping = Stopping(self._context)
+        ready = self._context.Event()
+        self._router = self._context.Process(target=_router, daemon=True, name=self._name,
+                                             args=(self._routing_configuration(), self._name, self._router_stopping, ready, timeout))
+        self._router.start()
+        return ready.wait(timeout)
+
+    def _start_worker(self, worker: 'Supervisor.Worker'):
+        worker.stopping = Stopping(self._context)
+        worker.heartbeat = self._context.Value('d', time.time(), lock=False)
+        worker.process = self._context.Process(target=_worker, daemon=True, name=f"vsomeip_py_worker_{worker.index}",
+                                               args=(self._target, worker.configuration, self._name, worker.stopping,
+                                                     worker.heartbeat, self._interval))
+        worker.process.start()
+
+    @staticmethod
+    def _stop_process(process, stopping, timeout: float):
+        """ graceful, else terminated """
+        if process is None:
+            return
+        if stopping is not None:
+            stopping.set()
+        process.join(timeout)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+    def start(self, timeout: float = 10.0) -> bool:
+        """
+        start routing manager (if any), workers and their monitoring
+        :param timeout: seconds waiting for the routing manager
+        :return: routing manager ready (always True if none), else nothing started
+        """
+        is_ready = self._start_router(timeout) if self._name else True
+        if not is_ready:
+            self._stop_process(self._router, self._router_stopping, timeout)
+            self._router = None
+            return False
+        with self._lock:
+            for worker in self._workers:
+                self._start_worker(worker)
+        self._stopping.clear()
+        self._monitor = threading.Thread(target=self._monitoring, daemon=True)
+        self._monitor.start()
+        return is_ready
+
+    def _monitoring(self):
+        while not self._stopping.wait(self._interval):
+            self.check()
+
+    def check(self) -> List[int]:
+        """
+        health check, restarting workers exited or not heart beating (and routing manager exited)
+        :return: indexes of workers restarted
+        """
+        restarted = []
+        if not self._restart:
+            return restarted
+
+        with self._lock:
+            if self._stopping.is_set():
+                return restarted
+            if self._router is not None and not self._router.is_alive():
+                self._start_router(self._timeout)
+
+            now = time.time()
+            for worker in self._workers:
+                if worker.process is None:
+                    continue
+                if worker.process.is_alive() and now - worker.heartbeat.value < self._timeout:
+                    continue
+                Supervisor._stop_process(worker.process, worker.stopping, self._interval)
+                worker.restarts = worker.restarts + 1
+                self._start_worker(worker)
+                restarted.append(worker.index)
+        return restarted
+
+    def status(self) -> List[dict]:
+        """
+        :return: per worker: 'index', 'pid', 'alive', 'restarts' and 'heartbeat' (seconds since)
+        """
+        now = time.time()
+        with self._lock:
+            return [{'index': worker.index,
+                     'pid': worker.process.pid if worker.process else None,
+                     'alive': worker.process.is_alive() if worker.process else False,
+                     'restarts': worker.restarts,
+                     'heartbeat': now - worker.heartbeat.value if worker.heartbeat else None} for worker in self._workers]
+
+    def stop(self, timeout: float = 5.0):
+        """
+        graceful shutdown, workers first then routing manager, terminated if not done in time
+        :param timeout: seconds waiting for each process
+        """
+        self._stopping.set()
+        if self._monitor and self._monitor is not threading.current_thread():
+            self._monitor.join()
+        self._monitor = None
+
+        with self._lock:
+            for worker in self._workers:  # signal all, then wait
+                if worker.stopping is not None:
+                    worker.stopping.set()
+            for worker in self._workers:
+                Supervisor._stop_process(worker.process, worker.stopping, timeout)
+            Supervisor._stop_process(self._router, self._router_stopping, timeout)
+            self._router = None
@@ -20,9 +20,13 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import unittest
+import threading
 from typing import Tuple, List
 import tracemalloc
 from vsomeip_py.vsomeip import vSOMEIP
+from vsomeip_py.configuration import ConfigurationBuilder
+
+builder = ConfigurationBuilder(vSOMEIP.configuration())
 
 
 class SOMEIP_Test(vSOMEIP):
@@ -38,31 +42,27 @@ class SOMEIP_Test(vSOMEIP):
 
 
 def setup_client(index: int = 0) -> SOMEIP_Test:
-    configuration = vSOMEIP.configuration()
-
     client_name = "client_example" + f"_{index}"
     service_id = 0x1234 + index
     service_instance = 0x5678
     service_port = 30509 + index
 
-    configuration["applications"].append({'name': client_name, 'id': 0x2222 + index})
-    configuration["clients"].append({'service': service_id, 'instance': service_instance, 'unreliable': service_port})
+    builder.application(client_name, 0x2222 + index)
+    builder.client(service_id, service_instance, unreliable=service_port)
 
-    return SOMEIP_Test(client_name, service_id, service_instance, configuration=configuration)
+    return SOMEIP_Test(client_name, service_id, service_instance, configuration=builder.build())
 
 
 def setup_service(index: int = 0) -> SOMEIP_Test:
-    configuration = vSOMEIP.configuration()
-
     service_name = "service_example" + f"_{index}"
     service_id = 0x1234 + index
     service_instance = 0x5678
     service_port = 30509 + index
 
-    configuration["applications"].append({'name': service_name, 'id': 0x1111 + index})
-    configuration["services"].append({'service': service_id, 'instance': service_instance, 'unreliable': service_port})
+    builder.application(service_name, 0x1111 + index)
+    builder.service(service_id, service_instance, unreliable=service_port)
 
-    return SOMEIP_Test(service_name, service_id, service_instance, configuration=configuration)
+    return SOMEIP_Test(service_name, service_id, service_instance, configuration=builder.build())
 
 
 class BaseTestCase(unittest.TestCase):
@@ -102,3 +102,42 @@ class BaseTestCase(unittest.TestCase):
     def tearDownClass(cls):
         cls.service.stop()
         cls.client.stop()
+
+    @staticmethod
+    def allocate_service() -> Tuple[int, int]:
+        """
+        :return: (service, instance) unused by any other test, local only (no port)
+        """
+        entry = builder.service(None, 0x0001, unreliable=None)
+        return entry['service'], entry['instance']
+
+    def attach_service(self, events: List[int] = None) -> Tuple[SOMEIP_Test, SOMEIP_Test]:
+        """
+        service instance of its own (see 'allocate_service') offered by 'service' and requested by 'client'
+        :param events: offered, else none
+        :return: (service, client), available to the client
+        """
+        id, instance = self.allocate_service()
+        service = self.service.attach(id, instance)
+        service.offer(events=events)
+        client = self.client.attach(id, instance)
+        client.register()
+        self.assertTrue(client.wait_for_service(timeout=10))
+        return service, client
+
+    @staticmethod
+    def notify_until(service: vSOMEIP, event_id: int, data: bytearray, received: threading.Event, timeout: float = 10) -> bool:
+        """
+        notify until received, subscriptions are accepted asynchronously (earlier notifications not delivered)
+        :param service: offering the event
+        :param event_id: notified
+        :param data: notified
+        :param received: set by the subscriber
+        :param timeout: seconds
+        :return: received
+        """
+        for _ in range(int(timeout / 0.5)):
+            service.notify(event_id, data)
+            if received.wait(0.5):
+                return True
+        return False
@@ -0,0 +1,54 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import struct
+import unittest
+import importlib.util
+from vsomeip_py import capture
+from vsomeip_py.codec import *
+
+
+@unittest.skipUnless(importlib.util.find_spec('numpy'), "requires numpy")
+class CaptureTestCase(unittest.TestCase):
+    def test_dtype(self):
+        schema = Struct(('speed', FLOAT32), ('rpm', UINT16), ('gears', Array(UINT8, count=2)), ('axes', Array(SINT16, count=3)))
+        payload = Codec(schema).encode({'speed': 1.5, 'rpm': 3000, 'gears': b'\x01\x02', 'axes': [-1, 0, 1]})
+        dtype = capture.dtype(schema)
+
+        self.assertEqual(dtype.itemsize, Codec(schema).size)
+        import numpy
+        decoded = numpy.frombuffer(bytes(payload), dtype=dtype)[0]
+        self.assertEqual((decoded['speed'], decoded['rpm'], decoded['gears']), (1.5, 3000, b'\x01\x02'))
+        self.assertEqual(list(decoded['axes']), [-1, 0, 1])
+        self.assertRaises(ValueError, capture.dtype, Struct(('name', String())))
+
+    def test_record(self):
+        import numpy
+        records = numpy.zeros(1, dtype=numpy.dtype(capture.HEADER + [('payload', capture.dtype(Struct(('rpm', UINT16))))]))
+        struct.pack_into('=dHHI', records, 0, 1.25, 0x8778, 7, 2)  # as written natively
+        struct.pack_into('>H', records, 16, 3000)
+
+        self.assertEqual((records['timestamp'][0], records['event'][0], records['session'][0]), (1.25, 0x8778, 7))
+        self.assertEqual(records['payload']['rpm'][0], 3000)
+
+
+if __name__ == '__main__':
+    unittest.main()
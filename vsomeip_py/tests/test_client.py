@@ -20,8 +20,14 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import time
+import asyncio
+import threading
+import importlib.util
 from test_base import *
 from vsomeip_py.vsomeip import vSOMEIP
+from vsomeip_py.dispatch import Dispatcher
+from vsomeip_py.filters import Mask, Range
+from vsomeip_py.codec import UINT8
 
 
 class ClientTestCase(BaseTestCase):
@@ -31,9 +37,254 @@ class ClientTestCase(BaseTestCase):
     def test_register(self):
         self.client.register()
 
+    def test_wait_for_service(self):
+        self.assertTrue(self.client.wait_until_registered(10))
+        self.assertTrue(self.client.wait_for_service(timeout=10))
+        self.assertFalse(self.client.wait_for_service(0xFFFE, timeout=0.1))  # never offered
+
+    def test_attach(self):
+        service, client = self.attach_service()
+        service.on_message(self.method_id)
+
+        count = service.counter
+        data = asyncio.run(client.request_async(self.method_id, self.data, timeout=10))
+        self.assertEqual(data, self.data)
+        self.assertTrue(service.counter > count)
+
+        client.stop()
+        service.stop()  # withdrawn, applications keep running
+        self.assertTrue(self.client.wait_until_registered(1))
+        self.assertTrue(self.client.wait_for_service(timeout=10))
+
+    def test_create_duplicate(self):
+        id, instance = self.allocate_service()
+        duplicate = vSOMEIP(self.client._name, id, instance, configuration=builder.build())
+        with self.assertRaisesRegex(RuntimeError, "attach"):
+            duplicate.create()
+        self.assertTrue(self.client.wait_until_registered(1))  # created one unaffected
+
+    def test_dispatcher(self):
+        service, client = self.attach_service()
+        with Dispatcher(service, Dispatcher.THREAD) as dispatcher:
+            dispatcher.on_message(self.method_id, lambda type, service, instance, id, data, request_id: bytearray(data))
+            data = asyncio.run(client.request_async(self.method_id, self.data, timeout=10))  # responded off the dispatcher thread
+        self.assertEqual(data, self.data)
+
+    def test_message(self):
+        service, client = self.attach_service()
+        received = []
+
+        def _on_message(message: vSOMEIP.Message):
+            received.append((message.type, message.service, message.instance, message.id, bytes(message.data), message.timestamp))
+            return bytearray(message.data)
+
+        service.on_message(self.method_id, _on_message, message=True)
+        data = asyncio.run(client.request_async(self.method_id, self.data, timeout=10))
+
+        self.assertEqual(data, self.data)
+        type, service_id, instance, id, payload, timestamp = received[0]
+        self.assertEqual((type, service_id, instance, id, payload), (vSOMEIP.Message_Type.REQUEST, service._id, service._instance, self.method_id, bytes(self.data)))
+        self.assertLessEqual(timestamp, time.time())
+
+    @unittest.skipUnless(importlib.util.find_spec('numpy'), "requires numpy")
+    def test_capture(self):
+        event_id, marker_id = self.event_ids[0], self.event_ids[0] + 1  # marker delivered after the captured ones
+        service, client = self.attach_service(events=[event_id, marker_id])
+        marked = threading.Event()
+        client.on_event(marker_id, lambda *_: marked.set())
+
+        with client.capture([event_id], len(self.data), self.event_groups) as capture:
+            records = capture.swap()
+            for _ in range(20):  # until subscribed, no callback tells
+                marked.clear()
+                service.notify(event_id, self.data)
+                service.notify(marker_id, self.data)
+                if marked.wait(0.5):
+                    records = capture.swap()
+                    if len(records):
+                        break
+
+        self.assertEqual(records['event'][0], event_id)
+        self.assertEqual(records['length'][0], len(self.data))
+        self.assertEqual(bytes(records['payload'][0]), bytes(self.data))
+        self.assertLessEqual(records['timestamp'][-1], time.time())
+
+    def test_field(self):
+        service, client = self.attach_service(events=self.event_ids)
+        event_id = self.event_ids[0]
+        received = []
+        changed = threading.Event()
+
+        def _on_event(*args):
+            received.append(bytes(args[4]))
+            changed.set()
+
+        client.on_event(event_id, _on_event, changes=True)
+        self.assertTrue(self.notify_until(service, event_id, self.data, changed))
+        changed.clear()
+        for _ in range(3):
+            service.notify(event_id, self.data)  # unchanged, no callbacks
+        service.notify(event_id, bytearray(reversed(self.data)))  # after the unchanged ones
+        self.assertTrue(changed.wait(10))
+
+        self.assertEqual(bytes(client.get_field(event_id)), bytes(reversed(self.data)))
+        self.assertEqual(received, [bytes(self.data), bytes(reversed(self.data))])
+        self.assertIsNone(client.get_field(0x8FFF))  # not requested
+
+    def test_filters(self):
+        service, client = self.attach_service(events=self.event_ids)
+        event_id = self.event_ids[0]
+        received = []
+        passed = threading.Event()
+
+        def _on_event(*args):
+            received.append(bytes(args[4]))
+            passed.set()
+
+        client.on_event(event_id, _on_event, filters=[Mask(0, b'\x01', b'\x0F'), Range(1, UINT8, maximum=0x10)])
+        self.assertTrue(self.notify_until(service, event_id, bytearray([0x21, 0x05]), passed))
+        passed.clear()
+        service.notify(event_id, bytearray([0x11, 0x20]))  # mask passes, out of range
+        service.notify(event_id, bytearray([0x22, 0x05]))  # mask fails
+        service.notify(event_id, bytearray([0x31, 0x06]))
+        self.assertTrue(passed.wait(10))
+
+        self.assertEqual(received[-1], b'\x31\x06')
+        self.assertEqual(set(received), {b'\x21\x05', b'\x31\x06'})
+        self.assertGreaterEqual(client.stats()['messages'][(client._id, client._instance, event_id)]['filtered'], 2)
+
+    def test_filters_any(self):
+        id, instance = self.allocate_service()
+        service = self.service.attach(id, instance)
+        service.offer(events=self.event_ids)
+        builder.application("client_any")  # 'ANY' spans the application, not shared with the other tests
+        client = vSOMEIP("client_any", id, instance, configuration=builder.build())
+        client.create()
+        client.register()
+        self.assertTrue(client.start(timeout=10))
+        self.assertTrue(client.wait_for_service(timeout=10))
+        event_id = self.event_ids[0]
+        received = []
+        passed = threading.Event()
+
+        def _on_message(*args):
+            received.append(bytes(args[4]))
+            passed.set()
+
+        client.on_message(vSOMEIP.ANY, _on_message, filters=[Mask(0, b'\x01', b'\x0F')])
+        client.fields([event_id])
+        try:
+            self.assertTrue(self.notify_until(service, event_id, bytearray([0x11]), passed))
+            passed.clear()
+            service.notify(event_id, bytearray([0x02]))  # filtered, cached anyway
+            service.notify(event_id, bytearray([0x21]))
+            self.assertTrue(passed.wait(10))
+            stats = client.stats()
+        finally:
+            client.stop()
+            service.stop()
+
+        self.assertEqual(set(received), {b'\x11', b'\x21'})
+        self.assertGreater(stats['messages'][(id, instance, event_id)]['filtered'], 0)
+
+    def test_inbox(self):
+        id, instance = self.allocate_service()
+        builder.application("service_inbox")
+        service = vSOMEIP("service_inbox", id, instance, configuration=builder.build(), inbox_limit=1)
+        service.create()
+        service.offer()
+        release = threading.Event()
+        rejected = threading.Event()
+        service.on_message(self.method_id, lambda *_: release.wait(10) and None)  # delivery held up
+        self.assertTrue(service.start(timeout=10))
+
+        client = self.client.attach(id, instance)
+        client.register()
+        self.assertTrue(client.wait_for_service(timeout=10))
+        client.on_message(self.method_id, lambda type, *_: rejected.set() if type == vSOMEIP.Message_Type.ERROR.value else None)
+        try:
+            for _ in range(10):
+                client.request(self.method_id, data=self.data)
+            self.assertTrue(rejected.wait(10))  # error response received
+            status = service.inbox_status()
+        finally:
+            release.set()
+            service.stop()
+            client.stop()
+
+        self.assertEqual(status['limit'], 1)
+        self.assertLessEqual(status['depth'], 1)
+        self.assertGreater(status['rejected'], 0)  # error responses, not piling up
+
+    def test_queue(self):
+        id, instance = self.allocate_service()
+        builder.application("service_queue")
+        service = vSOMEIP("service_queue", id, instance, configuration=builder.build(), queue_size=4)
+        service.create()
+        service.offer()
+        service.on_message(self.method_id)  # selects what is queued, never invoked
+        self.assertTrue(service.start(timeout=10))
+
+        client = self.client.attach(id, instance)
+        client.register()
+        self.assertTrue(client.wait_for_service(timeout=10))
+        try:
+            for _ in range(10):
+                client.request(self.method_id, data=self.data)
+            started = time.time()
+            while service.queue_status()[1] == 0 and time.time() - started < 10:  # full, no wait API tells
+                time.sleep(0.1)
+            depth, dropped = service.queue_status()
+            self.assertEqual(depth, 4)
+            self.assertGreater(dropped, 0)  # queue full, not piling up
+
+            messages = service.poll(max_items=3)
+            self.assertEqual(len(messages), 3)  # batch limit
+            type, service_id, service_instance, message_id, data, _ = messages[0]
+            self.assertEqual((type, service_id, service_instance, message_id, bytes(data)), (vSOMEIP.Message_Type.REQUEST.value, id, instance, self.method_id, bytes(self.data)))
+            self.assertEqual(len(service.poll()), 1)  # rest
+            self.assertEqual(service.queue_status()[0], 0)
+            self.assertEqual(service.poll(timeout=0.1), [])
+
+            batches = []
+            received = threading.Event()
+
+            def _on_messages(messages):
+                batches.append(messages)
+                if sum(len(batch) for batch in batches) >= 4:
+                    received.set()
+
+            service.on_messages(_on_messages, max_items=2)
+            for _ in range(4):
+                client.request(self.method_id, data=self.data)
+            self.assertTrue(received.wait(10))
+            self.assertTrue(all(0 < len(batch) <= 2 for batch in batches))
+        finally:
+            service.stop()
+            client.stop()
+
+    def test_stats(self):
+        self.test_request_async()  # responded
+        key = (self.client._id, self.client._instance, self.method_id)
+
+        client = self.client.stats()
+        self.assertGreater(client['messages'][key]['out'], 0)
+        self.assertGreater(client['messages'][key]['in'], 0)
+        self.assertGreater(client['messages'][key]['in_bytes'], 0)
+
+        service = self.service.stats()
+        self.assertGreater(service['messages'][key]['callbacks'], 0)
+        self.assertGreater(service['callback_us']['count'], 0)
+        self.assertEqual(sum(service['gil_wait_us']['buckets'].values()), service['gil_wait_us']['count'])
+        self.assertEqual(set(service['errors']), {'send', 'notify', 'callback'})
+
     def test_request(self):
         self.client.request(self.method_id, data=self.data)
 
+    def test_request_buffer(self):
+        self.client.request(self.method_id, data=bytes(self.data))
+        self.client.request(self.method_id, data=memoryview(self.data))
+
     def test_response(self):
         self.assertEqual(self.client.callback(vSOMEIP.Message_Type.RESPONSE.value, self.client._id, self.client._instance, self.method_id, self.data, 0), None)
 
@@ -57,6 +308,32 @@ class ClientTestCase(BaseTestCase):
             check.append(True if tx in rx_ids else False)
         self.assertTrue(all(check))
 
+    def test_rtt(self):
+        self.test_request_async()  # available
+        request_id = self.client.request(self.method_id, self.data, timeout=10)
+        while self.client.rtt(request_id) is None:
+            time.sleep(0.1)
+        self.assertFalse(request_id in self.client.expire())
+
+    def test_expire(self):
+        request_id = self.client.request(0x9FFF, self.data, timeout=0.1)  # never responded
+        time.sleep(0.5)
+        self.assertTrue(request_id in self.client.expire())
+        self.assertIsNone(self.client.rtt(request_id))
+
+    def test_request_async(self):
+        self.assertTrue(self.client.wait_for_service(timeout=10))
+        data = asyncio.run(self.client.request_async(self.method_id, self.data, timeout=10))
+        self.assertEqual(data, self.data)
+
+    def test_request_async_many(self):
+        async def _requests(count: int):
+            return await asyncio.gather(*[self.client.request_async(self.method_id, bytearray([index]), timeout=10) for index in range(0, count)])
+
+        self.test_request_async()  # available
+        responses = asyncio.run(_requests(100))
+        self.assertEqual(responses, [bytearray([index]) for index in range(0, 100)])
+
     def test_on_event(self):
         for event_id in self.event_ids:
             #self.client.on_event(event_id)
@@ -73,6 +350,19 @@ class ClientTestCase(BaseTestCase):
                 break
         self.assertTrue(self.client.counter > count)
 
+    def test_subscribe_events(self):
+        self.client.subscribe_events(self.event_ids, self.event_groups)
+
+        count = self.client.counter + len(self.event_ids)
+        while True:
+            time.sleep(1)
+            for event_id in self.event_ids:
+                self.service.notify(event_id, self.data)
+                time.sleep(3)
+            if self.client.counter > count:
+                break
+        self.assertTrue(self.client.counter > count)
+
     def test_remove_event(self):
         self.test_on_event()
 
@@ -102,6 +392,8 @@ class ClientTestCase(BaseTestCase):
         for event_id in self.event_ids:
             with self.assertRaises(UserWarning):
                 self.client.notify(event_id, self.data)
+        with self.assertRaises(UserWarning):
+            self.client.notify_many([(event_id, self.data) for event_id in self.event_ids])
 
 
 if __name__ == '__main__':
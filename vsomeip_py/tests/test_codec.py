@@ -0,0 +1,107 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+from vsomeip_py.codec import *
+
+POINT = Struct(('x', FLOAT32), ('y', FLOAT32))
+STATUS = Struct(('id', UINT16), ('active', BOOL), ('position', POINT), ('history', Array(SINT16, count=3)), ('tag', Array(UINT8, count=2)))
+RECORD = Struct(('id', UINT32),
+                ('name', String()),
+                ('points', Array(POINT)),
+                ('samples', Array(UINT16, length=16)),
+                ('raw', Array(UINT8)),
+                ('names', Array(String(), count=2)),
+                ('value', Union(('number', UINT32), ('text', String()))))
+
+
+class CodecTestCase(unittest.TestCase):
+    def test_fixed(self):
+        codec = Codec(STATUS)
+        value = {'id': 0x1234, 'active': True, 'position': {'x': 1.5, 'y': -2.0}, 'history': [-1, 0, 1], 'tag': b'ab'}
+        data = codec.encode(value)
+
+        self.assertEqual(codec.size, 2 + 1 + 8 + 6 + 2)
+        self.assertEqual(data[:3], b'\x12\x34\x01')  # big endian
+        self.assertEqual(codec.decode(data), value)
+
+        frame = bytearray(2 * codec.size)
+        self.assertEqual(codec.encode_into(frame, codec.size, value), 2 * codec.size)
+        self.assertEqual(frame[codec.size:], data)
+
+    def test_dynamic(self):
+        codec = Codec(RECORD)
+        value = {'id': 7, 'name': 'sensor', 'points': [{'x': 1.0, 'y': 2.0}, {'x': 3.0, 'y': 4.0}], 'samples': [1, 2, 3],
+                 'raw': b'\x00\xff', 'names': ['a', 'bc'], 'value': ('text', 'on')}
+        data = codec.encode(value)
+
+        self.assertIsNone(codec.size)
+        self.assertEqual(data[4:8], b'\x00\x00\x00\x0a')  # length of BOM, text and terminator
+        self.assertEqual(data[8:18], b'\xef\xbb\xbfsensor\x00')
+        self.assertEqual(codec.decode(data), value)
+        self.assertEqual(codec.decode(memoryview(bytes(2) + data), 2), value)
+
+        value['value'] = None
+        self.assertEqual(codec.decode(codec.encode(value))['value'], None)
+        value['value'] = (1, 5)
+        self.assertEqual(codec.decode(codec.encode(value))['value'], ('number', 5))
+
+    def test_string(self):
+        codec = Codec(Struct(('fixed', String(size=8)), ('wide', String(encoding='utf-16be', length=8))))
+        data = codec.encode({'fixed': 'abc', 'wide': 'é'})
+
+        self.assertEqual(data, b'\xef\xbb\xbfabc\x00\x00' + b'\x06\xfe\xff\x00\xe9\x00\x00')
+        self.assertEqual(codec.decode(data), {'fixed': 'abc', 'wide': 'é'})
+        self.assertRaises(ValueError, codec.encode, {'fixed': 'too long', 'wide': ''})
+
+    def test_extensible(self):
+        old = Codec(Struct(('a', UINT8), length=16))
+        new = Codec(Struct(('a', UINT8), ('b', String()), length=16))
+        data = new.encode({'a': 1, 'b': 'added'}) + b'\x02'
+
+        self.assertEqual(old.decode_from(data), ({'a': 1}, len(data) - 1))  # newer member skipped
+
+    def test_union_unknown(self):
+        old = Codec(Union(('a', UINT8)))
+        new = Codec(Union(('a', UINT8), ('b', UINT16)))
+
+        self.assertEqual(old.decode(new.encode(('b', 0x0102))), (2, b'\x01\x02'))
+
+    def test_little_endian(self):
+        codec = Codec(Struct(('a', UINT16), ('b', Array(UINT16))), little_endian=True)
+        data = codec.encode({'a': 1, 'b': [2]})
+
+        self.assertEqual(data, b'\x01\x00' + b'\x02\x00\x00\x00' + b'\x02\x00')
+        self.assertEqual(codec.decode(data), {'a': 1, 'b': [2]})
+
+    def test_errors(self):
+        codec = Codec(RECORD)
+        self.assertRaises(ValueError, codec.encode, {'id': 1})  # missing members
+        self.assertRaises(ValueError, Codec(STATUS).encode, {'id': 1, 'active': True, 'position': {'x': 0, 'y': 0}, 'history': [1], 'tag': b'ab'})
+        self.assertRaises(ValueError, Codec(Array(UINT8, length=8)).encode, bytes(256))
+        self.assertRaises(ValueError, codec.decode, b'\x00\x00')
+        self.assertRaises(ValueError, Codec(String()).decode, b'\x00\x00\x00\xff\xef')  # length beyond data
+        self.assertRaises(ValueError, Struct, ('a', UINT8), ('a', UINT8))
+        self.assertRaises(ValueError, Array, UINT8, length=12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+import json
+import unittest
+from vsomeip_py.configuration import Configuration, ConfigurationBuilder
+
+
+class ConfigurationTestCase(unittest.TestCase):
+    configuration = {"unicast": "127.0.0.1", "applications": [{'name': "service_example", 'id': 0x1111}], "services": [], "clients": []}
+
+    def test_write(self):
+        files = Configuration()
+        path = files.write(self.configuration)
+        self.assertEqual(os.environ[Configuration.ENVIRONMENT], path)
+        with open(path) as handle:
+            self.assertEqual(json.load(handle), self.configuration)
+
+    def test_unchanged(self):
+        files = Configuration()
+        path = files.write(self.configuration)
+        modified = os.stat(path).st_mtime_ns
+        self.assertEqual(files.write(json.loads(json.dumps(self.configuration))), path)
+        self.assertEqual(os.stat(path).st_mtime_ns, modified)
+        self.assertEqual(len(os.listdir(files.directory)), 1)
+
+    def test_changed(self):
+        files = Configuration()
+        configuration = json.loads(json.dumps(self.configuration))
+        path = files.write(configuration)
+        configuration["clients"].append({'service': 0x1234, 'instance': 0x5678})
+        self.assertNotEqual(files.write(configuration), path)
+        self.assertEqual(os.environ[Configuration.ENVIRONMENT], files.path)
+
+
+class ConfigurationBuilderTestCase(unittest.TestCase):
+    configuration = {"unicast": "127.0.0.1", "applications": [], "services": [], "clients": [],
+                     "service-discovery": {"enable": "true", "port": "30490"}}
+
+    def test_build(self):
+        builder = ConfigurationBuilder(self.configuration)
+        builder.application("service_example", 0x1111)
+        builder.service(0x1234, 0x5678, unreliable=30509)
+        builder.client(0x1234, 0x5678)
+        configuration = builder.build()
+
+        self.assertEqual(configuration["unicast"], "127.0.0.1")
+        self.assertEqual(configuration["applications"], [{'name': "service_example", 'id': 0x1111}])
+        self.assertEqual(configuration["services"], [{'service': 0x1234, 'instance': 0x5678, 'unreliable': 30509}])
+        self.assertEqual(configuration["clients"], [{'service': 0x1234, 'instance': 0x5678, 'unreliable': 30509}])
+        self.assertEqual(ConfigurationBuilder(configuration).build(), configuration)
+
+    def test_dedupe(self):
+        builder = ConfigurationBuilder(self.configuration)
+        for _ in range(3):
+            builder.application("service_example", 0x1111)
+            builder.service(0x1234, 0x5678, unreliable=30509)
+            builder.client(0x1234, 0x5678, unreliable=30509)
+        configuration = builder.build()
+        self.assertEqual(len(configuration["applications"]), 1)
+        self.assertEqual(len(configuration["services"]), 1)
+        self.assertEqual(len(configuration["clients"]), 1)
+
+    def test_allocate(self):
+        builder = ConfigurationBuilder(self.configuration, application_id=0x1000, port=30490)
+        builder.application("fixed", 0x1001)
+        ids = [builder.application(f"app_{index}") for index in range(1000)]
+        self.assertNotIn(0x1001, ids)
+        self.assertEqual(len(set(ids)), len(ids))
+
+        ports = [builder.service(0x1000 + index, 0x0001, reliable=True) for index in range(1000)]
+        unreliable = [entry['unreliable'] for entry in ports]
+        self.assertNotIn(30490, unreliable)  # service discovery
+        self.assertEqual(len(set(unreliable)), len(unreliable))
+        self.assertEqual(len(set(entry['reliable']['port'] for entry in ports)), len(ports))
+
+    def test_allocate_service(self):
+        builder = ConfigurationBuilder(self.configuration, service_id=0x1300)
+        builder.service(0x1300, 0x0001)
+        builder.client(0x1301, 0x0001)
+        entries = [builder.service(None, 0x0001, unreliable=None) for _ in range(3)]
+        self.assertEqual([entry['service'] for entry in entries], [0x1302, 0x1303, 0x1304])
+        self.assertNotIn('unreliable', entries[0])
+
+    def test_conflicts(self):
+        builder = ConfigurationBuilder(self.configuration)
+        builder.application("service_example", 0x1111)
+        builder.service(0x1234, 0x5678, unreliable=30509)
+        builder.client(0x1234, 0x5678)
+        with self.assertRaises(ValueError):
+            builder.application("service_example", 0x2222)
+        with self.assertRaises(ValueError):
+            builder.application("client_example", 0x1111)
+        with self.assertRaises(ValueError):
+            builder.service(0x1234, 0x5678, unreliable=30510)
+        with self.assertRaises(ValueError):
+            builder.service(0x4321, 0x5678, unreliable=30509)
+        with self.assertRaises(ValueError):
+            builder.service(0x4321, 0x5678, unreliable=30490)
+        with self.assertRaises(ValueError):
+            builder.client(0x1234, 0x5678, unreliable=30510)
+
+    def test_merge_ports(self):
+        builder = ConfigurationBuilder(self.configuration)
+        builder.client(0x1234, 0x0001)
+        self.assertEqual(builder.client(0x1234, 0x0001, unreliable=30509)['unreliable'], 30509)
+        self.assertEqual(builder.client(0x1234, 0x0001)['unreliable'], 30509)
+        with self.assertRaises(ValueError):
+            builder.client(0x1234, 0x0001, unreliable=30510)
+
+        builder.service(0x4321, 0x0001, unreliable=None)
+        entry = builder.service(0x4321, 0x0001, unreliable=30511, reliable=30512)
+        self.assertEqual((entry['unreliable'], entry['reliable']), (30511, {'port': 30512}))
+        with self.assertRaises(ValueError):
+            builder.service(0x4322, 0x0001, unreliable=30511)  # reserved when merged
+        with self.assertRaises(ValueError):
+            builder.service(0x4321, 0x0001, unreliable=30513)
+        builder.service(0x4323, 0x0001, unreliable=None)
+        with self.assertRaises(ValueError):
+            builder.service(0x4323, 0x0001, unreliable=30514, reliable=30512)  # nothing merged
+        self.assertNotIn('unreliable', builder.service(0x4323, 0x0001, unreliable=None))
+        builder.service(0x4324, 0x0001, unreliable=30514)
+
+
+if __name__ == '__main__':
+    unittest.main()
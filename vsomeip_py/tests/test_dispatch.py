@@ -0,0 +1,141 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import time
+import random
+import threading
+import unittest
+import concurrent.futures
+from types import SimpleNamespace
+from vsomeip_py.dispatch import Dispatcher, REQUEST
+
+NOTIFICATION = 0x02
+
+
+class Responses:
+    """ records responses and registrations, as the application would send/register them """
+    def __init__(self):
+        self.responses = []
+        self.reliable = []  # request ids responded over tcp
+        self.callbacks = {}
+        self.lock = threading.Lock()
+
+    def respond(self, id, request_id, data, is_tcp=False, service=None, instance=None):
+        with self.lock:
+            self.responses.append((service, instance, id, request_id, bytes(data)))
+            if is_tcp:
+                self.reliable.append(request_id)
+
+    def on_message(self, id, callback, message=False):
+        self.callbacks[id] = callback
+
+
+class Deferred(concurrent.futures.Executor):
+    """ first call held until released, the others done at once (fast callbacks of a backlog) """
+    def __init__(self):
+        self.held = None
+
+    def submit(self, fn, *args):
+        future = concurrent.futures.Future()
+        if self.held is None:
+            self.held = (future, fn, args)
+        else:
+            future.set_result(fn(*args))
+        return future
+
+    def release(self):
+        future, fn, args = self.held
+        future.set_result(fn(*args))
+
+
+def _echo(type, service, instance, id, data, request_id):
+    return data
+
+
+def _slow_echo(type, service, instance, id, data, request_id):
+    time.sleep(random.random() / 100)
+    return data
+
+
+class DispatcherTestCase(unittest.TestCase):
+    def dispatch(self, mode: str, callback=_slow_echo, count: int = 50):
+        responses = Responses()
+        with Dispatcher(responses, mode, workers=4) as dispatcher:
+            dispatcher.on_message(0x9002, callback)
+            dispatch = responses.callbacks[0x9002]
+            for request_id in range(count):
+                for service in (0x1234, 0x1235):
+                    result = dispatch(REQUEST, service, 0x5678, 0x9002, bytearray([request_id]), request_id)
+                    if mode == Dispatcher.INLINE:
+                        responses.respond(0x9002, request_id, result, service=service, instance=0x5678)
+            dispatch(NOTIFICATION, 0x1234, 0x5678, 0x9002, bytearray([0xFF]), 0xFFFF)  # never responded
+        return responses.responses
+
+    def check(self, responses, count: int = 50):
+        self.assertEqual(len(responses), 2 * count)
+        for service in (0x1234, 0x1235):
+            ordered = [response for response in responses if response[0] == service]
+            self.assertEqual([response[3] for response in ordered], list(range(count)))
+            self.assertTrue(all(response[4] == bytes([response[3]]) for response in ordered))
+
+    def test_inline(self):
+        self.check(self.dispatch(Dispatcher.INLINE))
+
+    def test_thread(self):
+        self.check(self.dispatch(Dispatcher.THREAD))
+
+    def test_process(self):
+        self.check(self.dispatch(Dispatcher.PROCESS, _echo, 10), 10)
+
+    def test_returns_immediately(self):
+        responses = Responses()
+        with Dispatcher(responses, Dispatcher.THREAD) as dispatcher:
+            started = time.time()
+            dispatcher.wrap(lambda *_: time.sleep(0.5))(REQUEST, 0x1234, 0x5678, 0x9002, bytearray(), 1)
+            self.assertLess(time.time() - started, 0.25)
+
+    def test_backlog(self):
+        responses = Responses()
+        executor = Deferred()
+        with Dispatcher(responses, executor=executor) as dispatcher:
+            dispatch = dispatcher.wrap(_echo)
+            for request_id in range(5000):  # beyond the recursion limit
+                dispatch(REQUEST, 0x1234, 0x5678, 0x9002, bytearray([request_id % 256]), request_id)
+            executor.release()
+        self.assertEqual([response[3] for response in responses.responses], list(range(5000)))
+
+    def test_reliable(self):
+        responses = Responses()
+        with Dispatcher(responses, Dispatcher.THREAD) as dispatcher:
+            dispatcher.on_message(0x9002, _echo)
+            for request_id, is_reliable in ((1, True), (2, False)):  # as 'vSOMEIP.Message'
+                responses.callbacks[0x9002](SimpleNamespace(type=SimpleNamespace(value=REQUEST), service=0x1234, instance=0x5678, id=0x9002,
+                                                            data=bytearray([request_id]), request_id=request_id, is_reliable=is_reliable))
+        self.assertEqual(len(responses.responses), 2)
+        self.assertEqual(responses.reliable, [1])
+
+    def test_mode(self):
+        with self.assertRaises(ValueError):
+            Dispatcher(Responses(), 'fiber')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import math
+import unittest
+from vsomeip_py.filters import *
+from vsomeip_py.codec import UINT16, FLOAT32, Struct
+
+
+class FiltersTestCase(unittest.TestCase):
+    def test_mask(self):
+        self.assertEqual(Mask(2, b'\x12\x34').spec(), ('mask', 2, b'\xff\xff', b'\x12\x34'))
+        self.assertEqual(Mask(0, b'\xff', b'\x0f').spec(), ('mask', 0, b'\x0f', b'\x0f'))  # value masked
+        self.assertRaises(ValueError, Mask, 0, b'\x01', b'\x01\x02')
+        self.assertRaises(ValueError, Mask, -1, b'\x01')
+
+    def test_range(self):
+        self.assertEqual(Range(4, UINT16, minimum=10).spec(), ('range', 4, 'H', False, 10.0, math.inf))
+        self.assertEqual(Range(0, FLOAT32, maximum=1.5, little_endian=True).spec(), ('range', 0, 'f', True, -math.inf, 1.5))
+        self.assertRaises(ValueError, Range, 0, Struct(('a', UINT16)))
+
+    def test_sampling(self):
+        self.assertEqual(Decimate(10).spec(), ('decimate', 10))
+        self.assertEqual(RateLimit(5, burst=2).spec(), ('rate', 5.0, 2.0))
+        self.assertEqual(Changed().spec(), ('changed',))
+        self.assertRaises(ValueError, Decimate, 0)
+        self.assertRaises(ValueError, RateLimit, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
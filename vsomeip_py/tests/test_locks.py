@@ -0,0 +1,100 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os, sys
+import subprocess
+import tempfile
+import unittest
+from vsomeip_py import locks
+
+configuration = {"network": "vsomeip_test", "applications": [{'name': "service_example", 'id': 0x1111}]}
+
+
+class LocksTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_lock_files(self):
+        paths = locks.lock_files(configuration, self.directory.name)
+        self.assertIn(os.path.join(self.directory.name, "vsomeip_test.lck"), paths)
+        self.assertIn(os.path.join(self.directory.name, "vsomeip_test-1111.lck"), paths)
+        self.assertIn(os.path.join(self.directory.name, "vsomeip.lck"), locks.lock_files({}, self.directory.name))
+
+    def test_purge_stale(self):
+        path = os.path.join(self.directory.name, "vsomeip_test.lck")
+        open(path, "w").close()
+        self.assertEqual(locks.purge(configuration, self.directory.name), [path])
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(locks.purge(configuration, self.directory.name), [])
+
+    @unittest.skipIf(locks.is_windows, "posix record locks")
+    def test_purge_held(self):
+        path = os.path.join(self.directory.name, "vsomeip_test.lck")
+        holder = subprocess.Popen([sys.executable, "-c",
+                                   "import fcntl, os, sys\n"
+                                   f"fd = os.open({path!r}, os.O_RDWR | os.O_CREAT)\n"
+                                   "fcntl.lockf(fd, fcntl.LOCK_EX)\n"
+                                   "print('locked', flush=True)\n"
+                                   "sys.stdin.read()\n"],
+                                  stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        try:
+            self.assertEqual(holder.stdout.readline().strip(), 'locked')
+            self.assertTrue(locks.is_locked(path))
+            self.assertEqual(locks.purge(configuration, self.directory.name), [])
+            self.assertTrue(os.path.exists(path))
+        finally:
+            holder.stdin.close()
+            holder.wait()
+        self.assertFalse(locks.is_locked(path))
+        self.assertEqual(locks.purge(configuration, self.directory.name), [path])
+
+    @unittest.skipIf(locks.is_windows, "posix record locks")
+    def test_purge_hosted(self):
+        paths = [os.path.join(self.directory.name, name) for name in ("vsomeip_test.lck", "vsomeip_test-1111.lck")]
+        fds = [os.open(path, os.O_RDWR | os.O_CREAT) for path in paths]
+        try:
+            for fd in fds:
+                locks.fcntl.lockf(fd, locks.fcntl.LOCK_EX)  # held by this process, looks stale to it
+            self.assertEqual(locks.purge(configuration, self.directory.name, hosted=["service_example"]), [])
+            self.assertTrue(all(os.path.exists(path) for path in paths))
+        finally:
+            for fd in fds:
+                os.close(fd)
+        self.assertEqual(locks.lock_files(configuration, self.directory.name, []), [])
+
+    def test_base_path(self):
+        environ = os.environ.get('VSOMEIP_BASE_PATH')
+        os.environ['VSOMEIP_BASE_PATH'] = self.directory.name
+        try:
+            self.assertEqual(locks.base_path(), self.directory.name)
+            self.assertIn(os.path.join(self.directory.name, "vsomeip.lck"), locks.lock_files())
+        finally:
+            if environ is None:
+                del os.environ['VSOMEIP_BASE_PATH']
+            else:
+                os.environ['VSOMEIP_BASE_PATH'] = environ
+
+
+if __name__ == '__main__':
+    unittest.main()
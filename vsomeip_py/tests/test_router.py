@@ -0,0 +1,84 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os, sys
+import json
+import time
+import tempfile
+import subprocess
+from typing import Final
+from test_base import *
+from vsomeip_py.vsomeip import vSOMEIP
+from vsomeip_py import router
+
+TIMEOUT: Final[float] = 10
+
+
+class RouterTestCase(unittest.TestCase):
+    router = None
+
+    @classmethod
+    def setUpClass(cls):
+        vSOMEIP.external_routing(router.NAME)
+        cls.service = setup_service(300)
+        cls.client = setup_client(300)
+
+        cls.file = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+        json.dump(vSOMEIP.configuration(), cls.file)
+        cls.file.close()
+        cls.router = subprocess.Popen([sys.executable, "-m", "vsomeip_py.router", "--config", cls.file.name])
+
+        cls.service.create()
+        cls.client.create()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.stop()
+        cls.service.stop()
+        cls.router.terminate()
+        cls.router.wait(TIMEOUT)
+        os.remove(cls.file.name)
+        vSOMEIP.external_routing(None)
+
+    def test_request(self):
+        self.service.offer()
+        self.service.on_message(BaseTestCase.method_id)
+        self.assertTrue(self.service.start(timeout=TIMEOUT))
+
+        self.assertTrue(self.client.start(timeout=TIMEOUT))
+        self.client.register()
+        self.assertTrue(self.client.wait_for_service(timeout=TIMEOUT))
+
+        count = self.service.counter
+        self.client.request(BaseTestCase.method_id, data=BaseTestCase.data)
+        started = time.time()
+        while self.service.counter == count and time.time() - started < TIMEOUT:
+            time.sleep(0.1)
+        self.assertTrue(self.service.counter > count)
+
+    def test_stop_service(self):
+        self.service.stop()  # routing hosted by router, stays up
+        self.assertIsNone(self.router.poll())
+        self.assertEqual(vSOMEIP.configuration().get('routing'), router.NAME)
+
+
+if __name__ == '__main__':
+    unittest.main()
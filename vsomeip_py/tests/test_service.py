@@ -70,6 +70,9 @@ class ServiceTestCase(BaseTestCase):
         for group_id in self.event_groups:
             self.service.offer(self.event_ids, group=group_id)
 
+    def test_offer_events(self):
+        self.service.offer_events(self.event_ids, self.event_groups)
+
     def test_notify(self):
         event_id = self.event_ids[0]
 
@@ -81,6 +84,22 @@ class ServiceTestCase(BaseTestCase):
             if self.client.counter > count:
                 break
 
+    def test_notify_many(self):
+        event_id = self.event_ids[0]
+
+        count = self.client.counter
+        self.client.on_event(event_id)
+        while True:
+            self.service.notify_many([(event_id, self.data), (event_id, bytes(self.data))])
+            time.sleep(3)
+            if self.client.counter > count:
+                break
+
+    def test_notify_frame(self):
+        self.service.notify_frame(self.event_ids * 2, self.data * 2, [0, len(self.data)])
+        with self.assertRaises(ValueError):
+            self.service.notify_frame(self.event_ids * 2, self.data, [len(self.data), 0])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -63,6 +63,19 @@ def _start_stop_process(index=0):
 
 class ClientTestCase(unittest.TestCase):
 
+    def test_restart(self):
+        for index in range(1, 20):
+            service = setup_service(200)
+            service.create()
+            service.offer()
+            self.assertTrue(service.start())
+
+            started = time.time()
+            service.stop()  # joined, name free again
+            self.assertLess(time.time() - started, TIMEOUT)
+
+        self.assertEqual(vSOMEIP.terminate(), 0)  # nothing left running
+
     def test_stop(self):
         for index in range(1, 20):
             print()
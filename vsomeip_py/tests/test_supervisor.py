@@ -0,0 +1,102 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to COVESA
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+import time
+import tempfile
+import unittest
+from vsomeip_py.supervisor import Supervisor
+
+TIMEOUT: float = 10
+
+
+def _shard_worker(configuration: dict, stopping):
+    """ dummy, records its shard and runs until stopped """
+    with open(os.path.join(configuration['directory'], f"{configuration['applications'][0]['name']}.{os.getpid()}"), "w"):
+        pass
+    stopping.wait()
+
+
+def _crashing_worker(configuration: dict, stopping):
+    """ dummy, crashes first time """
+    marker = os.path.join(configuration['directory'], "crashed")
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    stopping.wait()
+
+
+def _wait(predicate) -> bool:
+    started = time.time()
+    while not predicate():
+        if time.time() - started > TIMEOUT:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+class SupervisorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def shards(self, count: int):
+        return [{'directory': self.directory.name, 'applications': [{'name': f"app_{index}", 'id': 0x1000 + index}],
+                 'services': [], 'clients': []} for index in range(count)]
+
+    def test_shards(self):
+        with Supervisor(_shard_worker, self.shards(3), use_router=False, interval=0.1) as supervisor:
+            self.assertTrue(_wait(lambda: len(os.listdir(self.directory.name)) == 3))
+            status = supervisor.status()
+            self.assertEqual([worker['index'] for worker in status], [0, 1, 2])
+            self.assertTrue(all(worker['alive'] for worker in status))
+            self.assertEqual(len(set(worker['pid'] for worker in status)), 3)
+        self.assertEqual(sorted(name.split('.')[0] for name in os.listdir(self.directory.name)), ["app_0", "app_1", "app_2"])
+
+    def test_routing_configuration(self):
+        shards = self.shards(2)
+        shards[1]['applications'] = [{'name': "app_1", 'id': "0x1111"}]  # as loaded from a configuration file
+        shards[1]['services'] = [{'service': "0x1234", 'instance': "0x0001", 'unreliable': "30509"}]
+        shards[1]['clients'] = [{'service': "0x4321", 'instance': "0x0001"}]
+        configuration = Supervisor(_shard_worker, shards)._routing_configuration()
+        self.assertEqual(configuration['applications'], [{'name': "app_0", 'id': 0x1000}, {'name': "app_1", 'id': 0x1111}])
+        self.assertEqual(configuration['services'], [{'service': 0x1234, 'instance': 0x0001, 'unreliable': 30509}])
+        self.assertEqual(configuration['clients'], [{'service': 0x4321, 'instance': 0x0001}])
+
+    def test_restart(self):
+        with Supervisor(_crashing_worker, self.shards(1), use_router=False, interval=0.1) as supervisor:
+            self.assertTrue(_wait(lambda: supervisor.status()[0]['restarts'] >= 1 and supervisor.status()[0]['alive']))
+
+    def test_stop(self):
+        supervisor = Supervisor(_shard_worker, self.shards(2), use_router=False, interval=0.1)
+        supervisor.start()
+        self.assertTrue(_wait(lambda: len(os.listdir(self.directory.name)) == 2))
+        processes = [worker.process for worker in supervisor._workers]
+        started = time.time()
+        supervisor.stop()
+        self.assertLess(time.time() - started, TIMEOUT)
+        self.assertEqual([process.exitcode for process in processes], [0, 0])  # graceful, not terminated
+
+
+if __name__ == '__main__':
+    unittest.main()
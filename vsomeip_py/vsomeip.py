@@ -20,16 +20,18 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import os, sys
+import copy
 import json
 import threading
-import time
 import importlib
-import tempfile
 from enum import Enum
 from typing import Callable, List, Tuple, Final
-import re
 import socket
 import atexit
+import asyncio
+from vsomeip_py.configuration import Configuration
+from vsomeip_py import locks
+from vsomeip_py.filters import Filter
 
 is_windows = sys.platform.startswith('win')
 
@@ -47,33 +49,30 @@ class vSOMEIP:
         REQUEST = 0x00
         NOTIFICATION = 0x02
         RESPONSE = 0x80
+        ERROR = 0x81
         UNKNOWN = 0xFF
 
+    module.message_types(Message_Type)
+    Message = module.Message  # callbacks registered with 'message=True', fields read on access (type, service, instance, id, data, request_id, ...)
+
     _configuration = {}  # global shared so routing service knows all the routes
+    _configuration_files = Configuration()  # written when applications created, only if changed
     _lock = threading.Lock()
     _routing = None
+    _hosted = set()  # names of applications created by this process, their lock files kept by '_purge'
+    _is_external_routing = False  # routing hosted by another process, see 'vsomeip_py.router'
 
     @staticmethod
-    def _purge(pattern):
-        # todo: smarter faster stronger better
-        dir = os.path.join(tempfile.gettempdir())
-        retry = 3
-        flag = False
-        for f in os.listdir(dir):
-            if re.search(pattern, f):
-                while True:
-                    retry = retry - 1
-                    try:
-                        os.remove(os.path.join(dir, f))
-                        flag = True
-                    except Exception as ex:
-                        time.sleep(1)
-                        pass  # eat-it, Todo: not eat
-                    if retry < 0:
-                        break
-        return flag
-
-    def __init__(self, name: str, id: int, instance: int, version: Tuple[int, int] = (0x00, 0x00), configuration: dict = {}, force=False):
+    def _purge(configuration: dict) -> bool:
+        """
+        remove stale lock files of configuration (held ones and those of this process kept)
+        :param configuration: json style dictionary of vsomeip configuration file
+        :return: any removed
+        """
+        return bool(locks.purge(configuration, hosted=vSOMEIP._hosted))
+
+    def __init__(self, name: str, id: int, instance: int, version: Tuple[int, int] = (0x00, 0x00), configuration: dict = {}, force=False,
+                 zero_copy: bool = False, queue_size: int = 0, inbox_limit: int = 0):
         """
         create instance
         :param name: application name
@@ -82,12 +81,28 @@ class vSOMEIP:
         :param version:
         :param configuration: json style dictionary of vsomeip configuration file.
         :param force: remove any OS locks
+        :param zero_copy: callbacks receive read-only 'memoryview' over the received payload, else 'bytearray' copy
+        :param queue_size: if any, received messages are queued (see 'poll' and 'on_messages') instead of any callbacks,
+         responses included (no 'request_async' completed)
+        :param inbox_limit: if any, callbacks invoked by a delivery thread from a queue bounded to it, once full:
+         notifications keep the latest per event, requests rejected (error response), critical methods block,
+         responses/errors to own requests always queued, others dropped (see 'critical' and 'inbox_status')
         """
         self._name = name
         self._id = id
         self._instance = instance
         self._is_service = None
         self._version = version
+        self._zero_copy = zero_copy
+        self._queue_size = queue_size
+        self._inbox_limit = inbox_limit
+        self._poller = None
+        self._handle = None  # opaque application handle, from 'create'
+        self._parent = None  # application hosting this service instance, see 'attach'
+
+        self._pending = {}  # request_id -> (loop, future), outstanding 'request_async' calls
+        self._pending_lock = threading.Lock()
+        self._pending_methods = set()  # methods with response correlation registered
 
         with vSOMEIP._lock:  # protect while accessing external features
             if configuration:
@@ -97,32 +112,47 @@ class vSOMEIP:
 
             if force or is_windows:
                 # https://github.com/COVESA/vsomeip/issues/289, https://github.com/COVESA/vsomeip/issues/615
-                self._purge("vsomeip*.lck")
+                self._purge(vSOMEIP._configuration)
 
-            if vSOMEIP._configuration["services"]:  # if no services configured no router is needed!
+            # if no services configured no router is needed!
+            if vSOMEIP._configuration["services"] or vSOMEIP._is_external_routing:
                 if not vSOMEIP._routing:
                     vSOMEIP._routing = self._name
                 vSOMEIP._configuration['routing'] = vSOMEIP._routing
 
-            # note: default configuration file if none given!!!
-            with open('vsomeip.json', "w", newline='\n') as file_handle:
-                json.dump(vSOMEIP._configuration, file_handle, sort_keys=True, indent=2)
-                file_handle.flush()
-
-        atexit.register(vSOMEIP.terminate)  # executed at interpreter termination
+    @staticmethod
+    def external_routing(name: str = None):
+        """
+        applications constructed afterwards are clients of a routing manager hosted elsewhere,
+        i.e. 'python -m vsomeip_py.router', none of them hosts routing (nor takes it down on 'stop')
+        :param name: routing application name, None hosted here again (first with services)
+        """
+        with vSOMEIP._lock:
+            vSOMEIP._routing = name
+            vSOMEIP._is_external_routing = name is not None
+            if vSOMEIP._configuration:
+                if name is not None:
+                    vSOMEIP._configuration['routing'] = name
+                else:
+                    vSOMEIP._configuration.pop('routing', None)
 
     @staticmethod
-    def terminate():
-        """ reload underlying c-api module(s) """
-        # todo:  not there should be proper way to close service hosting routing daemon
-        del vSOMEIP.module
-        vSOMEIP.module = importlib.import_module('vsomeip_ext')
-        time.sleep(0)  # yield
+    def terminate() -> int:
+        """
+        stop all applications (of this process), their names can be created again
+        :return: number of applications stopped
+        """
+        count = vSOMEIP.module.stop_all()
+        with vSOMEIP._lock:
+            if not vSOMEIP._is_external_routing:
+                vSOMEIP._routing = None
+        return count
 
     def __del__(self):
         """ cleanup """
         try:
-            self.stop()
+            if getattr(self, '_parent', None) is None:  # attached ones leave the application to its owner
+                self.stop()
         except OSError:
             pass  # eat-it, catch exception if not found
 
@@ -155,30 +185,108 @@ class vSOMEIP:
     def create(self):
         """
         create application
+        :except: 'RuntimeError' (name already created, more service instances of it see 'attach')
         """
-        vSOMEIP.module.create(self._name, self._id, self._instance)
+        if self._parent:
+            return  # created by its owner
+        with vSOMEIP._lock:  # configuration as of now, loaded by the application
+            vSOMEIP._configuration_files.write(vSOMEIP._configuration)
+        try:
+            self._handle = vSOMEIP.module.create(self._name, self._id, self._instance, self._zero_copy, self._queue_size, self._inbox_limit)
+        except RuntimeError as ex:
+            raise RuntimeError(f"application '{self._name}' already created, for service {hex(self._id)}.{hex(self._instance)} "
+                               f"use its 'attach({hex(self._id)}, {hex(self._instance)})'") from ex
+        with vSOMEIP._lock:
+            vSOMEIP._hosted.add(self._name)
 
-    def start(self):
+    def start(self, wait: bool = True, timeout: float = 5.0) -> bool:
         """
         start application
+        :param wait: until registered with routing
+        :param timeout: seconds waiting, None forever
+        :return: registered (always True if not waiting)
         """
-        vSOMEIP.module.start(self._name, self._id, self._instance)
+        if not self._parent:  # else started by its owner
+            vSOMEIP.module.start(self._name, self._id, self._instance)
+        return self.wait_until_registered(timeout) if wait else True
+
+    def wait_until_registered(self, timeout: float = None) -> bool:
+        """
+        wait (without holding the GIL) until application registered with routing
+        :param timeout: seconds, None forever
+        :return: registered
+        """
+        return vSOMEIP.module.wait_registered(self._name, self._id, self._instance, -1 if timeout is None else int(timeout * 1000))
+
+    def wait_for_service(self, service: int = None, instance: int = None, timeout: float = None) -> bool:
+        """
+        wait (without holding the GIL) until service available, requested with 'register'
+        :param service: service id, else this one ('ANY' for any)
+        :param instance: service instance, else this one ('ANY' for any)
+        :param timeout: seconds, None forever
+        :return: available
+        """
+        service = self._id if service is None else service
+        instance = self._instance if instance is None else instance
+        return vSOMEIP.module.wait_available(self._name, self._id, self._instance, service, instance,
+                                             -1 if timeout is None else int(timeout * 1000))
 
     def stop(self):
         """
-        stop application
+        stop application, returns once its thread finished (name can be created again),
+        if attached only withdraws its service instance
         """
+        if getattr(self, '_poller', None):
+            poller, self._poller = self._poller, None
+            if poller is not threading.current_thread():
+                poller.join()
+
+        if getattr(self, '_parent', None):
+            try:
+                vSOMEIP.module.withdraw(self._handle, self._id, self._instance)
+            except RuntimeError:
+                pass  # application stopped already
+            return
+
         try:
             vSOMEIP.module.stop(self._name, self._id, self._instance)
-        except SystemError:  # todo: why eating...
-            pass
+        except RuntimeError:
+            pass  # not created or already stopped
+        created, self._handle = self._handle is not None, None
 
         with vSOMEIP._lock:
             if hasattr(self, '_name'):
-                if vSOMEIP._routing == self._name:  # if we are the router remove
+                if created:
+                    vSOMEIP._hosted.discard(self._name)
+                # if we are the router remove, routing hosted elsewhere stays
+                if vSOMEIP._routing == self._name and not vSOMEIP._is_external_routing:
                     vSOMEIP._routing = None
                     vSOMEIP._configuration = self._configuration_template()  # clear!
 
+    def attach(self, id: int, instance: int, version: Tuple[int, int] = (0x00, 0x00)) -> 'vSOMEIP':
+        """
+        another service instance offered/requested by this (created) application, sharing its routing
+        connection and thread instead of an application each, with its own handlers (message ids)
+        note: 'on_message(ANY)' receives messages of all service instances of the application
+        :param id: service id
+        :param instance: service instance
+        :param version:
+        :return: instance for the service instance, 'stop' withdraws only it
+        :except: 'UserWarning'
+        """
+        if not self._handle:
+            raise UserWarning("create application first")
+
+        attached = copy.copy(self)  # same application (name, handle), requests tracked together
+        attached._id = id
+        attached._instance = instance
+        attached._version = version
+        attached._is_service = None
+        attached._poller = None
+        attached._pending_methods = set()
+        attached._parent = self._parent or self
+        return attached
+
     def register(self):
         """
         register to service offering
@@ -188,23 +296,112 @@ class vSOMEIP:
             raise UserWarning("client registers, service offer")
         vSOMEIP.module.request_service(self._name, self._id, self._instance, self._version[0], self._version[1])
 
-    def request(self, id: int, data: bytearray = None, is_tcp: bool = False) -> int:
+    def request(self, id: int, data: bytearray = None, is_tcp: bool = False, timeout: float = None) -> int:
         """
         request message
         :param id: message id
-        :param data: message data
+        :param data: message data, any buffer (bytes, bytearray, memoryview, array, numpy...)
         :param is_tcp: else udp  # todo: determine from configuration (e.g. "reliable")
+        :param timeout: seconds to track the call for round trip time (see 'rtt' and 'expire'), else not tracked
         :except: 'UserWarning'
-        :return: request_id
+        :return: request_id (client << 16 | session)
         """
         if self._is_service:
             raise UserWarning("client requests, service responds")
 
         if data is None:
             data = bytearray([0x00])  # NULL
-        request_id = vSOMEIP.module.send_service(self._name, self._id, self._instance, id, -1 if is_tcp else 0, data)
+        timeout_ms = max(1, int(timeout * 1000)) if timeout else 0
+        request_id = vSOMEIP.module.send(self._handle, self._id, self._instance, id, -1 if is_tcp else 0, data, timeout_ms)
         return request_id
 
+    def respond(self, id: int, request_id: int, data: bytearray = None, is_tcp: bool = False, service: int = None, instance: int = None):
+        """
+        respond to a request after its callback returned (i.e. handled elsewhere, see 'vsomeip_py.dispatch')
+        :param id: message id of the request
+        :param request_id: of the request, as received by the callback
+        :param data: response data, any buffer
+        :param is_tcp: reliable
+        :param service: service id of the request, else this one
+        :param instance: service instance of the request, else this one
+        """
+        service = self._id if service is None else service
+        instance = self._instance if instance is None else instance
+        vSOMEIP.module.respond(self._handle, service, instance, id, request_id, bytearray() if data is None else data, is_tcp)
+
+    def rtt(self, request_id: int) -> float:
+        """
+        round trip time of a tracked request, consumed once read
+        :param request_id: as returned by 'request'
+        :return: seconds, None if not responded (yet) or not tracked
+        """
+        rtt = vSOMEIP.module.call_rtt(self._name, self._id, self._instance, request_id)
+        return rtt / 1e6 if rtt >= 0 else None
+
+    def expire(self) -> List[int]:
+        """
+        remove tracked requests past their timeout
+        :return: request_ids never responded
+        """
+        return vSOMEIP.module.expire_calls(self._name, self._id, self._instance)
+
+    async def request_async(self, id: int, data: bytearray = None, timeout: float = None, is_tcp: bool = False) -> bytearray:
+        """
+        request message and await the matching response, not for applications created with 'queue_size' (see 'poll')
+        :param id: message id
+        :param data: message data
+        :param timeout: seconds to wait for the response, else forever
+        :param is_tcp: else udp
+        :except: 'UserWarning', 'asyncio.TimeoutError', 'RuntimeError' (error response)
+        :return: response data
+        """
+        if self._is_service:
+            raise UserWarning("client requests, service responds")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        with self._pending_lock:  # hold until tracked, response may arrive before 'request' returns
+            if id not in self._pending_methods:
+                self.on_message(id, self._on_response)
+                self._pending_methods.add(id)
+            request_id = self.request(id, data, is_tcp, timeout)
+            self._pending[request_id] = (loop, future)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            if timeout:
+                self.rtt(request_id)  # release tracked call
+
+    def _on_response(self, type: int, service: int, instance: int, id: int, data: bytearray, request_id: int) -> bytearray:
+        """
+        resolve the pending 'request_async' matching the response (vsomeip dispatcher thread)
+        """
+        if type not in (vSOMEIP.Message_Type.RESPONSE.value, vSOMEIP.Message_Type.ERROR.value):
+            return None
+
+        with self._pending_lock:
+            pending = self._pending.pop(request_id, None)
+        if pending:
+            loop, future = pending
+            loop.call_soon_threadsafe(vSOMEIP._resolve, future, type, id, data)
+        return None
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, type: int, id: int, data: bytearray):
+        """
+        complete future (event loop thread)
+        """
+        if future.done():  # timed out or cancelled meanwhile
+            return
+        if type == vSOMEIP.Message_Type.ERROR.value:
+            future.set_exception(RuntimeError(f"error response for message: {hex(id)}"))
+        else:
+            future.set_result(data)
+
     def callback(self, type: int, service: int, instance: int, id: int, data: bytearray, request_id: int) -> bytearray:
         """
         :param type: enum Message_Type
@@ -212,7 +409,7 @@ class vSOMEIP:
         :param instance: service instance id
         :param id: message id
         :param data: message data
-        :param request_id:  client + session
+        :param request_id:  client << 16 | session
         :return: message data
         :except: '
         """
@@ -223,28 +420,142 @@ class vSOMEIP:
             return data  # this is the response
         return None
 
-    def on_message(self, id: int, callback: Callable[[int, int, int, int, bytearray, int], bytearray] = None):
+    def on_message(self, id: int, callback: Callable[[int, int, int, int, bytearray, int], bytearray] = None, message: bool = False,
+                   filters: List[Filter] = None):
         """
         register for message
         :param id:  id
         :param callback: function for on message
+        :param message: callback takes one 'vSOMEIP.Message' instead of (type, service, instance, id, data, request_id)
+        :param filters: of the id (all its callbacks), evaluated natively before the GIL, see 'vsomeip_py.filters' (empty removes),
+         of 'ANY' those of all messages without filters of their own (one state shared, ex: decimation across ids)
         """
         if callback is None:
             callback = self.callback
-        vSOMEIP.module.register_message(self._name, self._id, self._instance, id, callback)
+        if filters is not None:  # before registering, nothing unfiltered delivered
+            vSOMEIP.module.filters(self._handle, self._id, self._instance, [id], [each.spec() for each in filters])
+        vSOMEIP.module.register_message(self._name, self._id, self._instance, id, callback, message)
+
+    def poll(self, max_items: int = 0, timeout: float = 0) -> List[Tuple[int, int, int, int, bytearray, int]]:
+        """
+        drain queued messages (created with 'queue_size'), responses too as no callbacks are invoked
+        :param max_items: most messages returned, else all queued
+        :param timeout: seconds to wait if none queued
+        :return: list of callback arguments (type, service, instance, id, data, request_id)
+        """
+        return vSOMEIP.module.poll_handle(self._handle, max_items, int(timeout * 1000))
+
+    def on_messages(self, callback: Callable[[List[Tuple[int, int, int, int, bytearray, int]]], None], max_items: int = 1024):
+        """
+        deliver queued messages in batches (created with 'queue_size'), on_message/on_event still select what is received
+        :param callback: function for list of messages, as from 'poll'
+        :param max_items: most messages per batch
+        """
+        def _poller():
+            while self._poller is threading.current_thread():
+                messages = self.poll(max_items, 0.1)
+                if messages:
+                    callback(messages)
+
+        self._poller = threading.Thread(target=_poller, name=f"{self._name}_poller", daemon=True)
+        self._poller.start()
 
-    def on_event(self, id: int, callback: Callable[[int, int, int, int, bytearray, int], bytearray] = None, group: int = ANY):
+    def queue_status(self) -> Tuple[int, int]:
+        """
+        :return: queued messages, messages dropped as queue was full
+        """
+        return vSOMEIP.module.queue_status(self._name, self._id, self._instance)
+
+    def critical(self, methods: List[int]):
+        """
+        methods (of this service instance) waited for instead of rejected/dropped once inbox full (created with 'inbox_limit')
+        :param methods: message ids
+        """
+        vSOMEIP.module.inbox_critical(self._handle, self._id, self._instance, methods)
+
+    def inbox_status(self) -> dict:
+        """
+        :return: 'depth', 'limit' and counts of notifications 'coalesced', requests 'rejected', messages 'dropped'
+         and 'blocked' (critical) since created
         """
-        register for event
+        return vSOMEIP.module.inbox_status(self._handle)
+
+    def stats(self) -> dict:
+        """
+        runtime metrics of the application (all its service instances) since created, kept natively
+        :return: 'messages' per (service, instance, id): 'in', 'in_bytes', 'out', 'out_bytes', 'callbacks', 'filtered';
+         histograms 'callback_us' and 'gil_wait_us': 'buckets' ({upper bound us: count}), 'count', 'total_us', 'max_us';
+         'errors': 'send', 'notify', 'callback'; 'availability_flaps' (services lost)
+        """
+        return vSOMEIP.module.stats(self._handle)
+
+    def capture(self, events: List[int], payload, groups: List[int] = None, capacity: int = 65536):
+        """
+        record events into NumPy structured arrays instead of callbacks (requires numpy)
+        :param events: event ids (ex: 0x8???)
+        :param payload: numpy dtype of payloads, fixed size schema (see 'vsomeip_py.codec') or bytes per payload
+        :param groups: groups of all the events, else default
+        :param capacity: records per buffer
+        :return: capture started, see 'vsomeip_py.capture.Capture'
+        """
+        from vsomeip_py.capture import Capture  # numpy only if capturing
+        capture = Capture(self, events, payload, groups, capacity)
+        capture.start()
+        return capture
+
+    def on_event(self, id: int, callback: Callable[[int, int, int, int, bytearray, int], bytearray] = None, group: int = ANY,
+                 message: bool = False, changes: bool = False, filters: List[Filter] = None):
+        """
+        register for event, its value cached (see 'get_field')
         :param id: event id (ex: 0x8???)
         :param callback: function for on event
         :param group: define group, else default
+        :param message: callback takes one 'vSOMEIP.Message', see 'on_message'
+        :param changes: callbacks of the event only invoked when its payload changed
+        :param filters: of the event, see 'on_message'
         """
         if callback is None:
             callback = self.callback
 
-        vSOMEIP.module.request_event_service(self._name, self._id, self._instance, id, group, self._version[0], self._version[1])
-        self.on_message(id, callback)
+        self.on_message(id, callback, message, filters)  # registered before subscribing, initial value not missed
+        vSOMEIP.module.request_fields(self._handle, self._id, self._instance, [id], [group], self._version[0], changes)
+
+    def subscribe_events(self, events: List[int], groups: List[int] = None, callback: Callable[[int, int, int, int, bytearray, int], bytearray] = None,
+                         message: bool = False, changes: bool = False, filters: List[Filter] = None):
+        """
+        register for many events at once, each eventgroup subscribed once, their values cached (see 'get_field')
+        :param events: event ids (ex: 0x8???)
+        :param groups: groups of all the events, else default
+        :param callback: function for on event
+        :param message: callback takes one 'vSOMEIP.Message', see 'on_message'
+        :param changes: callbacks of an event only invoked when its payload changed
+        :param filters: of each event (state, ex: decimation, per event), see 'on_message'
+        """
+        if callback is None:
+            callback = self.callback
+        if filters is not None:
+            vSOMEIP.module.filters(self._handle, self._id, self._instance, events, [each.spec() for each in filters])
+
+        vSOMEIP.module.request_events(self._handle, self._id, self._instance, events, groups if groups else [vSOMEIP.ANY], self._version[0], callback,
+                                      message, changes)
+
+    def fields(self, events: List[int], groups: List[int] = None):
+        """
+        subscribe events, values only cached (no callbacks), see 'get_field'
+        :param events: event ids (ex: 0x8???)
+        :param groups: groups of all the events, else default
+        """
+        vSOMEIP.module.request_fields(self._handle, self._id, self._instance, events, groups if groups else [vSOMEIP.ANY], self._version[0])
+
+    def get_field(self, id: int, service: int = None, instance: int = None) -> bytearray:
+        """
+        latest value of field, without waiting for a callback
+        :param id: event id (ex: 0x8???)
+        :param service: service id, else this one
+        :param instance: service instance, else this one
+        :return: payload (read-only 'memoryview' if zero copy), None if not yet notified or not requested
+        """
+        return vSOMEIP.module.get_field(self._handle, self._id if service is None else service, self._instance if instance is None else instance, id)
 
     def remove(self, id, group: int = ANY):
         """
@@ -263,16 +574,25 @@ class vSOMEIP:
         self._is_service = True  # if offering something, then must be a service
 
         if events:
-            for event in events:
-                vSOMEIP.module.offer_event_service(self._name, self._id, self._instance, event, group)
+            self.offer_events(events, [group])
         else:
             vSOMEIP.module.offer_service(self._name, self._id, self._instance, self._version[0], self._version[1])
 
+    def offer_events(self, events: List[int], groups: List[int] = None):
+        """
+        offer many events at once
+        :param events: event ids (ex: 0x8???)
+        :param groups: groups of all the events, else default
+        """
+        self._is_service = True  # if offering something, then must be a service
+
+        vSOMEIP.module.offer_events(self._handle, self._id, self._instance, events, groups if groups else [vSOMEIP.ANY])
+
     def notify(self, id: int, data: bytearray = None):
         """
         service event firing
         :param id:
-        :param data:
+        :param data: any buffer (bytes, bytearray, memoryview, array, numpy...)
         :except: 'UserWarning'
         """
         if not self._is_service:
@@ -280,4 +600,31 @@ class vSOMEIP:
 
         if data is None:
             data = bytearray([0x00])  # NULL, have to send something
-        vSOMEIP.module.notify_clients(self._name, self._id, self._instance, id, data)
+        vSOMEIP.module.notify(self._handle, self._id, self._instance, id, data)
+
+    def notify_many(self, events: List[Tuple[int, bytearray]]):
+        """
+        service events firing, all in one call
+        :param events: (id, data) per event
+        :except: 'UserWarning'
+        """
+        if not self._is_service:
+            raise UserWarning("client consumes event")
+
+        vSOMEIP.module.notify_many(self._handle, self._id, self._instance, events)
+
+    def notify_frame(self, events: List[int], data: bytearray, offsets: List[int]):
+        """
+        service events firing from one contiguous buffer (e.g. signal frame), all in one call
+        :param events: ids
+        :param data: any buffer, event data from its offset up to the next (last to the end)
+        :param offsets: ascending start of each event's data
+        :except: 'UserWarning', 'ValueError'
+        """
+        if not self._is_service:
+            raise UserWarning("client consumes event")
+
+        vSOMEIP.module.notify_frame(self._handle, self._id, self._instance, events, data, offsets)
+
+
+atexit.register(vSOMEIP.terminate)  # executed at interpreter termination
@@ -32,6 +32,7 @@ SPDX-License-Identifier: Apache-2.0
   #include <vsomeip\constants.hpp>
 #endif
 #include <cstdlib>
+#include <cstring>
 #include <chrono>
 #include <thread>
 #include <iomanip>
@@ -40,7 +41,13 @@ SPDX-License-Identifier: Apache-2.0
 #include <sstream>
 #include <thread>
 #include <mutex>
+#include <atomic>
+#include <condition_variable>
 #include <list>
+#include <deque>
+#include <algorithm>
+#include <set>
+#include <unordered_map>
 #include <iostream>
 #include <exception>
 #include <typeinfo>
@@ -49,6 +56,7 @@ using namespace std;
 
 typedef uint16_t client_t;
 typedef uint16_t session_t;
+typedef uint32_t request_t;
 #define PY_INVALID_ARGUMENTS    "invalid arguments!"
 
 static std::mutex _mutex;
@@ -76,27 +84,57 @@ static void print_message(const std::shared_ptr<vsomeip::message> &message_) {
            <<message_->get_session()<< "]: "<<ss.str()<<std::endl;
 }
 
-static PyObject *payload_pack(std::shared_ptr<vsomeip::payload> pl) {
-  return PyByteArray_FromStringAndSize((const char *)pl->get_data(), pl->get_length());
+// windows payload shares a static buffer (see 'payload_unpack'), elsewhere payloads are per call
+#ifdef __unix__
+  #define PAYLOAD_LOCK()
+#else
+  #define PAYLOAD_LOCK() std::unique_lock<std::mutex> its_payload_lock(_payload_mutex, std::defer_lock); \
+                         Py_BEGIN_ALLOW_THREADS its_payload_lock.lock(); Py_END_ALLOW_THREADS  // never wait holding the GIL
+#endif
+
+/* read-only buffer exporter owning the received payload, backs zero copy 'memoryview' */
+typedef struct {
+  PyObject_HEAD
+  std::shared_ptr<vsomeip::payload> *payload;
+} vsomeip_PayloadObject;
+
+static int payload_getbuffer(PyObject *self, Py_buffer *view, int flags) {
+  std::shared_ptr<vsomeip::payload> &pl = *((vsomeip_PayloadObject *)self)->payload;
+  return PyBuffer_FillInfo(view, self, (void *)pl->get_data(), pl->get_length(), 1, flags);
 }
 
-static std::shared_ptr<vsomeip::payload> payload_unpack(PyObject *pObj) {
-  const char *raw_data = PyByteArray_AsString(pObj);
-  Py_ssize_t raw_size = PyByteArray_Size(pObj);
+static void payload_dealloc(PyObject *self) {
+  delete ((vsomeip_PayloadObject *)self)->payload;
+  Py_TYPE(self)->tp_free(self);
+}
+
+static PyBufferProcs vsomeip_PayloadBuffer = {payload_getbuffer, NULL};
+
+static PyTypeObject vsomeip_PayloadType = {PyVarObject_HEAD_INIT(NULL, 0) "vsomeip_ext.Payload"};  // remaining set on module init
+
+static PyObject *payload_pack(std::shared_ptr<vsomeip::payload> pl, bool zero_copy = false) {
+  if (!zero_copy)
+    return PyByteArray_FromStringAndSize((const char *)pl->get_data(), pl->get_length());
+
+  vsomeip_PayloadObject *exporter = PyObject_New(vsomeip_PayloadObject, &vsomeip_PayloadType);
+  if (exporter == NULL)
+    return NULL;
+  exporter->payload = new std::shared_ptr<vsomeip::payload>(pl);  // adopted, alive while any view is
+
+  PyObject *view = PyMemoryView_FromObject((PyObject *)exporter);
+  Py_DECREF(exporter);
+  return view;
+}
+
+static std::shared_ptr<vsomeip::payload> payload_create(const vsomeip::byte_t *raw_data, Py_ssize_t raw_size) {
   std::shared_ptr<vsomeip::payload> payload = vsomeip::runtime::get()->create_payload();
 
 // windows was corrupting memory as was being release (think) before having been consumed, locks in-place to protect
 #ifdef __unix__
-  std::vector<vsomeip::byte_t> payload_data(raw_size);
-  for (int i = 0; i < raw_size; i++)   // copy
-      payload_data[i] = (vsomeip::byte_t)raw_data[i];
-
-  payload = vsomeip::runtime::get()->create_payload();
-  payload->set_data(payload_data);
+  payload->set_data(raw_data, (vsomeip::length_t)raw_size);  // single copy
 #else
-  _data_size = raw_size;
-  for (Py_ssize_t i = 0; i < _data_size; i++) // copy
-      _data[i] = (vsomeip::byte_t)raw_data[i];
+  _data_size = raw_size < (Py_ssize_t)sizeof(_data) ? raw_size : (Py_ssize_t)sizeof(_data);
+  memcpy(_data, raw_data, _data_size);
 
   payload->set_data(_data, (vsomeip_v3::length_t)_data_size);
 #endif
@@ -104,6 +142,768 @@ static std::shared_ptr<vsomeip::payload> payload_unpack(PyObject *pObj) {
   return payload;
 }
 
+/* any buffer protocol object (bytes, bytearray, memoryview, array, numpy...), NULL with 'TypeError' if not */
+static std::shared_ptr<vsomeip::payload> payload_unpack(PyObject *pObj) {
+  Py_buffer view;
+  std::vector<vsomeip::byte_t> contiguous;
+  const vsomeip::byte_t *raw_data;
+  Py_ssize_t raw_size;
+
+  if (PyObject_GetBuffer(pObj, &view, PyBUF_C_CONTIGUOUS) == 0) {
+    raw_data = (const vsomeip::byte_t *)view.buf;
+    raw_size = view.len;
+  } else if (PyErr_Clear(), PyObject_GetBuffer(pObj, &view, PyBUF_FULL_RO) == 0) {  // strided, gather once
+    contiguous.resize(view.len);
+    PyBuffer_ToContiguous(contiguous.data(), &view, view.len, 'C');
+    raw_data = contiguous.data();
+    raw_size = view.len;
+  } else {
+    PyErr_SetString(PyExc_TypeError, "payload must support the buffer protocol!");
+    return nullptr;
+  }
+
+  std::shared_ptr<vsomeip::payload> payload = payload_create(raw_data, raw_size);
+
+  PyBuffer_Release(&view);
+  return payload;
+}
+
+/* collision free, 'client' upper and 'session' lower 16 bits */
+static inline request_t request_id(client_t client_, session_t session_) {
+  return (static_cast<request_t>(client_) << 16) | static_cast<request_t>(session_);
+}
+
+/* outstanding requests, send timestamp and round trip time once responded */
+struct vsomeip_Calls {
+  struct call {
+    std::chrono::steady_clock::time_point sent;
+    std::chrono::steady_clock::time_point deadline;
+    long long rtt;  // microseconds, -1 while pending
+  };
+
+  std::mutex mutex;
+  std::unordered_map<request_t, call> calls;
+
+  void track(request_t request_id_, int timeout_ms_) {
+    auto now = std::chrono::steady_clock::now();
+    std::lock_guard<std::mutex> its_lock(mutex);
+    calls[request_id_] = {now, now + std::chrono::milliseconds(timeout_ms_), -1};
+  }
+
+  void respond(request_t request_id_) {
+    auto now = std::chrono::steady_clock::now();
+    std::lock_guard<std::mutex> its_lock(mutex);
+    auto it = calls.find(request_id_);
+    if (it != calls.end() && it->second.rtt < 0)
+      it->second.rtt = std::chrono::duration_cast<std::chrono::microseconds>(now - it->second.sent).count();
+  }
+
+  long long rtt(request_t request_id_) {  // consumes the call once responded
+    std::lock_guard<std::mutex> its_lock(mutex);
+    auto it = calls.find(request_id_);
+    if (it == calls.end() || it->second.rtt < 0)
+      return -1;
+    long long result = it->second.rtt;
+    calls.erase(it);
+    return result;
+  }
+
+  std::list<request_t> expire() {  // drops calls past deadline, returns those never responded
+    auto now = std::chrono::steady_clock::now();
+    std::list<request_t> expired;
+    std::lock_guard<std::mutex> its_lock(mutex);
+    for (auto it = calls.begin(); it != calls.end();) {
+      if (it->second.deadline <= now) {
+        if (it->second.rtt < 0)
+          expired.push_back(it->first);
+        it = calls.erase(it);
+      } else {
+        ++it;
+      }
+    }
+    return expired;
+  }
+};
+
+/* bounded lock-free (multi producer/consumer, sequence per cell) queue, filled without the GIL and drained in bulk */
+struct vsomeip_Queue {
+  struct cell {
+    std::atomic<size_t> sequence;
+    std::shared_ptr<vsomeip::message> message;
+  };
+
+  std::unique_ptr<cell[]> buffer;
+  size_t mask;
+  std::atomic<size_t> head;  // next to push
+  std::atomic<size_t> tail;  // next to pop
+  std::atomic<unsigned long long> dropped;
+
+  std::atomic<int> waiters;
+  std::mutex mutex;
+  std::condition_variable ready;
+
+  explicit vsomeip_Queue(size_t capacity_) : head(0), tail(0), dropped(0), waiters(0) {
+    size_t size = 2;
+    while (size < capacity_)  // power of two
+      size <<= 1;
+    buffer.reset(new cell[size]);
+    mask = size - 1;
+    for (size_t i = 0; i < size; i++)
+      buffer[i].sequence.store(i, std::memory_order_relaxed);
+  }
+
+  bool push(const std::shared_ptr<vsomeip::message> &message_) {
+    cell *its_cell;
+    size_t pos = head.load(std::memory_order_relaxed);
+    for (;;) {
+      its_cell = &buffer[pos & mask];
+      size_t sequence = its_cell->sequence.load(std::memory_order_acquire);
+      intptr_t diff = (intptr_t)sequence - (intptr_t)pos;
+      if (diff == 0) {
+        if (head.compare_exchange_weak(pos, pos + 1, std::memory_order_relaxed))
+          break;
+      } else if (diff < 0) {  // full
+        dropped.fetch_add(1, std::memory_order_relaxed);
+        return false;
+      } else {
+        pos = head.load(std::memory_order_relaxed);
+      }
+    }
+    its_cell->message = message_;
+    its_cell->sequence.store(pos + 1, std::memory_order_release);
+
+    std::atomic_thread_fence(std::memory_order_seq_cst);
+    if (waiters.load() > 0) {
+      std::lock_guard<std::mutex> its_lock(mutex);
+      ready.notify_one();
+    }
+    return true;
+  }
+
+  bool pop(std::shared_ptr<vsomeip::message> &message_) {
+    cell *its_cell;
+    size_t pos = tail.load(std::memory_order_relaxed);
+    for (;;) {
+      its_cell = &buffer[pos & mask];
+      size_t sequence = its_cell->sequence.load(std::memory_order_acquire);
+      intptr_t diff = (intptr_t)sequence - (intptr_t)(pos + 1);
+      if (diff == 0) {
+        if (tail.compare_exchange_weak(pos, pos + 1, std::memory_order_relaxed))
+          break;
+      } else if (diff < 0) {  // empty
+        return false;
+      } else {
+        pos = tail.load(std::memory_order_relaxed);
+      }
+    }
+    message_ = std::move(its_cell->message);
+    its_cell->sequence.store(pos + mask + 1, std::memory_order_release);
+    return true;
+  }
+
+  size_t depth() const {
+    size_t pushed = head.load(), popped = tail.load();
+    return pushed > popped ? pushed - popped : 0;
+  }
+
+  void wait(int timeout_ms_) {  // caller must not hold the GIL
+    std::unique_lock<std::mutex> its_lock(mutex);
+    waiters++;
+    ready.wait_for(its_lock, std::chrono::milliseconds(timeout_ms_), [this] { return depth() > 0; });
+    waiters--;
+  }
+};
+
+/* registration and service availability, waited on (without the GIL) instead of fixed sleeps */
+struct vsomeip_Readiness {
+  std::mutex mutex;
+  std::condition_variable changed;
+  bool registered = false;
+  std::set<std::pair<vsomeip::service_t, vsomeip::instance_t>> available;
+
+  void on_state(bool registered_) {
+    std::lock_guard<std::mutex> its_lock(mutex);
+    registered = registered_;
+    changed.notify_all();
+  }
+
+  bool on_availability(vsomeip::service_t service_id_, vsomeip::instance_t instance_id_, bool is_available_) {  // true if lost
+    std::lock_guard<std::mutex> its_lock(mutex);
+    bool is_lost = false;
+    if (is_available_)
+      available.insert(std::make_pair(service_id_, instance_id_));
+    else
+      is_lost = available.erase(std::make_pair(service_id_, instance_id_)) > 0;
+    changed.notify_all();
+    return is_lost;
+  }
+
+  template<typename Predicate>
+  bool wait(int timeout_ms_, Predicate predicate_) {  // forever if negative
+    std::unique_lock<std::mutex> its_lock(mutex);
+    if (timeout_ms_ < 0) {
+      changed.wait(its_lock, predicate_);
+      return true;
+    }
+    return changed.wait_for(its_lock, std::chrono::milliseconds(timeout_ms_), predicate_);
+  }
+
+  bool wait_registered(int timeout_ms_) {
+    return wait(timeout_ms_, [this] { return registered; });
+  }
+
+  bool wait_available(vsomeip::service_t service_id_, vsomeip::instance_t instance_id_, int timeout_ms_) {
+    return wait(timeout_ms_, [this, service_id_, instance_id_] {
+      for (auto &its_available : available)  // 'ANY' matches any
+        if ((service_id_ == vsomeip::ANY_SERVICE || its_available.first == service_id_) &&
+            (instance_id_ == vsomeip::ANY_INSTANCE || its_available.second == instance_id_))
+          return true;
+      return false;
+    });
+  }
+};
+
+/* callback arguments: (type, service, instance, id, data, request_id) */
+static PyObject *message_pack(const std::shared_ptr<vsomeip::message> &message_, bool zero_copy_) {
+  PyObject *bytes_object = payload_pack(message_->get_payload(), zero_copy_);
+  if (bytes_object == NULL)
+    return NULL;
+  int type = static_cast<std::underlying_type<vsomeip::message_type_e>::type>(message_->get_message_type());
+  PyObject *arguments = Py_BuildValue("iiiiOI", type, message_->get_service(), message_->get_instance(), message_->get_method(),
+                                      bytes_object, (unsigned int)request_id(message_->get_client(), message_->get_session()));
+  Py_DECREF(bytes_object);
+  return arguments;
+}
+
+/* 'vSOMEIP.Message_Type', values of 'Message.type' (int if not set or not a member) */
+static PyObject *_message_types = NULL;
+
+/* received message for callbacks taking one argument, fields materialized on access (reused once unreferenced) */
+typedef struct {
+  PyObject_HEAD
+  std::shared_ptr<vsomeip::message> *message;
+  bool zero_copy;
+  double timestamp;  // received, seconds since epoch
+  PyObject *data;  // cached
+  PyObject *type;  // cached
+} vsomeip_MessageObject;
+
+static PyTypeObject vsomeip_MessageType = {PyVarObject_HEAD_INIT(NULL, 0) "vsomeip_ext.Message"};  // remaining set on module init
+
+static void message_dealloc(PyObject *self) {
+  vsomeip_MessageObject *its_message = (vsomeip_MessageObject *)self;
+  delete its_message->message;
+  Py_XDECREF(its_message->data);
+  Py_XDECREF(its_message->type);
+  Py_TYPE(self)->tp_free(self);
+}
+
+/* new, or 'reused_' (set again) if nothing else references it, steals the reference to 'reused_' */
+static PyObject *message_object(PyObject *reused_, const std::shared_ptr<vsomeip::message> &message_, bool zero_copy_, double timestamp_) {
+  vsomeip_MessageObject *its_message;
+  if (reused_ != NULL && Py_REFCNT(reused_) == 1) {
+    its_message = (vsomeip_MessageObject *)reused_;
+    *its_message->message = message_;
+    Py_CLEAR(its_message->data);
+    Py_CLEAR(its_message->type);
+  } else {
+    Py_XDECREF(reused_);  // still referenced by a callback, left to it
+    its_message = PyObject_New(vsomeip_MessageObject, &vsomeip_MessageType);
+    if (its_message == NULL)
+      return NULL;
+    its_message->message = new std::shared_ptr<vsomeip::message>(message_);
+    its_message->data = NULL;
+    its_message->type = NULL;
+  }
+  its_message->zero_copy = zero_copy_;
+  its_message->timestamp = timestamp_;
+  return (PyObject *)its_message;
+}
+
+#define MESSAGE(self) (*((vsomeip_MessageObject *)(self))->message)
+
+static PyObject *message_get_type(PyObject *self, void *closure) {
+  vsomeip_MessageObject *its_message = (vsomeip_MessageObject *)self;
+  if (its_message->type == NULL) {
+    int type = static_cast<std::underlying_type<vsomeip::message_type_e>::type>(MESSAGE(self)->get_message_type());
+    if (_message_types != NULL) {
+      its_message->type = PyObject_CallFunction(_message_types, "i", type);
+      if (its_message->type == NULL)
+        PyErr_Clear();  // not a member, plain value
+    }
+    if (its_message->type == NULL)
+      its_message->type = PyLong_FromLong(type);
+  }
+  Py_XINCREF(its_message->type);
+  return its_message->type;
+}
+
+static PyObject *message_get_data(PyObject *self, void *closure) {
+  vsomeip_MessageObject *its_message = (vsomeip_MessageObject *)self;
+  if (its_message->data == NULL)
+    its_message->data = payload_pack(MESSAGE(self)->get_payload(), its_message->zero_copy);
+  Py_XINCREF(its_message->data);
+  return its_message->data;
+}
+
+static PyObject *message_get_service(PyObject *self, void *closure) { return PyLong_FromLong(MESSAGE(self)->get_service()); }
+static PyObject *message_get_instance(PyObject *self, void *closure) { return PyLong_FromLong(MESSAGE(self)->get_instance()); }
+static PyObject *message_get_id(PyObject *self, void *closure) { return PyLong_FromLong(MESSAGE(self)->get_method()); }
+static PyObject *message_get_client(PyObject *self, void *closure) { return PyLong_FromLong(MESSAGE(self)->get_client()); }
+static PyObject *message_get_session(PyObject *self, void *closure) { return PyLong_FromLong(MESSAGE(self)->get_session()); }
+static PyObject *message_get_request_id(PyObject *self, void *closure) {
+  return PyLong_FromUnsignedLong(request_id(MESSAGE(self)->get_client(), MESSAGE(self)->get_session()));
+}
+static PyObject *message_get_return_code(PyObject *self, void *closure) {
+  return PyLong_FromLong(static_cast<std::underlying_type<vsomeip::return_code_e>::type>(MESSAGE(self)->get_return_code()));
+}
+static PyObject *message_get_interface_version(PyObject *self, void *closure) { return PyLong_FromLong(MESSAGE(self)->get_interface_version()); }
+static PyObject *message_get_is_reliable(PyObject *self, void *closure) { return PyBool_FromLong(MESSAGE(self)->is_reliable()); }
+static PyObject *message_get_timestamp(PyObject *self, void *closure) { return PyFloat_FromDouble(((vsomeip_MessageObject *)self)->timestamp); }
+
+static PyGetSetDef vsomeip_MessageGetSet[] = {
+    {"type", message_get_type, NULL, "enum 'vSOMEIP.Message_Type'", NULL},
+    {"service", message_get_service, NULL, "service id", NULL},
+    {"instance", message_get_instance, NULL, "service instance", NULL},
+    {"id", message_get_id, NULL, "message (method/event) id", NULL},
+    {"data", message_get_data, NULL, "payload, 'bytearray' (or read-only 'memoryview' if zero copy)", NULL},
+    {"client", message_get_client, NULL, "client id", NULL},
+    {"session", message_get_session, NULL, "session id", NULL},
+    {"request_id", message_get_request_id, NULL, "client << 16 | session", NULL},
+    {"return_code", message_get_return_code, NULL, "return code", NULL},
+    {"interface_version", message_get_interface_version, NULL, "interface version", NULL},
+    {"is_reliable", message_get_is_reliable, NULL, "received over tcp", NULL},
+    {"timestamp", message_get_timestamp, NULL, "received, seconds since epoch", NULL},
+    {NULL}  /* Sentinel */
+};
+
+static inline double now_timestamp() {
+  return std::chrono::duration<double>(std::chrono::system_clock::now().time_since_epoch()).count();
+}
+
+static inline PyObject *call_one(PyObject *callable_, PyObject *argument_) {
+#if PY_VERSION_HEX >= 0x03090000
+  return PyObject_Vectorcall(callable_, &argument_, 1, NULL);
+#else
+  return _PyObject_Vectorcall(callable_, &argument_, 1, NULL);
+#endif
+}
+
+/* (service, instance, method) of a registered callback list */
+typedef uint64_t dispatch_t;
+
+static inline dispatch_t dispatch_key(int service_id_, int instance_id_, int method_id_) {
+  return (static_cast<dispatch_t>(service_id_ & 0xFFFF) << 32) | (static_cast<dispatch_t>(instance_id_ & 0xFFFF) << 16) |
+         static_cast<dispatch_t>(method_id_ & 0xFFFF);
+}
+
+static const dispatch_t ANY_DISPATCH = dispatch_key(vsomeip::ANY_SERVICE, vsomeip::ANY_INSTANCE, vsomeip::ANY_METHOD);
+
+struct vsomeip_Callback {
+  PyObject *object;
+  bool is_message;  // called with one 'Message' instead of (type, service, instance, id, data, request_id)
+};
+
+/* one per application, replaced (copy on write) when registering so handlers read it without locking */
+typedef std::unordered_map<dispatch_t, std::list<vsomeip_Callback>> vsomeip_Dispatch;
+
+/*
+ * bounded inbound queue toward the callbacks (delivered by its own thread), policy by message type once full:
+ * notifications keep the latest per event (also while not full), requests rejected, critical methods block, others dropped;
+ * responses/errors to own requests always queued (bounded by the requests outstanding), never lost to load
+ */
+struct vsomeip_Inbox {
+  enum result_e { QUEUED, COALESCED, REJECTED, DROPPED };
+
+  struct entry {
+    dispatch_t key;
+    std::shared_ptr<vsomeip::message> message;  // NULL if latest of the key, see 'latest'
+    double received;
+  };
+
+  std::mutex mutex;
+  std::condition_variable not_empty;
+  std::condition_variable not_full;
+  std::deque<entry> entries;
+  std::unordered_map<dispatch_t, std::pair<std::shared_ptr<vsomeip::message>, double>> latest;  // notifications queued, by key
+  std::set<dispatch_t> critical;  // methods blocking instead of rejected/dropped
+  size_t limit;
+  bool is_closed = false;
+
+  unsigned long long coalesced = 0;
+  unsigned long long rejected = 0;
+  unsigned long long dropped = 0;
+  unsigned long long blocked = 0;
+
+  explicit vsomeip_Inbox(size_t limit_) : limit(limit_) {}
+
+  result_e push(dispatch_t key_, const std::shared_ptr<vsomeip::message> &message_, double received_) {  // caller must not hold the GIL
+    std::unique_lock<std::mutex> its_lock(mutex);
+    vsomeip::message_type_e message_type = message_->get_message_type();
+
+    if (message_type == vsomeip::message_type_e::MT_NOTIFICATION) {
+      auto its_latest = latest.find(key_);
+      if (its_latest != latest.end()) {  // not delivered yet, replaced by newer value
+        its_latest->second = std::make_pair(message_, received_);
+        coalesced++;
+        return COALESCED;
+      }
+    }
+
+    bool is_reply = message_type == vsomeip::message_type_e::MT_RESPONSE || message_type == vsomeip::message_type_e::MT_ERROR;
+    if (entries.size() >= limit && !is_reply) {
+      if (critical.count(key_)) {
+        blocked++;
+        not_full.wait(its_lock, [this] { return entries.size() < limit || is_closed; });
+      } else if (message_type == vsomeip::message_type_e::MT_REQUEST) {
+        rejected++;
+        return REJECTED;
+      } else {
+        dropped++;
+        return DROPPED;
+      }
+    }
+    if (is_closed) {
+      dropped++;
+      return DROPPED;
+    }
+
+    if (message_type == vsomeip::message_type_e::MT_NOTIFICATION) {
+      latest[key_] = std::make_pair(message_, received_);
+      entries.push_back(entry{key_, nullptr, received_});
+    } else {
+      entries.push_back(entry{key_, message_, received_});
+    }
+    not_empty.notify_one();
+    return QUEUED;
+  }
+
+  bool pop(std::shared_ptr<vsomeip::message> &message_, double &received_) {  // waits, false once closed
+    std::unique_lock<std::mutex> its_lock(mutex);
+    not_empty.wait(its_lock, [this] { return !entries.empty() || is_closed; });
+    if (is_closed)
+      return false;
+
+    entry its_entry = entries.front();
+    entries.pop_front();
+    if (its_entry.message) {
+      message_ = std::move(its_entry.message);
+      received_ = its_entry.received;
+    } else {
+      auto its_latest = latest.find(its_entry.key);
+      message_ = std::move(its_latest->second.first);
+      received_ = its_latest->second.second;
+      latest.erase(its_latest);
+    }
+    not_full.notify_one();
+    return true;
+  }
+
+  void close() {
+    std::lock_guard<std::mutex> its_lock(mutex);
+    is_closed = true;
+    entries.clear();
+    latest.clear();
+    not_empty.notify_all();
+    not_full.notify_all();
+  }
+};
+
+/* log2 buckets of microseconds (bucket i up to 2^i), lock-free */
+struct vsomeip_Histogram {
+  static const int BUCKETS = 32;
+  std::atomic<unsigned long long> counts[BUCKETS];
+  std::atomic<unsigned long long> total_us;
+  std::atomic<unsigned long long> max_us;
+
+  vsomeip_Histogram() : total_us(0), max_us(0) {
+    for (int i = 0; i < BUCKETS; i++)
+      counts[i].store(0, std::memory_order_relaxed);
+  }
+
+  void record(unsigned long long us_) {
+    int bucket = 0;
+    while (bucket < BUCKETS - 1 && (1ULL << bucket) < us_)
+      bucket++;
+    counts[bucket].fetch_add(1, std::memory_order_relaxed);
+    total_us.fetch_add(us_, std::memory_order_relaxed);
+    unsigned long long its_max = max_us.load(std::memory_order_relaxed);
+    while (us_ > its_max && !max_us.compare_exchange_weak(its_max, us_, std::memory_order_relaxed))
+      ;
+  }
+
+  PyObject *pack() const {  // {'buckets': {upper_us: count}, 'count', 'total_us', 'max_us'}
+    PyObject *buckets = PyDict_New();
+    unsigned long long count = 0;
+    for (int i = 0; i < BUCKETS; i++) {
+      unsigned long long its_count = counts[i].load(std::memory_order_relaxed);
+      if (its_count == 0)
+        continue;
+      count += its_count;
+      PyObject *key = PyLong_FromUnsignedLongLong(1ULL << i);
+      PyObject *value = PyLong_FromUnsignedLongLong(its_count);
+      PyDict_SetItem(buckets, key, value);
+      Py_DECREF(key);
+      Py_DECREF(value);
+    }
+    return Py_BuildValue("{s:N,s:K,s:K,s:K}", "buckets", buckets, "count", count,
+                         "total_us", total_us.load(std::memory_order_relaxed), "max_us", max_us.load(std::memory_order_relaxed));
+  }
+};
+
+/* per (service, instance, method/event) */
+struct vsomeip_Counters {
+  std::atomic<unsigned long long> messages_in{0};
+  std::atomic<unsigned long long> bytes_in{0};
+  std::atomic<unsigned long long> messages_out{0};
+  std::atomic<unsigned long long> bytes_out{0};
+  std::atomic<unsigned long long> callbacks{0};
+  std::atomic<unsigned long long> filtered{0};  // discarded before the GIL, see 'vsomeip_Filters'
+};
+
+typedef std::unordered_map<dispatch_t, std::shared_ptr<vsomeip_Counters>> vsomeip_CounterTable;
+
+/* runtime metrics, atomics (relaxed) on the hot paths, table copied on write when a key is first seen */
+struct vsomeip_Stats {
+  std::mutex mutex;  // adding keys only
+  std::shared_ptr<const vsomeip_CounterTable> table = std::make_shared<const vsomeip_CounterTable>();  // atomic load/store
+  vsomeip_Histogram callback_us;
+  vsomeip_Histogram gil_wait_us;
+  std::atomic<unsigned long long> send_errors{0};
+  std::atomic<unsigned long long> notify_errors{0};
+  std::atomic<unsigned long long> callback_errors{0};
+  std::atomic<unsigned long long> availability_flaps{0};
+
+  vsomeip_Counters &counters(dispatch_t key_) {  // counters never removed, reference stays valid
+    std::shared_ptr<const vsomeip_CounterTable> its_table = std::atomic_load(&table);
+    auto its_counters = its_table->find(key_);
+    if (its_counters != its_table->end())
+      return *its_counters->second;
+
+    std::lock_guard<std::mutex> its_lock(mutex);
+    its_table = std::atomic_load(&table);
+    its_counters = its_table->find(key_);
+    if (its_counters != its_table->end())
+      return *its_counters->second;
+    auto its_copy = std::make_shared<vsomeip_CounterTable>(*its_table);
+    auto its_new = std::make_shared<vsomeip_Counters>();
+    (*its_copy)[key_] = its_new;
+    std::atomic_store(&table, std::shared_ptr<const vsomeip_CounterTable>(its_copy));
+    return *its_new;
+  }
+
+  void sent(dispatch_t key_, const std::shared_ptr<vsomeip::payload> &payload_) {
+    vsomeip_Counters &its_counters = counters(key_);
+    its_counters.messages_out.fetch_add(1, std::memory_order_relaxed);
+    its_counters.bytes_out.fetch_add(payload_ ? payload_->get_length() : 0, std::memory_order_relaxed);
+  }
+
+  void received(dispatch_t key_, const std::shared_ptr<vsomeip::message> &message_) {
+    vsomeip_Counters &its_counters = counters(key_);
+    std::shared_ptr<vsomeip::payload> its_payload = message_->get_payload();
+    its_counters.messages_in.fetch_add(1, std::memory_order_relaxed);
+    its_counters.bytes_in.fetch_add(its_payload ? its_payload->get_length() : 0, std::memory_order_relaxed);
+  }
+};
+
+/*
+ * events recorded as fixed layout records appended to a Python provided buffer by the dispatcher thread (no GIL),
+ * record: timestamp (f8), event (u2), session (u2), length (u4) in native byte order, then 'size' payload bytes
+ */
+struct vsomeip_Capture {
+  static const size_t HEADER = 16;
+
+  std::mutex mutex;
+  Py_buffer buffer;  // exported while set, released holding the GIL
+  bool has_buffer = false;
+  size_t size;  // payload bytes per record, longer truncated, shorter zero padded
+  size_t count = 0;  // records in 'buffer'
+  unsigned long long dropped = 0;  // buffer full or none
+
+  explicit vsomeip_Capture(size_t size_) : size(size_) {}
+
+  void append(const std::shared_ptr<vsomeip::message> &message_, double received_) {  // caller must not hold the GIL
+    std::lock_guard<std::mutex> its_lock(mutex);
+    size_t record = HEADER + size;
+    if (!has_buffer || (count + 1) * record > static_cast<size_t>(buffer.len)) {
+      dropped++;
+      return;
+    }
+
+    uint8_t *its_record = static_cast<uint8_t *>(buffer.buf) + count * record;
+    std::shared_ptr<vsomeip::payload> its_payload = message_->get_payload();
+    uint16_t event = message_->get_method();
+    uint16_t session = message_->get_session();
+    uint32_t length = its_payload ? its_payload->get_length() : 0;
+    std::memcpy(its_record, &received_, sizeof(received_));
+    std::memcpy(its_record + 8, &event, sizeof(event));
+    std::memcpy(its_record + 10, &session, sizeof(session));
+    std::memcpy(its_record + 12, &length, sizeof(length));
+
+    size_t copied = std::min<size_t>(length, size);
+    if (copied > 0)
+      std::memcpy(its_record + HEADER, its_payload->get_data(), copied);
+    if (copied < size)
+      std::memset(its_record + HEADER + copied, 0, size - copied);
+    count++;
+  }
+
+  /* 'buffer_' (NULL for none) replaces the buffer, true if 'old_' was set (to be released holding the GIL), caller must not hold the GIL */
+  bool swap(const Py_buffer *buffer_, Py_buffer &old_, size_t &count_, unsigned long long &dropped_) {
+    std::lock_guard<std::mutex> its_lock(mutex);
+    bool had_buffer = has_buffer;
+    old_ = buffer;
+    count_ = count;
+    dropped_ = dropped;
+    has_buffer = buffer_ != NULL;
+    if (has_buffer)
+      buffer = *buffer_;
+    count = 0;
+    return had_buffer;
+  }
+};
+
+/* latest value of a field (event), kept natively for 'get_field' */
+struct vsomeip_Field {
+  std::mutex mutex;
+  std::shared_ptr<vsomeip::payload> payload;  // NULL until notified
+  std::atomic<bool> changes_only{false};  // callbacks of the event only invoked if the payload changed
+
+  /* true if the payload changed (first one included), caller must not hold the GIL */
+  bool update(const std::shared_ptr<vsomeip::payload> &payload_) {
+    std::lock_guard<std::mutex> its_lock(mutex);
+    bool is_changed = !payload || !payload_ || payload->get_length() != payload_->get_length() ||
+                      (payload_->get_length() > 0 && std::memcmp(payload->get_data(), payload_->get_data(), payload_->get_length()) != 0);
+    payload = payload_;
+    return is_changed;
+  }
+
+  std::shared_ptr<vsomeip::payload> get() {  // caller must not hold the GIL
+    std::lock_guard<std::mutex> its_lock(mutex);
+    return payload;
+  }
+};
+
+/* cached fields by key, replaced (copy on write) when requesting */
+typedef std::unordered_map<dispatch_t, std::shared_ptr<vsomeip_Field>> vsomeip_Fields;
+
+/* one declarative filter (see 'vsomeip_py.filters'), payloads too short to evaluate never pass */
+struct vsomeip_Filter {
+  enum kind_e { MASK, RANGE, DECIMATE, RATE, CHANGED };
+
+  kind_e kind;
+  size_t offset = 0;
+  std::vector<uint8_t> mask, value;  // MASK: (payload & mask) == value
+  char format = 'B';  // RANGE: struct format character of the value, compared as double
+  bool is_little_endian = false;
+  double minimum = 0, maximum = 0;
+  unsigned long long every = 1, count = 0;  // DECIMATE: every Nth passes
+  double rate = 0, burst = 0, tokens = 0;  // RATE: token bucket, per second
+  std::chrono::steady_clock::time_point last;
+  std::vector<uint8_t> previous;  // CHANGED: payload last passed
+  bool has_previous = false;
+
+  static size_t format_size(char format_) {
+    switch (format_) {
+      case '?': case 'b': case 'B': return 1;
+      case 'h': case 'H': return 2;
+      case 'i': case 'I': case 'f': return 4;
+      case 'q': case 'Q': case 'd': return 8;
+      default: return 0;
+    }
+  }
+
+  bool decode(const uint8_t *data_, double &value_) const {
+    uint8_t bytes[8];
+    size_t size = format_size(format);
+    const uint16_t one = 1;
+    bool is_swapped = (*reinterpret_cast<const uint8_t *>(&one) == 1) != is_little_endian;
+    for (size_t i = 0; i < size; i++)
+      bytes[i] = data_[is_swapped ? size - 1 - i : i];
+
+    switch (format) {
+      case '?': value_ = bytes[0] != 0; break;
+      case 'b': { int8_t v; std::memcpy(&v, bytes, 1); value_ = v; break; }
+      case 'B': value_ = bytes[0]; break;
+      case 'h': { int16_t v; std::memcpy(&v, bytes, 2); value_ = v; break; }
+      case 'H': { uint16_t v; std::memcpy(&v, bytes, 2); value_ = v; break; }
+      case 'i': { int32_t v; std::memcpy(&v, bytes, 4); value_ = v; break; }
+      case 'I': { uint32_t v; std::memcpy(&v, bytes, 4); value_ = v; break; }
+      case 'f': { float v; std::memcpy(&v, bytes, 4); value_ = v; break; }
+      case 'q': { int64_t v; std::memcpy(&v, bytes, 8); value_ = (double) v; break; }
+      case 'Q': { uint64_t v; std::memcpy(&v, bytes, 8); value_ = (double) v; break; }
+      case 'd': { double v; std::memcpy(&v, bytes, 8); value_ = v; break; }
+      default: return false;
+    }
+    return true;
+  }
+
+  bool pass(const uint8_t *data_, size_t length_) {  // caller holds the chain lock
+    switch (kind) {
+      case MASK:
+        if (offset + mask.size() > length_)
+          return false;
+        for (size_t i = 0; i < mask.size(); i++)
+          if ((data_[offset + i] & mask[i]) != value[i])
+            return false;
+        return true;
+      case RANGE: {
+        double its_value;
+        if (offset + format_size(format) > length_ || !decode(data_ + offset, its_value))
+          return false;
+        return its_value >= minimum && its_value <= maximum;
+      }
+      case DECIMATE:
+        return count++ % every == 0;
+      case RATE: {
+        auto now = std::chrono::steady_clock::now();
+        tokens = std::min(burst, tokens + std::chrono::duration<double>(now - last).count() * rate);
+        last = now;
+        if (tokens < 1)
+          return false;
+        tokens -= 1;
+        return true;
+      }
+      case CHANGED:
+        if (has_previous && previous.size() == length_ && (length_ == 0 || std::memcmp(previous.data(), data_, length_) == 0))
+          return false;
+        previous.assign(data_, data_ + length_);
+        has_previous = true;
+        return true;
+    }
+    return false;
+  }
+};
+
+/* filters of a key, all (in order) must pass, stateful ones only count messages passed by those before */
+struct vsomeip_FilterChain {
+  std::mutex mutex;  // dispatcher threads evaluate concurrently
+  std::vector<vsomeip_Filter> filters;
+
+  bool pass(const std::shared_ptr<vsomeip::payload> &payload_) {  // caller must not hold the GIL
+    const uint8_t *data = payload_ ? payload_->get_data() : NULL;
+    size_t length = payload_ ? payload_->get_length() : 0;
+    std::lock_guard<std::mutex> its_lock(mutex);
+    for (vsomeip_Filter &its_filter : filters)
+      if (!its_filter.pass(data, length))
+        return false;
+    return true;
+  }
+};
+
+/* filters by key, replaced (copy on write) when registering */
+typedef std::unordered_map<dispatch_t, std::shared_ptr<vsomeip_FilterChain>> vsomeip_Filters;
+
+/* captured events by key, replaced (copy on write) when capturing */
+typedef std::unordered_map<dispatch_t, std::shared_ptr<vsomeip_Capture>> vsomeip_Captures;
+
+static inline unsigned long long elapsed_us(const std::chrono::steady_clock::time_point &since_) {
+  return (unsigned long long) std::chrono::duration_cast<std::chrono::microseconds>(std::chrono::steady_clock::now() - since_).count();
+}
+
+/* set on vsomeip dispatcher threads, those can not wait for the application to stop */
+static thread_local bool _is_handler = false;
+
 struct vsomeip_Entity {
   std::string name;
   std::shared_ptr<vsomeip::application> app;
@@ -112,18 +912,116 @@ struct vsomeip_Entity {
   int service_id;
   int instance_id;
   bool is_registered;
-  std::map<int, std::list<PyObject*>> callback;
-  std::map<int, std::list<PyObject*>> discovery;
+  bool zero_copy;  // callbacks receive read-only 'memoryview' instead of 'bytearray'
+  std::shared_ptr<vsomeip_Calls> calls;
+  std::shared_ptr<vsomeip_Queue> queue;  // if batched, messages queued for 'poll' instead of callbacks
+  std::shared_ptr<vsomeip_Inbox> inbox;  // if bounded, callbacks invoked by 'inbox_thread' instead of dispatcher threads
+  std::shared_ptr<std::thread> inbox_thread;
+  std::shared_ptr<vsomeip_Stats> stats;
+  std::shared_ptr<vsomeip_Readiness> readiness;
+  std::shared_ptr<std::mutex> mutex;  // per application, serializes calls into its vsomeip application
+  std::shared_ptr<const vsomeip_Dispatch> dispatch;  // atomic load/store
+  std::shared_ptr<const std::list<PyObject*>> discovery;  // atomic load/store
+  std::shared_ptr<const vsomeip_Captures> captures;  // atomic load/store
+  std::shared_ptr<const vsomeip_Fields> fields;  // atomic load/store
+  std::shared_ptr<const vsomeip_Filters> filters;  // atomic load/store
+  std::list<PyObject*> references;  // callback references owned, released on 'stop'
+  PyObject *message_cache = NULL;  // 'Message' reused for the next message if unreferenced, guarded by the GIL
+  std::set<std::pair<vsomeip::service_t, vsomeip::instance_t>> offered;  // guarded by 'mutex', withdrawn on 'stop'
+  std::set<std::pair<vsomeip::service_t, vsomeip::instance_t>> requested;  // guarded by 'mutex', released on 'stop'
+
+  /* caller holds 'mutex', true if first callback for the key */
+  bool add_callback(dispatch_t key_, PyObject *callback_object_, bool is_message_) {
+    auto its_dispatch = std::make_shared<vsomeip_Dispatch>(*std::atomic_load(&dispatch));
+    bool is_new = its_dispatch->count(key_) == 0;
+    (*its_dispatch)[key_].push_back(vsomeip_Callback{callback_object_, is_message_});
+    std::atomic_store(&dispatch, std::shared_ptr<const vsomeip_Dispatch>(its_dispatch));
+    references.push_back(callback_object_);
+    return is_new;
+  }
+
+  /* caller holds 'mutex', returns keys without callbacks before */
+  std::list<dispatch_t> add_callbacks(const std::list<dispatch_t> &keys_, PyObject *callback_object_, bool is_message_) {
+    auto its_dispatch = std::make_shared<vsomeip_Dispatch>(*std::atomic_load(&dispatch));
+    std::list<dispatch_t> added;
+    for (dispatch_t key : keys_) {
+      if (its_dispatch->count(key) == 0)
+        added.push_back(key);
+      (*its_dispatch)[key].push_back(vsomeip_Callback{callback_object_, is_message_});
+    }
+    std::atomic_store(&dispatch, std::shared_ptr<const vsomeip_Dispatch>(its_dispatch));
+    references.push_back(callback_object_);
+    return added;
+  }
+
+  /* caller holds 'mutex' */
+  void add_capture(const std::list<dispatch_t> &keys_, const std::shared_ptr<vsomeip_Capture> &capture_) {
+    auto its_captures = std::make_shared<vsomeip_Captures>(*std::atomic_load(&captures));
+    for (dispatch_t key : keys_)
+      (*its_captures)[key] = capture_;
+    std::atomic_store(&captures, std::shared_ptr<const vsomeip_Captures>(its_captures));
+  }
+
+  /* caller holds 'mutex', replaces filters of the keys (none if empty) */
+  void set_filters(const std::list<dispatch_t> &keys_, const std::vector<vsomeip_Filter> &filters_) {
+    auto its_filters = std::make_shared<vsomeip_Filters>(*std::atomic_load(&filters));
+    for (dispatch_t key : keys_) {
+      if (filters_.empty()) {
+        its_filters->erase(key);
+      } else {
+        auto its_chain = std::make_shared<vsomeip_FilterChain>();  // state per key
+        its_chain->filters = filters_;
+        (*its_filters)[key] = its_chain;
+      }
+    }
+    std::atomic_store(&filters, std::shared_ptr<const vsomeip_Filters>(its_filters));
+  }
+
+  /* caller holds 'mutex', 'changes_only_' once set stays for the event, returns keys without field before */
+  std::list<dispatch_t> add_fields(const std::list<dispatch_t> &keys_, bool changes_only_) {
+    auto its_fields = std::make_shared<vsomeip_Fields>(*std::atomic_load(&fields));
+    std::list<dispatch_t> added;
+    for (dispatch_t key : keys_) {
+      std::shared_ptr<vsomeip_Field> &its_field = (*its_fields)[key];
+      if (!its_field) {
+        its_field = std::make_shared<vsomeip_Field>();
+        added.push_back(key);
+      }
+      if (changes_only_)
+        its_field->changes_only = true;
+    }
+    std::atomic_store(&fields, std::shared_ptr<const vsomeip_Fields>(its_fields));
+    return added;
+  }
+
+  /* caller holds 'mutex' */
+  void add_discovery(PyObject *callback_object_) {
+    auto its_discovery = std::make_shared<std::list<PyObject*>>(*std::atomic_load(&discovery));
+    its_discovery->push_back(callback_object_);
+    std::atomic_store(&discovery, std::shared_ptr<const std::list<PyObject*>>(its_discovery));
+    references.push_back(callback_object_);
+  }
 
   void on_availability(vsomeip::service_t service_id_, vsomeip::instance_t instance_id_, bool is_available_) {
+    _is_handler = true;
+    if (readiness->on_availability(service_id_, instance_id_, is_available_))
+      stats->availability_flaps.fetch_add(1, std::memory_order_relaxed);
+
+    std::shared_ptr<const std::list<PyObject*>> its_discovery = std::atomic_load(&discovery);
+    if (its_discovery->empty())
+      return;  // no need for the GIL
+
     PyGILState_STATE gstate;
     gstate = PyGILState_Ensure();
 
     PyObject *arguments = Py_BuildValue("iii", service_id_, instance_id_, 1 ? is_available_: 0);
 
-    for (PyObject *callback_object : discovery[0]) {
+    for (PyObject *callback_object : *its_discovery) {
       try {
-        PyObject_CallObject(callback_object, arguments); // invoke callback method
+        PyObject *result = PyObject_CallObject(callback_object, arguments); // invoke callback method
+        if (PyErr_Occurred())
+            PyErr_Print();
+        Py_XDECREF(result);
       }
       catch (...) {
         PyErr_SetString(PyExc_RuntimeError, "Check callback function!!!");
@@ -135,445 +1033,1823 @@ struct vsomeip_Entity {
   }
 
   void on_state(vsomeip::state_type_e state_) {
-    PyGILState_STATE gstate;
-    gstate = PyGILState_Ensure();
-
+    _is_handler = true;
     if (state_ == vsomeip::state_type_e::ST_REGISTERED)
       is_registered = true;
     else
       is_registered = false;
 
+    readiness->on_state(is_registered);
+
     /*
     if (is_registered) {
         app->offer_service(service_id, instance_id);
     }
     */
+  }
 
-    PyGILState_Release(gstate);
+  /* 'argument' is the arguments tuple, or the 'Message' if called with one */
+  void invoke(const vsomeip_Callback &callback, PyObject *argument, const std::shared_ptr<vsomeip::message> &message, vsomeip_Counters &counters) {
+    try {
+      auto started = std::chrono::steady_clock::now();
+      PyObject *result = callback.is_message ? call_one(callback.object, argument)  // vectorcall, no tuple
+                                             : PyObject_CallObject(callback.object, argument); // invoke callback method
+      stats->callback_us.record(elapsed_us(started));
+      counters.callbacks.fetch_add(1, std::memory_order_relaxed);
+      if (PyErr_Occurred()) {
+          stats->callback_errors.fetch_add(1, std::memory_order_relaxed);
+          PyErr_Print(); // or handle the exception as needed
+      }
+
+      if (result != NULL && result != Py_None) { // respond if have data to send, Todo: actually follow the message types for proper action
+      //cout<<"######################### "<<"HERE"<<" #########################"<<std::endl;
+        if (PyObject_CheckBuffer(result)) {
+          PAYLOAD_LOCK();  // lock before messing with buffer
+
+          std::shared_ptr<vsomeip::message> its_response = vsomeip::runtime::get()->create_response(message);
+          std::shared_ptr<vsomeip::payload> payload = payload_unpack(result);
+          if (payload) {
+            its_response->set_payload(payload);
+            stats->sent(dispatch_key(message->get_service(), message->get_instance(), message->get_method()), payload);
+            Py_BEGIN_ALLOW_THREADS
+            {  // GIL restored after unlocking
+              std::lock_guard<std::mutex> its_lock(*mutex);  // serialized as every send
+              app->send(its_response);  // response to the request
+            }
+            Py_END_ALLOW_THREADS
+          } else {
+            stats->send_errors.fetch_add(1, std::memory_order_relaxed);
+            PyErr_Print();
+          }
+        }
+      }
+      Py_XDECREF(result);
+    }
+    catch (...) {
+      PyErr_SetString(PyExc_RuntimeError, "Check callback function!!!");
+    }
   }
 
-  void message_handler(const std::shared_ptr<vsomeip::message> &message) {
+  /* invoke callbacks of the message, takes the GIL */
+  void deliver(const std::shared_ptr<vsomeip::message> &message, double received) {
+    dispatch_t key = dispatch_key(message->get_service(), message->get_instance(), message->get_method());
+    std::shared_ptr<const vsomeip_Dispatch> its_dispatch = std::atomic_load(&dispatch);
+    auto its_callbacks = its_dispatch->find(key);
+    auto its_any = its_dispatch->find(ANY_DISPATCH);
+    if (its_callbacks == its_dispatch->end() && its_any == its_dispatch->end())
+      return;
+    vsomeip_Counters &counters = stats->counters(key);
+
+    auto waiting = std::chrono::steady_clock::now();
     PyGILState_STATE gstate;
     gstate = PyGILState_Ensure();
+    stats->gil_wait_us.record(elapsed_us(waiting));
+
+    PyObject *arguments = NULL;  // built for the first callback needing them, shared by the others
+    PyObject *its_message = NULL;
+    for (auto its_list : {its_callbacks, its_any}) {
+      if (its_list == its_dispatch->end() || (its_list == its_any && its_any == its_callbacks))
+        continue;
+      for (const vsomeip_Callback &callback : its_list->second) {
+        if (callback.is_message && its_message == NULL) {
+          its_message = message_object(message_object_take(), message, zero_copy, received);
+          if (its_message == NULL) {
+            PyErr_Print();
+            continue;
+          }
+        } else if (!callback.is_message && arguments == NULL) {
+          arguments = message_pack(message, zero_copy);
+          if (arguments == NULL) {
+            PyErr_Print();
+            continue;
+          }
+        }
+        invoke(callback, callback.is_message ? its_message : arguments, message, counters);
+      }
+    }
 
-    std::shared_ptr<vsomeip::payload> its_payload = message->get_payload();
-    int service_id = message->get_service();
-    int instance_id = message->get_instance();
-    int message_id = message->get_method();
-    int type = static_cast<std::underlying_type<vsomeip::message_type_e>::type>(message->get_message_type());
+    Py_XDECREF(arguments);
+    message_object_give(its_message);
 
-    // if no callback (i.e. registered) then no point to do anything further
-    if (callback.count(message_id) <= 0 || callback[message_id].empty()) {
-      PyGILState_Release(gstate);
-      return;
-    }
+    PyGILState_Release(gstate);
+  }
 
-    int request_id = message->get_client() + message->get_session();
+  /* reusable 'Message' (if any) taken while in use, holding the GIL */
+  PyObject *message_object_take() {
+    PyObject *reused = message_cache;
+    message_cache = NULL;
+    return reused;  // reference passed on, see 'message_object'
+  }
 
-    PyObject *bytes_object = payload_pack(its_payload);
-    PyObject *arguments = Py_BuildValue("iiiiOi", type, service_id, instance_id, message_id, bytes_object, request_id);
+  /* done with 'Message', kept for reuse if none, holding the GIL */
+  void message_object_give(PyObject *message_object_) {
+    if (message_object_ == NULL)
+      return;
+    if (message_cache == NULL) {
+      message_cache = message_object_;
+    } else {
+      Py_DECREF(message_object_);
+    }
+  }
 
-    for (PyObject *callback_object : callback[message_id]) {
-      try {
-        PyObject *result = PyObject_CallObject(callback_object, arguments); // invoke callback method
-        if (PyErr_Occurred())
-            PyErr_Print(); // or handle the exception as needed
+  /* 'inbox_thread', delivers until the inbox closed */
+  void deliver_inbox() {
+    _is_handler = true;
+    std::shared_ptr<vsomeip::message> message;
+    double received;
+    while (inbox->pop(message, received))
+      deliver(message, received);
+  }
 
-        if (result != Py_None) { // respond if have data to send, Todo: actually follow the message types for proper action
-        //cout<<"######################### "<<"HERE"<<" #########################"<<std::endl;
-          if (PyObject_TypeCheck(result, &PyByteArray_Type)) {
-            std::lock_guard<std::mutex> its_lock(_payload_mutex);  // lock before messing with buffer
+  void message_handler(const std::shared_ptr<vsomeip::message> &message) {
+    _is_handler = true;
+    request_t request_id = ::request_id(message->get_client(), message->get_session());
+    vsomeip::message_type_e message_type = message->get_message_type();
+    if (message_type == vsomeip::message_type_e::MT_RESPONSE || message_type == vsomeip::message_type_e::MT_ERROR)
+      calls->respond(request_id);  // measured before waiting on the GIL
 
-            std::shared_ptr<vsomeip::message> its_response = vsomeip::runtime::get()->create_response(message);
-            std::shared_ptr<vsomeip::payload> payload = payload_unpack(result);
-            its_response->set_payload(payload);
+    // if no callback (i.e. registered) then no point to do anything further
+    double received = now_timestamp();
+    dispatch_t key = dispatch_key(message->get_service(), message->get_instance(), message->get_method());
+    stats->received(key, message);
+    bool is_changed = true;
+    if (message_type == vsomeip::message_type_e::MT_NOTIFICATION) {  // cached even if captured, see 'get_field'
+      std::shared_ptr<const vsomeip_Fields> its_fields = std::atomic_load(&fields);
+      auto its_field = its_fields->find(key);
+      if (its_field != its_fields->end())
+        is_changed = its_field->second->update(message->get_payload()) || !its_field->second->changes_only;
+    }
 
-            app->send(its_response);  // response to the request
-          }
-        }
-        Py_DECREF(result);
+    std::shared_ptr<const vsomeip_Captures> its_captures = std::atomic_load(&captures);
+    if (!its_captures->empty()) {
+      auto its_capture = its_captures->find(key);
+      if (its_capture != its_captures->end()) {  // recorded instead of callbacks, no GIL
+        its_capture->second->append(message, received);
+        return;
       }
-      catch (...) {
-        PyErr_SetString(PyExc_RuntimeError, "Check callback function!!!");
+    }
+
+    if (!is_changed)
+      return;  // unchanged, no wakeup
+
+    std::shared_ptr<const vsomeip_Filters> its_filters = std::atomic_load(&filters);
+    if (!its_filters->empty()) {
+      auto its_chain = its_filters->find(key);
+      if (its_chain == its_filters->end())
+        its_chain = its_filters->find(ANY_DISPATCH);  // of 'ANY', messages without filters of their own
+      if (its_chain != its_filters->end() && !its_chain->second->pass(message->get_payload())) {
+        stats->counters(key).filtered.fetch_add(1, std::memory_order_relaxed);
+        return;  // discarded, never reaches the interpreter
       }
     }
 
-    Py_DECREF(bytes_object);
-    Py_DECREF(arguments);
+    std::shared_ptr<const vsomeip_Dispatch> its_dispatch = std::atomic_load(&dispatch);
+    if (its_dispatch->find(key) == its_dispatch->end() && its_dispatch->find(ANY_DISPATCH) == its_dispatch->end())
+      return;
 
-    PyGILState_Release(gstate);
+    if (queue) {  // batched, no GIL on this thread
+      queue->push(message);
+      return;
+    }
+
+    if (inbox) {  // bounded, no GIL on this thread
+      if (inbox->push(key, message, received) == vsomeip_Inbox::REJECTED) {
+        std::shared_ptr<vsomeip::message> its_error = vsomeip::runtime::get()->create_response(message);
+        its_error->set_message_type(vsomeip::message_type_e::MT_ERROR);
+        its_error->set_return_code(vsomeip::return_code_e::E_NOT_READY);
+        std::lock_guard<std::mutex> its_lock(*mutex);  // serialized as every send
+        app->send(its_error);
+      }
+      return;
+    }
+
+    deliver(message, received);
   }
 };
 
-/* global mapping for multiple services/clients by unique name */
-std::map<std::string, map<int, std::map<int, vsomeip_Entity>>> _entity_mapping;
-
-static PyObject *vsomeip_create_app(PyObject *self, PyObject *args) {
+/*
+ * global mapping of applications by unique name, '_mutex' guards the mapping only
+ * one application offers/requests any number of (service, instance) pairs, those are arguments of the calls
+ * (null while reserved by 'create')
+ */
+std::map<std::string, std::shared_ptr<vsomeip_Entity>> _entity_mapping;
+
+/* lookup without inserting, NULL with 'RuntimeError' if not created */
+static std::shared_ptr<vsomeip_Entity> find_entity(const std::string &name_) {
   std::lock_guard<std::mutex> guard(_mutex);
 
-  const char *str_pointer;
-  std::string name;
-  int result = 0;
-  int service_id, instance_id;
+  auto its_name = _entity_mapping.find(name_);
+  if (its_name != _entity_mapping.end() && its_name->second)  // else reserved, still being created
+    return its_name->second;
+  PyErr_SetString(PyExc_RuntimeError, "application not created!");
+  return nullptr;
+}
 
-  if (!PyArg_ParseTuple(args, "sii", &str_pointer, &service_id, &instance_id))
-    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
-  name = std::string(str_pointer);
+/* opaque handle returned by 'create', skips name lookups on the hot calls and keeps the entity alive */
+#define HANDLE_NAME "vsomeip_ext.handle"
 
-  vsomeip_Entity vsomeip_entity;  // memory allocation happening
-  vsomeip_entity.is_registered = false;
-  vsomeip_entity.service_id = service_id;
-  vsomeip_entity.instance_id = instance_id;
-  vsomeip_entity.name = name;
+static void handle_destructor(PyObject *capsule_) {
+  delete (std::shared_ptr<vsomeip_Entity> *)PyCapsule_GetPointer(capsule_, HANDLE_NAME);
+}
 
-  _entity_mapping[name][service_id][instance_id] = vsomeip_entity;
-// windows creates a tightly coupled library and thus cannot pass complex data types, see: patch file for changes needed to vsomeip!
-#ifdef __unix__
-  _entity_mapping[name][service_id][instance_id].app = vsomeip::runtime::get()->create_application(vsomeip_entity.name);
-#else
-  _entity_mapping[name][service_id][instance_id].app = vsomeip::runtime::get()->create_application_std(vsomeip_entity.name.c_str());
+static PyObject *handle_pack(const std::shared_ptr<vsomeip_Entity> &entity_) {
+  auto *pointer = new std::shared_ptr<vsomeip_Entity>(entity_);
+  PyObject *capsule = PyCapsule_New(pointer, HANDLE_NAME, handle_destructor);
+  if (capsule == NULL)
+    delete pointer;
+  return capsule;
+}
+
+/* NULL with exception if not a handle */
+static vsomeip_Entity *handle_unpack(PyObject *capsule_) {
+  if (!PyCapsule_IsValid(capsule_, HANDLE_NAME)) {
+    PyErr_SetString(PyExc_RuntimeError, "application not created!");
+    return NULL;
+  }
+  return ((std::shared_ptr<vsomeip_Entity> *)PyCapsule_GetPointer(capsule_, HANDLE_NAME))->get();
+}
+
+/* handle returned by 'capture', the buffer set is released with it (or on 'stop') */
+#define CAPTURE_NAME "vsomeip_ext.capture"
+
+/* buffer (if any) of capture released, records dropped from now on, holding the GIL */
+static void capture_release(vsomeip_Capture *capture_) {
+  Py_buffer its_buffer;
+  size_t count;
+  unsigned long long dropped;
+  bool had_buffer;
+  Py_BEGIN_ALLOW_THREADS  // never wait on the capture lock holding the GIL
+  had_buffer = capture_->swap(NULL, its_buffer, count, dropped);
+  Py_END_ALLOW_THREADS
+  if (had_buffer)
+    PyBuffer_Release(&its_buffer);
+}
+
+static void capture_destructor(PyObject *capsule_) {
+  auto *pointer = (std::shared_ptr<vsomeip_Capture> *)PyCapsule_GetPointer(capsule_, CAPTURE_NAME);
+  capture_release(pointer->get());
+  delete pointer;
+}
+
+/* NULL with exception if not a capture */
+static vsomeip_Capture *capture_unpack(PyObject *capsule_) {
+  if (!PyCapsule_IsValid(capsule_, CAPTURE_NAME)) {
+    PyErr_SetString(PyExc_TypeError, "need a capture!");
+    return NULL;
+  }
+  return ((std::shared_ptr<vsomeip_Capture> *)PyCapsule_GetPointer(capsule_, CAPTURE_NAME))->get();
+}
+
+/* integer arguments of 'METH_FASTCALL' calls, false with exception if not */
+static bool fast_ints(PyObject *const *args_, Py_ssize_t first_, Py_ssize_t count_, int *values_) {
+  for (Py_ssize_t i = 0; i < count_; i++) {
+    values_[i] = (int)PyLong_AsLong(args_[first_ + i]);
+    if (values_[i] == -1 && PyErr_Occurred())
+      return false;
+  }
+  return true;
+}
+
+/* sequence of integers (ids), false with exception if not */
+static bool sequence_ints(PyObject *sequence_, std::vector<int> &values_) {
+  PyObject *fast = PySequence_Fast(sequence_, "need a sequence of integers!");
+  if (fast == NULL)
+    return false;
+
+  Py_ssize_t size = PySequence_Fast_GET_SIZE(fast);
+  PyObject **items = PySequence_Fast_ITEMS(fast);
+  values_.resize(size);
+  bool result = fast_ints(items, 0, size, values_.data());
+  Py_DECREF(fast);
+  return result;
+}
+
+static PyObject *vsomeip_create_app(PyObject *self, PyObject *args) {
+  const char *str_pointer;
+  std::string name;
+  int service_id, instance_id;
+  int zero_copy = 0;
+  int queue_size = 0;
+  int inbox_limit = 0;
+
+  if (!PyArg_ParseTuple(args, "sii|pii", &str_pointer, &service_id, &instance_id, &zero_copy, &queue_size, &inbox_limit)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  name = std::string(str_pointer);
+
+  {
+    std::lock_guard<std::mutex> guard(_mutex);
+    if (_entity_mapping.count(name)) {  // more (service, instance) pairs share the application, see 'attach'
+      PyErr_SetString(PyExc_RuntimeError, "application already created!");
+      return NULL;
+    }
+    _entity_mapping[name] = nullptr;  // reserved (checked and inserted at once), set once initialized
+  }
+
+  auto vsomeip_entity = std::make_shared<vsomeip_Entity>();  // memory allocation happening
+  vsomeip_entity->is_registered = false;
+  vsomeip_entity->zero_copy = zero_copy;
+  if (queue_size > 0)
+    vsomeip_entity->queue = std::make_shared<vsomeip_Queue>(queue_size);
+  else if (inbox_limit > 0)
+    vsomeip_entity->inbox = std::make_shared<vsomeip_Inbox>(inbox_limit);
+  vsomeip_entity->readiness = std::make_shared<vsomeip_Readiness>();
+  vsomeip_entity->service_id = service_id;
+  vsomeip_entity->instance_id = instance_id;
+  vsomeip_entity->name = name;
+  vsomeip_entity->calls = std::make_shared<vsomeip_Calls>();
+  vsomeip_entity->mutex = std::make_shared<std::mutex>();
+  vsomeip_entity->stats = std::make_shared<vsomeip_Stats>();
+  vsomeip_entity->dispatch = std::make_shared<const vsomeip_Dispatch>();
+  vsomeip_entity->discovery = std::make_shared<const std::list<PyObject*>>();
+  vsomeip_entity->captures = std::make_shared<const vsomeip_Captures>();
+  vsomeip_entity->fields = std::make_shared<const vsomeip_Fields>();
+  vsomeip_entity->filters = std::make_shared<const vsomeip_Filters>();
+
+// windows creates a tightly coupled library and thus cannot pass complex data types, see: patch file for changes needed to vsomeip!
+#ifdef __unix__
+  vsomeip_entity->app = vsomeip::runtime::get()->create_application(vsomeip_entity->name);
+#else
+  vsomeip_entity->app = vsomeip::runtime::get()->create_application_std(vsomeip_entity->name.c_str());
 #endif
-  auto app = _entity_mapping[name][service_id][instance_id].app;
-  app->init();
+  auto app = vsomeip_entity->app;
 
-  auto instance = _entity_mapping[name][service_id][instance_id];
+  Py_BEGIN_ALLOW_THREADS  // loads configuration, no need to block others
+  app->init();
+  Py_END_ALLOW_THREADS
 
-  auto register_availability_binder = std::bind(std::mem_fn(&vsomeip_Entity::on_availability), instance, std::placeholders::_1, std::placeholders::_2, std::placeholders::_3);
+  // bound to the one entity (not a copy), alive until handlers cleared on 'stop'
+  auto register_availability_binder = std::bind(std::mem_fn(&vsomeip_Entity::on_availability), vsomeip_entity.get(), std::placeholders::_1, std::placeholders::_2, std::placeholders::_3);
   app->register_availability_handler(vsomeip::ANY_SERVICE, vsomeip::ANY_INSTANCE, register_availability_binder);
 
-  auto register_state_binder = std::bind(std::mem_fn(&vsomeip_Entity::on_state), instance, std::placeholders::_1);
+  auto register_state_binder = std::bind(std::mem_fn(&vsomeip_Entity::on_state), vsomeip_entity.get(), std::placeholders::_1);
   app->register_state_handler(register_state_binder);
 
-  std::this_thread::sleep_for(chrono::milliseconds(125));  // todo: checking when actually ready (i.e. 'is_available')
+  if (vsomeip_entity->inbox)  // joined on 'stop'
+    vsomeip_entity->inbox_thread = std::make_shared<std::thread>(std::mem_fn(&vsomeip_Entity::deliver_inbox), vsomeip_entity.get());
+
+  {
+    std::lock_guard<std::mutex> guard(_mutex);
+    _entity_mapping[name] = vsomeip_entity;  // reservation taken over
+  }
+
+  return handle_pack(vsomeip_entity);
+}
+
+static PyObject *vsomeip_request_service(PyObject *self, PyObject *args) {
+  int service_id, instance_id;
+  int result = 0;
+  int version_major = 0x00, version_minor = 0x00;
+  std::string name;
+  char* str_pointer;
+
+  if (!PyArg_ParseTuple(args, "siiii", &str_pointer, &service_id, &instance_id, &version_major, &version_minor)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  name = std::string(str_pointer);
+
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  {  // GIL restored after unlocking
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+    entity->app->request_service(service_id, instance_id);
+    entity->requested.insert(std::make_pair(service_id, instance_id));
+  }
+  Py_END_ALLOW_THREADS
+
+  return Py_BuildValue("i", result);
+}
+
+/* forget the application, its name can be created again right away */
+static void erase_entity(const std::shared_ptr<vsomeip_Entity> &entity_) {
+  std::lock_guard<std::mutex> guard(_mutex);
+
+  auto its_name = _entity_mapping.find(entity_->name);
+  if (its_name != _entity_mapping.end() && its_name->second == entity_)
+    _entity_mapping.erase(its_name);
+}
+
+/*
+ * stop offering/requesting, unblock 'start' and join its thread, callers do not hold the GIL
+ * returns false if stopped from a handler (application thread detached instead of joined)
+ */
+static bool stop_entity(const std::shared_ptr<vsomeip_Entity> &entity_) {
+  auto app = entity_->app;
+  std::shared_ptr<std::thread> app_thread;
+  {
+    std::lock_guard<std::mutex> its_lock(*entity_->mutex);
+    for (auto &its_offered : entity_->offered)
+      app->stop_offer_service(its_offered.first, its_offered.second);
+    for (auto &its_requested : entity_->requested)
+      app->release_service(its_requested.first, its_requested.second);
+    entity_->offered.clear();
+    entity_->requested.clear();
+    app->clear_all_handler();  // unregister all registered handlers
+    app_thread = entity_->app_thread;
+    entity_->app_thread.reset();
+  }
+
+  app->stop();  // returns from 'app->start()', routing (if hosted) shut down with it
+
+  bool is_joined = true;
+  if (app_thread && app_thread->joinable()) {
+    if (!_is_handler && app_thread->get_id() != std::this_thread::get_id()) {
+      app_thread->join();
+    } else {  // can not wait for itself
+      app_thread->detach();
+      is_joined = false;
+    }
+  }
+
+  if (entity_->inbox) {  // messages not delivered yet dropped
+    entity_->inbox->close();
+    auto inbox_thread = entity_->inbox_thread;
+    if (inbox_thread && inbox_thread->joinable()) {
+      if (inbox_thread->get_id() != std::this_thread::get_id()) {
+        inbox_thread->join();
+      } else {
+        inbox_thread->detach();
+        is_joined = false;
+      }
+    }
+  }
+
+  entity_->readiness->on_state(false);
+  erase_entity(entity_);
+// windows cannot pass complex data types (see: 'create'), the application is released with the entity
+#ifdef __unix__
+  vsomeip::runtime::get()->remove_application(entity_->name);
+#endif
+  return is_joined;
+}
+
+/* release callbacks of stopped application, holding the GIL */
+static void release_callbacks(const std::shared_ptr<vsomeip_Entity> &entity_) {
+  std::list<PyObject*> references;
+  std::shared_ptr<const vsomeip_Captures> captures;
+  {
+    std::lock_guard<std::mutex> its_lock(*entity_->mutex);  // no handlers left to contend with
+    std::atomic_store(&entity_->dispatch, std::make_shared<const vsomeip_Dispatch>());
+    std::atomic_store(&entity_->discovery, std::make_shared<const std::list<PyObject*>>());
+    captures = std::atomic_exchange(&entity_->captures, std::make_shared<const vsomeip_Captures>());
+    std::atomic_store(&entity_->fields, std::make_shared<const vsomeip_Fields>());
+    std::atomic_store(&entity_->filters, std::make_shared<const vsomeip_Filters>());
+    references.swap(entity_->references);
+  }
+  for (PyObject *callback_object : references)
+    Py_XDECREF(callback_object);
+  Py_CLEAR(entity_->message_cache);
+  for (auto &its_capture : *captures)
+    capture_release(its_capture.second.get());  // once per capture, others find no buffer
+}
+
+static PyObject *vsomeip_stop(PyObject *self, PyObject *args) {
+  int service_id, instance_id;
+  int result = 0;
+  std::string name;
+  char* str_pointer;
+
+  if (!PyArg_ParseTuple(args, "sii", &str_pointer, &service_id, &instance_id)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  name = std::string(str_pointer);
+
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
+
+  bool is_joined = true, is_failed = false;
+  Py_BEGIN_ALLOW_THREADS  // handlers need the GIL to finish
+  try {
+    is_joined = stop_entity(entity);
+  }
+  catch (...) {
+    is_failed = true;
+  }
+  Py_END_ALLOW_THREADS
+
+  if (is_failed) {
+    PyErr_SetString(PyExc_RuntimeError, "Failed to stop...");
+    return NULL;
+  }
+
+  if (is_joined)  // else a handler may still be running, references kept
+    release_callbacks(entity);
+
+  return Py_BuildValue("i", result);
+}
+
+/* stop offering/requesting one (service, instance) pair, the application keeps running for the others */
+static PyObject *vsomeip_withdraw(PyObject *self, PyObject *args) {
+  PyObject *handle_object;
+  int service_id, instance_id;
+  int result = 0;
+
+  if (!PyArg_ParseTuple(args, "Oii", &handle_object, &service_id, &instance_id))
+    return NULL;
+
+  vsomeip_Entity *entity = handle_unpack(handle_object);
+  if (!entity)
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS  // never wait on the application lock holding the GIL
+  {
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+    auto its_pair = std::make_pair((vsomeip::service_t) service_id, (vsomeip::instance_t) instance_id);
+    if (entity->offered.erase(its_pair))
+      entity->app->stop_offer_service(service_id, instance_id);
+    if (entity->requested.erase(its_pair))
+      entity->app->release_service(service_id, instance_id);
+  }
+  Py_END_ALLOW_THREADS
+
+  return Py_BuildValue("i", result);
+}
+
+static PyObject *vsomeip_stop_all(PyObject *self, PyObject *args) {
+  std::list<std::shared_ptr<vsomeip_Entity>> entities;
+  {
+    std::lock_guard<std::mutex> guard(_mutex);
+    for (auto &its_name : _entity_mapping)
+      if (its_name.second)  // else reserved, still being created
+        entities.push_back(its_name.second);
+  }
+
+  int count = 0;
+  for (auto &entity : entities) {
+    bool is_joined = true, is_failed = false;
+    Py_BEGIN_ALLOW_THREADS
+    try {
+      is_joined = stop_entity(entity);
+    }
+    catch (...) {
+      is_failed = true;
+    }
+    Py_END_ALLOW_THREADS
+
+    if (is_failed)
+      continue;  // keep stopping the others
+    if (is_joined)
+      release_callbacks(entity);
+    count++;
+  }
+
+  return Py_BuildValue("i", count);
+}
+
+static void start(std::shared_ptr<vsomeip::application> app_) {
+  if(app_->is_routing()) {
+       ;
+  }
+  app_->start();
+}
+
+static PyObject *vsomeip_start(PyObject *self, PyObject *args) {
+  int result = 0;
+  std::string name;
+  int service_id, instance_id;
+  char* str_pointer;
+
+  if (!PyArg_ParseTuple(args, "sii", &str_pointer, &service_id, &instance_id)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  name = std::string(str_pointer);
+
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS  // never wait on the application lock holding the GIL
+  {
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+    if (!entity->app_thread)  // joined on 'stop'
+      entity->app_thread = std::make_shared<std::thread>(std::bind(&start, entity->app));
+  }
+  Py_END_ALLOW_THREADS
+
+  return Py_BuildValue("i", result);
+}
+
+static PyObject *vsomeip_wait_registered(PyObject *self, PyObject *args) {
+  int service_id, instance_id;
+  int timeout_ms = -1;
+  std::string name;
+  char* str_pointer;
+
+  if (!PyArg_ParseTuple(args, "sii|i", &str_pointer, &service_id, &instance_id, &timeout_ms)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  name = std::string(str_pointer);
+
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
+  auto readiness = entity->readiness;
+
+  bool result;
+  Py_BEGIN_ALLOW_THREADS
+  result = readiness->wait_registered(timeout_ms);
+  Py_END_ALLOW_THREADS
+
+  return PyBool_FromLong(result);
+}
+
+static PyObject *vsomeip_wait_available(PyObject *self, PyObject *args) {
+  int service_id, instance_id;
+  int available_service_id, available_instance_id;
+  int timeout_ms = -1;
+  std::string name;
+  char* str_pointer;
+
+  if (!PyArg_ParseTuple(args, "siiii|i", &str_pointer, &service_id, &instance_id, &available_service_id, &available_instance_id, &timeout_ms)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  name = std::string(str_pointer);
+
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
+  auto readiness = entity->readiness;
+
+  bool result;
+  Py_BEGIN_ALLOW_THREADS
+  result = readiness->wait_available(available_service_id, available_instance_id, timeout_ms);
+  Py_END_ALLOW_THREADS
+
+  return PyBool_FromLong(result);
+}
+
+static PyObject *vsomeip_discovery_services(PyObject *self, PyObject *args) {
+  int service_id, instance_id;
+  int result = 0;
+  std::string name;
+  PyObject *callback_object;
+  char* str_pointer;
+
+  if (!PyArg_ParseTuple(args, "siiO", &str_pointer, &service_id, &instance_id, &callback_object)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  name = std::string(str_pointer);
+
+  // make sure last argument is a function
+  if (!PyCallable_Check(callback_object)) {
+    PyErr_SetString(PyExc_TypeError, "need a callable object!");
+    return NULL;
+  }
+
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
+
+  Py_XINCREF(callback_object); // add a reference to new callback
+
+  Py_BEGIN_ALLOW_THREADS  // never wait on the application lock holding the GIL
+  {
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+    entity->add_discovery(callback_object);
+  }
+  Py_END_ALLOW_THREADS
+
+  return Py_BuildValue("i", result);
+}
+
+static PyObject *vsomeip_register_message(PyObject *self, PyObject *args) {
+  int service_id, instance_id, message_id;
+  int result = 0;
+  std::string name;
+  PyObject *callback_object;
+  int is_message = 0;
+  char* str_pointer;
+
+  if (!PyArg_ParseTuple(args, "siiiO|p", &str_pointer, &service_id, &instance_id, &message_id, &callback_object, &is_message)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  name = std::string(str_pointer);
+
+  // make sure last argument is a function
+  if (!PyCallable_Check(callback_object)) {
+    PyErr_SetString(PyExc_TypeError, "need a callable object!");
+    return NULL;
+  }
+
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
+
+  Py_XINCREF(callback_object); // add a reference to new callback
+
+  Py_BEGIN_ALLOW_THREADS  // never wait on the application lock holding the GIL
+  {
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+    bool is_any = message_id == 0xFFFF;
+    dispatch_t key = is_any ? ANY_DISPATCH : dispatch_key(service_id, instance_id, message_id);
+
+    if (entity->add_callback(key, callback_object, is_message)) {  // first for the key, later ones just join the table
+      auto ptr_to_func = std::mem_fn(&vsomeip_Entity::message_handler);
+      auto register_message_binder = std::bind(ptr_to_func, entity.get(), std::placeholders::_1);
+      if(is_any)
+        entity->app->register_message_handler(vsomeip::ANY_SERVICE, vsomeip::ANY_INSTANCE, vsomeip::ANY_METHOD, register_message_binder);
+      else
+        entity->app->register_message_handler(service_id, instance_id, message_id, register_message_binder);
+    }
+  }
+  Py_END_ALLOW_THREADS
+
+  return Py_BuildValue("i", result);
+}
+
+static PyObject *vsomeip_offer_service(PyObject *self, PyObject *args) {
+  int service_id, instance_id;
+  int version_major = 0x00, version_minor = 0x00;
+  int result = 0;
+  std::string name;
+  char* str_pointer;
+
+  if (!PyArg_ParseTuple(args, "siiii", &str_pointer, &service_id, &instance_id, &version_major, &version_minor)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  name = std::string(str_pointer);
+
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  {  // GIL restored after unlocking
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+    entity->app->offer_service(service_id, instance_id, version_major, version_minor);
+    entity->offered.insert(std::make_pair(service_id, instance_id));
+  }
+  Py_END_ALLOW_THREADS
+
+  return Py_BuildValue("i", result);
+}
+
+/* request, returns request_id or NULL with exception */
+static PyObject *send_request(vsomeip_Entity *entity, int service_id, int instance_id, int method_id, int type, PyObject *data, int timeout_ms) {
+  request_t result = 0;
+
+  if (PyObject_CheckBuffer(data)) {
+      bool is_tcp = false;
+      if (type == -1)
+        is_tcp = true;
+
+      PAYLOAD_LOCK();
+
+      std::shared_ptr<vsomeip::payload> payload = payload_unpack(data);
+      if (!payload) {
+        entity->stats->send_errors.fetch_add(1, std::memory_order_relaxed);
+        return NULL;
+      }
+      entity->stats->sent(dispatch_key(service_id, instance_id, method_id), payload);
+
+      std::shared_ptr<vsomeip::message> its_request = vsomeip::runtime::get()->create_request(is_tcp);
+      its_request->set_service(service_id);
+      its_request->set_instance(instance_id);
+      its_request->set_method(method_id);
+      its_request->set_payload(payload);
+
+      Py_BEGIN_ALLOW_THREADS
+      {  // GIL restored after unlocking
+        std::lock_guard<std::mutex> its_lock(*entity->mutex);
+        entity->app->send(its_request);
+
+        result = request_id(its_request->get_client(), its_request->get_session());
+        if (timeout_ms > 0)
+          entity->calls->track(result, timeout_ms);
+      }
+      Py_END_ALLOW_THREADS
+  }
+  //Py_DECREF(data);
+
+  return PyLong_FromUnsignedLong(result);
+}
+
+static PyObject *vsomeip_send_service(PyObject *self, PyObject *args) {
+  int service_id, instance_id, method_id;
+  PyObject *data;
+  int type = 0;
+  int timeout_ms = 0;
+  std::string name;
+  char* str_pointer;
+
+  if (!PyArg_ParseTuple(args, "siiiiO|i", &str_pointer, &service_id, &instance_id, &method_id, &type, &data, &timeout_ms)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  name = std::string(str_pointer);
+
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
+
+  return send_request(entity.get(), service_id, instance_id, method_id, type, data, timeout_ms);
+}
+
+/* send(handle, service, instance, method, type, data[, timeout_ms]) */
+static PyObject *vsomeip_send(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+  int values[5] = {0, 0, 0, 0, 0};  // service, instance, method, type, timeout_ms
+
+  if (nargs < 6 || nargs > 7) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  vsomeip_Entity *entity = handle_unpack(args[0]);
+  if (!entity || !fast_ints(args, 1, 4, values) || (nargs == 7 && !fast_ints(args, 6, 1, values + 4)))
+    return NULL;
+
+  return send_request(entity, values[0], values[1], values[2], values[3], args[5], values[4]);
+}
+
+/* response built from the request id, for requests answered after their callback returned */
+static PyObject *vsomeip_respond(PyObject *self, PyObject *args) {
+  PyObject *handle_object, *data;
+  int service_id, instance_id, method_id;
+  unsigned int request;
+  int is_tcp = 0;
+  int result = 0;
+
+  if (!PyArg_ParseTuple(args, "OiiiIO|p", &handle_object, &service_id, &instance_id, &method_id, &request, &data, &is_tcp))
+    return NULL;
+
+  vsomeip_Entity *entity = handle_unpack(handle_object);
+  if (!entity)
+    return NULL;
+
+  PAYLOAD_LOCK();
+
+  std::shared_ptr<vsomeip::payload> payload = payload_unpack(data);
+  if (!payload) {
+    entity->stats->send_errors.fetch_add(1, std::memory_order_relaxed);
+    return NULL;
+  }
+  entity->stats->sent(dispatch_key(service_id, instance_id, method_id), payload);
+
+  std::shared_ptr<vsomeip::message> its_response = vsomeip::runtime::get()->create_message(is_tcp);
+  its_response->set_service(service_id);
+  its_response->set_instance(instance_id);
+  its_response->set_method(method_id);
+  its_response->set_client((client_t) (request >> 16));
+  its_response->set_session((session_t) (request & 0xFFFF));
+  its_response->set_message_type(vsomeip::message_type_e::MT_RESPONSE);
+  its_response->set_return_code(vsomeip::return_code_e::E_OK);
+  its_response->set_payload(payload);
+
+  Py_BEGIN_ALLOW_THREADS
+  {  // GIL restored after unlocking
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+    entity->app->send(its_response);
+  }
+  Py_END_ALLOW_THREADS
+
+  return Py_BuildValue("i", result);
+}
+
+static PyObject *vsomeip_call_rtt(PyObject *self, PyObject *args) {
+  int service_id, instance_id;
+  unsigned int request_id;
+  std::string name;
+  char* str_pointer;
+
+  if (!PyArg_ParseTuple(args, "siiI", &str_pointer, &service_id, &instance_id, &request_id)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  name = std::string(str_pointer);
+
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
+
+  long long result = entity->calls->rtt(request_id);
+
+  return Py_BuildValue("L", result);
+}
+
+static PyObject *vsomeip_expire_calls(PyObject *self, PyObject *args) {
+  int service_id, instance_id;
+  std::string name;
+  char* str_pointer;
+
+  if (!PyArg_ParseTuple(args, "sii", &str_pointer, &service_id, &instance_id)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  name = std::string(str_pointer);
+
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
+
+  std::list<request_t> expired = entity->calls->expire();
+
+  PyObject *result = PyList_New(0);
+  for (request_t request_id : expired) {
+    PyObject *item = PyLong_FromUnsignedLong(request_id);
+    PyList_Append(result, item);
+    Py_DECREF(item);
+  }
+  return result;
+}
+
+/* drain queued messages, NULL with exception */
+static PyObject *poll_queue(vsomeip_Entity *entity, int max_items, int timeout_ms) {
+  std::shared_ptr<vsomeip_Queue> queue = entity->queue;
+  bool zero_copy = entity->zero_copy;
+  if (!queue) {
+    PyErr_SetString(PyExc_RuntimeError, "application not created with a queue!");
+    return NULL;
+  }
+
+  if (timeout_ms > 0 && queue->depth() == 0) {
+    Py_BEGIN_ALLOW_THREADS
+    queue->wait(timeout_ms);
+    Py_END_ALLOW_THREADS
+  }
 
-  return Py_BuildValue("i", result);
+  PyObject *result = PyList_New(0);
+  std::shared_ptr<vsomeip::message> message;
+  for (int count = 0; (max_items <= 0 || count < max_items) && queue->pop(message); count++) {
+    PyObject *item = message_pack(message, zero_copy);
+    if (item == NULL) {
+      Py_DECREF(result);
+      return NULL;
+    }
+    PyList_Append(result, item);
+    Py_DECREF(item);
+  }
+  return result;
 }
 
-static PyObject *vsomeip_request_service(PyObject *self, PyObject *args) {
-  std::lock_guard<std::mutex> guard(_mutex);
-
+static PyObject *vsomeip_poll(PyObject *self, PyObject *args) {
   int service_id, instance_id;
-  int result = 0;
-  int version_major = 0x00, version_minor = 0x00;
+  int max_items = 0;
+  int timeout_ms = 0;
   std::string name;
   char* str_pointer;
 
-  if (!PyArg_ParseTuple(args, "siiii", &str_pointer, &service_id, &instance_id, &version_major, &version_minor))
+  if (!PyArg_ParseTuple(args, "sii|ii", &str_pointer, &service_id, &instance_id, &max_items, &timeout_ms)) {
     PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
   name = std::string(str_pointer);
 
-  auto app = _entity_mapping[name][service_id][instance_id].app;
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
 
-  app->request_service(service_id, instance_id);
+  return poll_queue(entity.get(), max_items, timeout_ms);
+}
 
-  return Py_BuildValue("i", result);
+/* poll_handle(handle, max_items, timeout_ms) */
+static PyObject *vsomeip_poll_handle(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+  int values[2];  // max_items, timeout_ms
+
+  if (nargs != 3) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+  vsomeip_Entity *entity = handle_unpack(args[0]);
+  if (!entity || !fast_ints(args, 1, 2, values))
+    return NULL;
+
+  return poll_queue(entity, values[0], values[1]);
 }
 
-static PyObject *vsomeip_stop(PyObject *self, PyObject *args) {
+/* methods blocking (instead of rejected/dropped) once the inbox is full */
+static PyObject *vsomeip_inbox_critical(PyObject *self, PyObject *args) {
+  PyObject *handle_object, *methods_object;
   int service_id, instance_id;
   int result = 0;
-  std::string name;
-  char* str_pointer;
-
-  if (!PyArg_ParseTuple(args, "sii", &str_pointer, &service_id, &instance_id))
-    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
-  name = std::string(str_pointer);
+  std::vector<int> methods;
 
-  auto app = _entity_mapping[name][service_id][instance_id].app;
-  auto my_thread = _entity_mapping[name][service_id][instance_id].app_thread;
+  if (!PyArg_ParseTuple(args, "OiiO", &handle_object, &service_id, &instance_id, &methods_object))
+    return NULL;
 
-  try {
-     app->stop_offer_service(service_id, instance_id);
-     app->clear_all_handler();  // unregister all registered handlers
-     app->release_service(service_id, instance_id);
-
-     std::this_thread::sleep_for(chrono::milliseconds(125));  //  feel good wait, get messages out!
-     return Py_BuildValue("i", result);
-
-     if(app->is_routing()) {
-       app->set_routing_state(vsomeip::routing_state_e::RS_SHUTDOWN); // Note:  tracing code it does not do anything for SHUTDOWN!
-    #ifdef __unix__
-        kill(my_thread->native_handle(), SIGTERM);
-    #else
-        TerminateThread(my_thread->native_handle(), SIGTERM);
-    #endif
-/*
-       // vsomeip does weird checks if on the same thread to not block the stopping of router
-       app->stop();
-       if (std::this_thread::get_id() != my_thread->get_id())  // else deadlock
-         if (my_thread->joinable())
-           my_thread->join();
-         else
-           my_thread->detach();
-*/
-     } else {
-       app->stop();
-     }
-    //vsomeip::runtime::get()->remove_application(name);
+  vsomeip_Entity *entity = handle_unpack(handle_object);
+  if (!entity || !sequence_ints(methods_object, methods))
+    return NULL;
+  if (!entity->inbox) {
+    PyErr_SetString(PyExc_RuntimeError, "application not created with an inbox limit!");
+    return NULL;
   }
-  catch (...) {
-    PyErr_SetString(PyExc_RuntimeError, "Failed to stop...");
+
+  std::shared_ptr<vsomeip_Inbox> inbox = entity->inbox;
+  Py_BEGIN_ALLOW_THREADS  // never wait on the inbox lock holding the GIL
+  {
+    std::lock_guard<std::mutex> its_lock(inbox->mutex);
+    for (int method_id : methods)
+      inbox->critical.insert(dispatch_key(service_id, instance_id, method_id));
   }
+  Py_END_ALLOW_THREADS
+
   return Py_BuildValue("i", result);
 }
 
-static void start(std::string name_, int service_id_, int instance_id_) {
-  auto app = _entity_mapping[name_][service_id_][instance_id_].app;
-  if(app->is_routing()) {
-       ;
+static PyObject *vsomeip_inbox_status(PyObject *self, PyObject *args) {
+  PyObject *handle_object;
+
+  if (!PyArg_ParseTuple(args, "O", &handle_object))
+    return NULL;
+
+  vsomeip_Entity *entity = handle_unpack(handle_object);
+  if (!entity)
+    return NULL;
+  if (!entity->inbox) {
+    PyErr_SetString(PyExc_RuntimeError, "application not created with an inbox limit!");
+    return NULL;
+  }
+
+  std::shared_ptr<vsomeip_Inbox> inbox = entity->inbox;
+  size_t depth, limit;
+  unsigned long long coalesced, rejected, dropped, blocked;
+  Py_BEGIN_ALLOW_THREADS  // never wait on the inbox lock holding the GIL
+  {
+    std::lock_guard<std::mutex> its_lock(inbox->mutex);
+    depth = inbox->entries.size();
+    limit = inbox->limit;
+    coalesced = inbox->coalesced;
+    rejected = inbox->rejected;
+    dropped = inbox->dropped;
+    blocked = inbox->blocked;
   }
-  app->start();
+  Py_END_ALLOW_THREADS
+
+  return Py_BuildValue("{s:n,s:n,s:K,s:K,s:K,s:K}", "depth", (Py_ssize_t) depth, "limit", (Py_ssize_t) limit,
+                       "coalesced", coalesced, "rejected", rejected, "dropped", dropped, "blocked", blocked);
 }
 
-static PyObject *vsomeip_start(PyObject *self, PyObject *args) {
-  std::lock_guard<std::mutex> guard(_mutex);
+/*
+ * {'messages': {(service, instance, id): {'in', 'in_bytes', 'out', 'out_bytes', 'callbacks', 'filtered'}},
+ *  'callback_us': histogram, 'gil_wait_us': histogram, 'errors': {'send', 'notify', 'callback'}, 'availability_flaps'}
+ */
+static PyObject *vsomeip_stats(PyObject *self, PyObject *args) {
+  PyObject *handle_object;
+
+  if (!PyArg_ParseTuple(args, "O", &handle_object))
+    return NULL;
+
+  vsomeip_Entity *entity = handle_unpack(handle_object);
+  if (!entity)
+    return NULL;
+  std::shared_ptr<vsomeip_Stats> stats = entity->stats;
+
+  PyObject *messages = PyDict_New();
+  std::shared_ptr<const vsomeip_CounterTable> its_table = std::atomic_load(&stats->table);
+  for (auto &its_entry : *its_table) {
+    const vsomeip_Counters &its_counters = *its_entry.second;
+    PyObject *key = Py_BuildValue("(iii)", (int) ((its_entry.first >> 32) & 0xFFFF), (int) ((its_entry.first >> 16) & 0xFFFF), (int) (its_entry.first & 0xFFFF));
+    PyObject *value = Py_BuildValue("{s:K,s:K,s:K,s:K,s:K,s:K}",
+                                    "in", its_counters.messages_in.load(std::memory_order_relaxed),
+                                    "in_bytes", its_counters.bytes_in.load(std::memory_order_relaxed),
+                                    "out", its_counters.messages_out.load(std::memory_order_relaxed),
+                                    "out_bytes", its_counters.bytes_out.load(std::memory_order_relaxed),
+                                    "callbacks", its_counters.callbacks.load(std::memory_order_relaxed),
+                                    "filtered", its_counters.filtered.load(std::memory_order_relaxed));
+    PyDict_SetItem(messages, key, value);
+    Py_DECREF(key);
+    Py_DECREF(value);
+  }
 
-  int result = 0;
-  std::string name;
+  return Py_BuildValue("{s:N,s:N,s:N,s:{s:K,s:K,s:K},s:K}",
+                       "messages", messages,
+                       "callback_us", stats->callback_us.pack(),
+                       "gil_wait_us", stats->gil_wait_us.pack(),
+                       "errors",
+                         "send", stats->send_errors.load(std::memory_order_relaxed),
+                         "notify", stats->notify_errors.load(std::memory_order_relaxed),
+                         "callback", stats->callback_errors.load(std::memory_order_relaxed),
+                       "availability_flaps", stats->availability_flaps.load(std::memory_order_relaxed));
+}
+
+static PyObject *vsomeip_queue_status(PyObject *self, PyObject *args) {
   int service_id, instance_id;
+  std::string name;
   char* str_pointer;
 
-  if (!PyArg_ParseTuple(args, "sii", &str_pointer, &service_id, &instance_id))
+  if (!PyArg_ParseTuple(args, "sii", &str_pointer, &service_id, &instance_id)) {
     PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
   name = std::string(str_pointer);
-  auto app = _entity_mapping[name][service_id][instance_id].app;
-  auto instance = _entity_mapping[name][service_id][instance_id];
-
-  _entity_mapping[name][service_id][instance_id].app_thread = std::make_shared<std::thread>(std::bind(&start, name, service_id, instance_id));
-  _entity_mapping[name][service_id][instance_id].app_thread->detach();
 
-  std::this_thread::sleep_for(chrono::milliseconds(125));  // todo: know when application is actually started
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
 
-  return Py_BuildValue("i", result);
+  auto queue = entity->queue;
+  if (!queue)
+    return Py_BuildValue("(nK)", (Py_ssize_t)0, (unsigned long long)0);
+  return Py_BuildValue("(nK)", (Py_ssize_t)queue->depth(), (unsigned long long)queue->dropped.load());
 }
 
-static PyObject *vsomeip_discovery_services(PyObject *self, PyObject *args) {
-  std::lock_guard<std::mutex> guard(_mutex);
+/* offer_events(handle, service, instance, events, groups), each event in all groups */
+static PyObject *vsomeip_offer_events(PyObject *self, PyObject *args) {
+  PyObject *handle, *events_object, *groups_object;
   int service_id, instance_id;
   int result = 0;
-  std::string name;
-  PyObject *callback_object;
-  char* str_pointer;
+  std::vector<int> events, groups;
 
-  if (!PyArg_ParseTuple(args, "siiO", &str_pointer, &service_id, &instance_id, &callback_object))
+  if (!PyArg_ParseTuple(args, "OiiOO", &handle, &service_id, &instance_id, &events_object, &groups_object)) {
     PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
-  name = std::string(str_pointer);
-
-  // make sure last argument is a function
-  if (!PyCallable_Check(callback_object)) {
-    PyErr_SetString(PyExc_TypeError, "need a callable object!");
+    return NULL;
   }
 
-  Py_XINCREF(callback_object); // add a reference to new callback
-  _entity_mapping[name][service_id][instance_id].discovery[0].push_back(callback_object);
+  vsomeip_Entity *entity = handle_unpack(handle);
+  if (!entity || !sequence_ints(events_object, events) || !sequence_ints(groups_object, groups))
+    return NULL;
+
+  std::set<vsomeip::eventgroup_t> its_groups;
+  for (int group_id : groups)
+    its_groups.insert((uint16_t) group_id);
+
+  auto app = entity->app;
+
+  Py_BEGIN_ALLOW_THREADS
+  {  // GIL restored after unlocking
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+    for (int event_id : events) {
+// windows creates a tightly coupled library and thus cannot pass complex data types, see: patch file for changes needed to vsomeip!
+#ifdef __unix__
+      app->offer_event(service_id, instance_id, static_cast<vsomeip::event_t>(event_id), its_groups,
+                            vsomeip::event_type_e::ET_FIELD, std::chrono::milliseconds::zero(),
+                            false, true, nullptr, vsomeip::reliability_type_e::RT_UNKNOWN);
+#else
+      for (vsomeip::eventgroup_t group_id : its_groups) {
+        uint16_t _groups[] = {(uint16_t)group_id};
+        app->offer_event_std(service_id, instance_id, static_cast<vsomeip::event_t>(event_id), _groups,
+                              vsomeip::event_type_e::ET_FIELD, std::chrono::milliseconds::zero(),
+                              false, true, nullptr, vsomeip::reliability_type_e::RT_UNKNOWN);
+      }
+#endif
+    }
+  }
+  Py_END_ALLOW_THREADS
 
   return Py_BuildValue("i", result);
 }
 
-static PyObject *vsomeip_register_message(PyObject *self, PyObject *args) {
-  std::lock_guard<std::mutex> guard(_mutex);
-  int service_id, instance_id, message_id;
+/* request events and subscribe their eventgroups (once each), caller holds the application lock without the GIL */
+static void subscribe_events(vsomeip_Entity *entity_, int service_id_, int instance_id_, const std::vector<int> &events_,
+                             const std::set<vsomeip::eventgroup_t> &groups_, int version_major_) {
+  for (int event_id : events_) {
+// windows creates a tightly coupled library and thus cannot pass complex data types, see: patch file for changes needed to vsomeip!
+#ifdef __unix__
+    entity_->app->request_event(service_id_, instance_id_, event_id, groups_, vsomeip::event_type_e::ET_FIELD);
+#else
+    for (vsomeip::eventgroup_t group_id : groups_) {
+      uint16_t _groups[] = {(uint16_t)group_id};
+      entity_->app->request_event_std(service_id_, instance_id_, event_id, _groups, vsomeip::event_type_e::ET_FIELD);
+    }
+#endif
+  }
+  for (vsomeip::eventgroup_t group_id : groups_)
+    entity_->app->subscribe(service_id_, instance_id_, group_id, version_major_);
+}
+
+/*
+ * request_events(handle, service, instance, events, groups, major, callback, message=False, changes=False), each eventgroup
+ * subscribed once, values cached (see 'get_field')
+ */
+static PyObject *vsomeip_request_events(PyObject *self, PyObject *args) {
+  PyObject *handle, *events_object, *groups_object, *callback_object;
+  int service_id, instance_id, version_major;
+  int is_message = 0;
+  int is_changes = 0;
   int result = 0;
-  std::string name;
-  PyObject *callback_object;
-  char* str_pointer;
+  std::vector<int> events, groups;
 
-  if (!PyArg_ParseTuple(args, "siiiO", &str_pointer, &service_id, &instance_id, &message_id, &callback_object))
+  if (!PyArg_ParseTuple(args, "OiiOOiO|pp", &handle, &service_id, &instance_id, &events_object, &groups_object, &version_major, &callback_object,
+                        &is_message, &is_changes)) {
     PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
-  name = std::string(str_pointer);
+    return NULL;
+  }
 
   // make sure last argument is a function
   if (!PyCallable_Check(callback_object)) {
     PyErr_SetString(PyExc_TypeError, "need a callable object!");
+    return NULL;
   }
 
-  Py_XINCREF(callback_object); // add a reference to new callback
-  _entity_mapping[name][service_id][instance_id].callback[message_id].push_back(callback_object);
+  vsomeip_Entity *entity = handle_unpack(handle);
+  if (!entity || !sequence_ints(events_object, events) || !sequence_ints(groups_object, groups))
+    return NULL;
+
+  std::set<vsomeip::eventgroup_t> its_groups;
+  for (int group_id : groups)
+    its_groups.insert((uint16_t) group_id);
+
+  std::list<dispatch_t> keys;
+  for (int event_id : events)
+    keys.push_back(dispatch_key(service_id, instance_id, event_id));
 
-  auto app = _entity_mapping[name][service_id][instance_id].app;
-  auto instance = _entity_mapping[name][service_id][instance_id];
+  Py_XINCREF(callback_object); // add a reference to new callback, once for all events
+  auto app = entity->app;
 
-  auto ptr_to_func = std::mem_fn(&vsomeip_Entity::message_handler);
-  auto register_message_binder = std::bind(ptr_to_func, instance, std::placeholders::_1);  // MAGIC!!!!!!!!!!!!!!!!!!
-  if(message_id == 0xFFFF)
-    app->register_message_handler(vsomeip::ANY_SERVICE, vsomeip::ANY_INSTANCE, vsomeip::ANY_METHOD, register_message_binder);
-  else
-    app->register_message_handler(service_id, instance_id, message_id, register_message_binder);
+  Py_BEGIN_ALLOW_THREADS
+  {  // GIL restored after unlocking
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+
+    auto ptr_to_func = std::mem_fn(&vsomeip_Entity::message_handler);
+    auto register_message_binder = std::bind(ptr_to_func, entity, std::placeholders::_1);
+    entity->add_fields(keys, is_changes);
+    for (dispatch_t key : entity->add_callbacks(keys, callback_object, is_message))
+      app->register_message_handler(service_id, instance_id, static_cast<vsomeip::method_t>(key & 0xFFFF), register_message_binder);
+
+    subscribe_events(entity, service_id, instance_id, events, its_groups, version_major);
+  }
+  Py_END_ALLOW_THREADS
 
   return Py_BuildValue("i", result);
 }
 
-static PyObject *vsomeip_offer_service(PyObject *self, PyObject *args) {
-  std::lock_guard<std::mutex> guard(_mutex);
+/* request_fields(handle, service, instance, events, groups, major, changes=False), values cached (see 'get_field'), callbacks optional */
+static PyObject *vsomeip_request_fields(PyObject *self, PyObject *args) {
+  PyObject *handle, *events_object, *groups_object;
+  int service_id, instance_id, version_major;
+  int is_changes = 0;
+  int result = 0;
+  std::vector<int> events, groups;
+
+  if (!PyArg_ParseTuple(args, "OiiOOi|p", &handle, &service_id, &instance_id, &events_object, &groups_object, &version_major, &is_changes))
+    return NULL;
+
+  vsomeip_Entity *entity = handle_unpack(handle);
+  if (!entity || !sequence_ints(events_object, events) || !sequence_ints(groups_object, groups))
+    return NULL;
+
+  std::set<vsomeip::eventgroup_t> its_groups;
+  for (int group_id : groups)
+    its_groups.insert((uint16_t) group_id);
+
+  std::list<dispatch_t> keys;
+  for (int event_id : events)
+    keys.push_back(dispatch_key(service_id, instance_id, event_id));
+
+  Py_BEGIN_ALLOW_THREADS
+  {  // GIL restored after unlocking
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+    std::shared_ptr<const vsomeip_Dispatch> its_dispatch = std::atomic_load(&entity->dispatch);
+
+    auto ptr_to_func = std::mem_fn(&vsomeip_Entity::message_handler);
+    auto register_message_binder = std::bind(ptr_to_func, entity, std::placeholders::_1);
+    for (dispatch_t key : entity->add_fields(keys, is_changes))
+      if (its_dispatch->count(key) == 0)  // else registered with its callbacks
+        entity->app->register_message_handler(service_id, instance_id, static_cast<vsomeip::method_t>(key & 0xFFFF), register_message_binder);
+
+    subscribe_events(entity, service_id, instance_id, events, its_groups, version_major);  // groups may differ, as 'request_events'
+  }
+  Py_END_ALLOW_THREADS
+
+  return Py_BuildValue("i", result);
+}
+
+/* one filter from its spec tuple (see 'vsomeip_py.filters'), false with exception if not valid */
+static bool filter_unpack(PyObject *spec_, vsomeip_Filter &filter_) {
+  if (!PyTuple_Check(spec_) || PyTuple_GET_SIZE(spec_) < 1 || !PyUnicode_Check(PyTuple_GET_ITEM(spec_, 0))) {
+    PyErr_SetString(PyExc_TypeError, "need a filter spec!");
+    return false;
+  }
 
+  const char *kind, *mask, *value, *format;
+  Py_ssize_t offset, mask_length, value_length, format_length;
+  std::string its_kind(PyUnicode_AsUTF8(PyTuple_GET_ITEM(spec_, 0)));
+  if (its_kind == "mask") {
+    if (!PyArg_ParseTuple(spec_, "sny#y#", &kind, &offset, &mask, &mask_length, &value, &value_length))
+      return false;
+    if (offset < 0 || mask_length != value_length) {
+      PyErr_SetString(PyExc_ValueError, "invalid mask filter!");
+      return false;
+    }
+    filter_.kind = vsomeip_Filter::MASK;
+    filter_.offset = offset;
+    filter_.mask.assign((const uint8_t *) mask, (const uint8_t *) mask + mask_length);
+    filter_.value.assign((const uint8_t *) value, (const uint8_t *) value + value_length);
+  } else if (its_kind == "range") {
+    int is_little_endian;
+    if (!PyArg_ParseTuple(spec_, "sns#pdd", &kind, &offset, &format, &format_length, &is_little_endian, &filter_.minimum, &filter_.maximum))
+      return false;
+    if (offset < 0 || format_length != 1 || vsomeip_Filter::format_size(format[0]) == 0) {
+      PyErr_SetString(PyExc_ValueError, "invalid range filter!");
+      return false;
+    }
+    filter_.kind = vsomeip_Filter::RANGE;
+    filter_.offset = offset;
+    filter_.format = format[0];
+    filter_.is_little_endian = is_little_endian;
+  } else if (its_kind == "decimate") {
+    if (!PyArg_ParseTuple(spec_, "sK", &kind, &filter_.every))
+      return false;
+    if (filter_.every == 0) {
+      PyErr_SetString(PyExc_ValueError, "invalid decimate filter!");
+      return false;
+    }
+    filter_.kind = vsomeip_Filter::DECIMATE;
+  } else if (its_kind == "rate") {
+    if (!PyArg_ParseTuple(spec_, "sdd", &kind, &filter_.rate, &filter_.burst))
+      return false;
+    if (filter_.rate <= 0 || filter_.burst < 1) {
+      PyErr_SetString(PyExc_ValueError, "invalid rate filter!");
+      return false;
+    }
+    filter_.kind = vsomeip_Filter::RATE;
+    filter_.tokens = filter_.burst;
+    filter_.last = std::chrono::steady_clock::now();
+  } else if (its_kind == "changed") {
+    if (!PyArg_ParseTuple(spec_, "s", &kind))
+      return false;
+    filter_.kind = vsomeip_Filter::CHANGED;
+  } else {
+    PyErr_Format(PyExc_ValueError, "unknown filter: %s", its_kind.c_str());
+    return false;
+  }
+  return true;
+}
+
+/* filters(handle, service, instance, ids, specs), messages of the ids evaluated natively before the GIL, replaced (none if empty) */
+static PyObject *vsomeip_filters(PyObject *self, PyObject *args) {
+  PyObject *handle, *ids_object, *specs_object;
   int service_id, instance_id;
-  int version_major = 0x00, version_minor = 0x00;
   int result = 0;
-  std::string name;
-  char* str_pointer;
+  std::vector<int> ids;
+
+  if (!PyArg_ParseTuple(args, "OiiOO", &handle, &service_id, &instance_id, &ids_object, &specs_object))
+    return NULL;
+
+  vsomeip_Entity *entity = handle_unpack(handle);
+  if (!entity || !sequence_ints(ids_object, ids))
+    return NULL;
+
+  PyObject *specs = PySequence_Fast(specs_object, "need a sequence of filter specs!");
+  if (specs == NULL)
+    return NULL;
+  std::vector<vsomeip_Filter> filters(PySequence_Fast_GET_SIZE(specs));
+  for (Py_ssize_t i = 0; i < PySequence_Fast_GET_SIZE(specs); i++) {
+    if (!filter_unpack(PySequence_Fast_GET_ITEM(specs, i), filters[i])) {
+      Py_DECREF(specs);
+      return NULL;
+    }
+  }
+  Py_DECREF(specs);
 
-  if (!PyArg_ParseTuple(args, "siiii", &str_pointer, &service_id, &instance_id, &version_major, &version_minor))
-    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
-  name = std::string(str_pointer);
+  std::list<dispatch_t> keys;
+  for (int id : ids)  // 'ANY' as registered, see 'vsomeip_register_message'
+    keys.push_back(id == vsomeip::ANY_METHOD ? ANY_DISPATCH : dispatch_key(service_id, instance_id, id));
 
-  auto app = _entity_mapping[name][service_id][instance_id].app;
-  app->offer_service(service_id, instance_id, version_major, version_minor);
+  Py_BEGIN_ALLOW_THREADS
+  {  // GIL restored after unlocking
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+    entity->set_filters(keys, filters);
+  }
+  Py_END_ALLOW_THREADS
 
   return Py_BuildValue("i", result);
 }
 
-static PyObject *vsomeip_send_service(PyObject *self, PyObject *args) {
-  std::lock_guard<std::mutex> guard(_mutex);
+/* get_field(handle, service, instance, event), latest value (as callbacks receive it) or None if not notified/requested */
+static PyObject *vsomeip_get_field(PyObject *self, PyObject *args) {
+  PyObject *handle;
+  int service_id, instance_id, event_id;
 
-  int service_id, instance_id, method_id;
-  PyObject *data;
-  int type = 0;
-  int result = 0;
-  std::string name;
-  char* str_pointer;
+  if (!PyArg_ParseTuple(args, "Oiii", &handle, &service_id, &instance_id, &event_id))
+    return NULL;
 
-  if (!PyArg_ParseTuple(args, "siiiiO", &str_pointer, &service_id, &instance_id, &method_id, &type, &data))
-    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
-  name = std::string(str_pointer);
+  vsomeip_Entity *entity = handle_unpack(handle);
+  if (!entity)
+    return NULL;
 
-  if (PyObject_TypeCheck(data, &PyByteArray_Type)) {
-      bool is_tcp = false;
-      if (type == -1)
-        is_tcp = true;
+  std::shared_ptr<const vsomeip_Fields> its_fields = std::atomic_load(&entity->fields);
+  auto its_field = its_fields->find(dispatch_key(service_id, instance_id, event_id));
+  if (its_field == its_fields->end())
+    Py_RETURN_NONE;
 
-      std::lock_guard<std::mutex> its_lock(_payload_mutex);
+  std::shared_ptr<vsomeip::payload> its_payload;
+  Py_BEGIN_ALLOW_THREADS  // never wait on the field lock holding the GIL
+  its_payload = its_field->second->get();
+  Py_END_ALLOW_THREADS
+  if (!its_payload)
+    Py_RETURN_NONE;
 
-      std::shared_ptr<vsomeip::message> its_request = vsomeip::runtime::get()->create_request(is_tcp);
-      its_request->set_service(service_id);
-      its_request->set_instance(instance_id);
-      its_request->set_method(method_id);
-      its_request->set_payload(payload_unpack(data));
+  return payload_pack(its_payload, entity->zero_copy);
+}
+
+/*
+ * capture(handle, service, instance, events, groups, major, size, buffer), events subscribed and recorded into buffer
+ * (see 'vsomeip_Capture') instead of callbacks, returns capture for 'capture_swap'
+ */
+static PyObject *vsomeip_capture(PyObject *self, PyObject *args) {
+  PyObject *handle, *events_object, *groups_object, *buffer_object;
+  int service_id, instance_id, version_major;
+  Py_ssize_t size;
+  std::vector<int> events, groups;
+
+  if (!PyArg_ParseTuple(args, "OiiOOinO", &handle, &service_id, &instance_id, &events_object, &groups_object, &version_major, &size, &buffer_object))
+    return NULL;
+
+  if (size < 0) {
+    PyErr_SetString(PyExc_ValueError, "negative payload size!");
+    return NULL;
+  }
 
-      auto app = _entity_mapping[name][service_id][instance_id].app;
-      app->send(its_request);
+  vsomeip_Entity *entity = handle_unpack(handle);
+  if (!entity || !sequence_ints(events_object, events) || !sequence_ints(groups_object, groups))
+    return NULL;
 
-      int request_id = its_request->get_client() + its_request->get_session();
-      result = request_id; // making the pt
+  std::set<vsomeip::eventgroup_t> its_groups;
+  for (int group_id : groups)
+    its_groups.insert((uint16_t) group_id);
+
+  std::list<dispatch_t> keys;
+  for (int event_id : events)
+    keys.push_back(dispatch_key(service_id, instance_id, event_id));
+
+  Py_buffer its_buffer;
+  if (PyObject_GetBuffer(buffer_object, &its_buffer, PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS) != 0)
+    return NULL;
+
+  auto its_capture = std::make_shared<vsomeip_Capture>(size);
+  Py_buffer its_old;
+  size_t count;
+  unsigned long long dropped;
+  its_capture->swap(&its_buffer, its_old, count, dropped);  // not shared yet
+
+  PyObject *capsule = PyCapsule_New(new std::shared_ptr<vsomeip_Capture>(its_capture), CAPTURE_NAME, capture_destructor);
+  if (capsule == NULL) {
+    PyBuffer_Release(&its_buffer);
+    return NULL;
   }
-  //Py_DECREF(data);
 
-  return Py_BuildValue("i", result);
+  Py_BEGIN_ALLOW_THREADS
+  {  // GIL restored after unlocking
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+    entity->add_capture(keys, its_capture);
+
+    auto ptr_to_func = std::mem_fn(&vsomeip_Entity::message_handler);
+    auto register_message_binder = std::bind(ptr_to_func, entity, std::placeholders::_1);
+    for (dispatch_t key : keys)
+      entity->app->register_message_handler(service_id, instance_id, static_cast<vsomeip::method_t>(key & 0xFFFF), register_message_binder);
+
+    subscribe_events(entity, service_id, instance_id, events, its_groups, version_major);
+  }
+  Py_END_ALLOW_THREADS
+
+  return capsule;
 }
 
-static PyObject *vsomeip_request_event_service(PyObject *self, PyObject *args) {
-  std::lock_guard<std::mutex> guard(_mutex);
+/* capture_swap(capture, buffer=None), recording continues into buffer (none: dropped), (records, dropped) of the one swapped out */
+static PyObject *vsomeip_capture_swap(PyObject *self, PyObject *args) {
+  PyObject *capture_object, *buffer_object = Py_None;
+
+  if (!PyArg_ParseTuple(args, "O|O", &capture_object, &buffer_object))
+    return NULL;
+
+  vsomeip_Capture *capture = capture_unpack(capture_object);
+  if (!capture)
+    return NULL;
+
+  Py_buffer its_buffer;
+  bool has_buffer = buffer_object != Py_None;
+  if (has_buffer && PyObject_GetBuffer(buffer_object, &its_buffer, PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS) != 0)
+    return NULL;
+
+  Py_buffer its_old;
+  size_t count;
+  unsigned long long dropped;
+  bool had_buffer;
+  Py_BEGIN_ALLOW_THREADS  // never wait on the capture lock holding the GIL
+  had_buffer = capture->swap(has_buffer ? &its_buffer : NULL, its_old, count, dropped);
+  Py_END_ALLOW_THREADS
+  if (had_buffer)
+    PyBuffer_Release(&its_old);
+
+  return Py_BuildValue("nK", (Py_ssize_t) count, dropped);
+}
 
+static PyObject *vsomeip_request_event_service(PyObject *self, PyObject *args) {
   int service_id, instance_id, event_id, group_id;
   int version_major = 0x00, version_minor = 0x00;
   int result = 0;
   std::string name;
   char* str_pointer;
 
-  if (!PyArg_ParseTuple(args, "siiiiii", &str_pointer, &service_id, &instance_id, &event_id, &group_id, &version_major, &version_minor))
+  if (!PyArg_ParseTuple(args, "siiiiii", &str_pointer, &service_id, &instance_id, &event_id, &group_id, &version_major, &version_minor)) {
     PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
   name = std::string(str_pointer);
 
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
+
   std::set<vsomeip::eventgroup_t> its_groups;
   its_groups.insert(group_id);
 
-  auto app = _entity_mapping[name][service_id][instance_id].app;
+  auto app = entity->app;
 
+  Py_BEGIN_ALLOW_THREADS
+  {  // GIL restored after unlocking
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
 // windows creates a tightly coupled library and thus cannot pass complex data types, see: patch file for changes needed to vsomeip!
 #ifdef __unix__
-  app->request_event(service_id, instance_id, event_id, its_groups, vsomeip::event_type_e::ET_FIELD);
+    app->request_event(service_id, instance_id, event_id, its_groups, vsomeip::event_type_e::ET_FIELD);
 #else
-  uint16_t _groups[] = {(uint16_t)group_id};
-  app->request_event_std(service_id, instance_id, event_id, _groups, vsomeip::event_type_e::ET_FIELD);
+    uint16_t _groups[] = {(uint16_t)group_id};
+    app->request_event_std(service_id, instance_id, event_id, _groups, vsomeip::event_type_e::ET_FIELD);
 #endif
-  app->subscribe(service_id, instance_id, group_id, version_major);
+    app->subscribe(service_id, instance_id, group_id, version_major);
+  }
+  Py_END_ALLOW_THREADS
 
   return Py_BuildValue("i", result);
 }
 
 static PyObject *vsomeip_unrequest_event_service(PyObject *self, PyObject *args) {
-  std::lock_guard<std::mutex> guard(_mutex);
-
   int service_id, instance_id, event_id, group_id;
   int result = 0;
   std::string name;
   char* str_pointer;
 
-  if (!PyArg_ParseTuple(args, "siiii", &str_pointer, &service_id, &instance_id, &event_id, &group_id))
+  if (!PyArg_ParseTuple(args, "siiii", &str_pointer, &service_id, &instance_id, &event_id, &group_id)) {
     PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
   name = std::string(str_pointer);
 
-  std::set<vsomeip::eventgroup_t> its_groups;
-  its_groups.insert(group_id);
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
 
-  auto app = _entity_mapping[name][service_id][instance_id].app;
-  if (group_id != vsomeip::ANY_EVENT)
-      app->unsubscribe(service_id, instance_id, group_id);
-  else
-      app->release_event(service_id, instance_id, event_id);
+  auto app = entity->app;
+
+  Py_BEGIN_ALLOW_THREADS
+  {  // GIL restored after unlocking
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+    if (group_id != vsomeip::ANY_EVENT)
+        app->unsubscribe(service_id, instance_id, group_id);
+    else
+        app->release_event(service_id, instance_id, event_id);
+  }
+  Py_END_ALLOW_THREADS
 
   return Py_BuildValue("i", result);
 }
 
-static PyObject *vsomeip_notify_clients(PyObject *self, PyObject *args) {
-  std::lock_guard<std::mutex> guard(_mutex);
+/* fire event, NULL with exception */
+static PyObject *notify_event(vsomeip_Entity *entity, int service_id, int instance_id, int event_id, PyObject *data) {
+  int result = 0;
+
+  {
+    PAYLOAD_LOCK();
+
+    std::shared_ptr<vsomeip::payload> payload = payload_unpack(data);
+    if (!payload) {
+      entity->stats->notify_errors.fetch_add(1, std::memory_order_relaxed);
+      return NULL;
+    }
+    entity->stats->sent(dispatch_key(service_id, instance_id, event_id), payload);
+
+    Py_BEGIN_ALLOW_THREADS
+    {  // GIL restored after unlocking
+      std::lock_guard<std::mutex> its_lock(*entity->mutex);
+      entity->app->notify(service_id, instance_id, event_id, payload, true);
+    }
+    Py_END_ALLOW_THREADS
+  }
+  //Py_DECREF(data);
+
+  return PyLong_FromLong(result);
+}
+
+typedef std::vector<std::pair<vsomeip::event_t, std::shared_ptr<vsomeip::payload>>> vsomeip_Events;
+
+/* fire events, one lock and one GIL release for all */
+static void notify_events(vsomeip_Entity *entity, int service_id, int instance_id, const vsomeip_Events &events) {
+  Py_BEGIN_ALLOW_THREADS
+  {  // GIL restored after unlocking
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
+    for (auto &its_event : events) {
+      entity->stats->sent(dispatch_key(service_id, instance_id, its_event.first), its_event.second);
+      entity->app->notify(service_id, instance_id, its_event.first, its_event.second, true);
+    }
+  }
+  Py_END_ALLOW_THREADS
+}
+
+/* notify_many(handle, service, instance, [(event, data), ...]) */
+static PyObject *vsomeip_notify_many(PyObject *self, PyObject *args) {
+  PyObject *handle, *items;
+  int service_id, instance_id;
+  int result = 0;
+
+  if (!PyArg_ParseTuple(args, "OiiO", &handle, &service_id, &instance_id, &items)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+
+  vsomeip_Entity *entity = handle_unpack(handle);
+  if (!entity)
+    return NULL;
+
+  PyObject *fast = PySequence_Fast(items, "need a sequence of (event, data)!");
+  if (fast == NULL)
+    return NULL;
+
+  Py_ssize_t size = PySequence_Fast_GET_SIZE(fast);
+  PyObject **its_items = PySequence_Fast_ITEMS(fast);
+  vsomeip_Events events;
+  events.reserve(size);
+
+  for (Py_ssize_t i = 0; i < size; i++) {
+    int event_id;
+    PyObject *data;
+    if (!PyArg_ParseTuple(its_items[i], "iO", &event_id, &data)) {
+      Py_DECREF(fast);
+      return NULL;
+    }
+
+    PAYLOAD_LOCK();
+    std::shared_ptr<vsomeip::payload> payload = payload_unpack(data);
+    if (!payload) {
+      entity->stats->notify_errors.fetch_add(1, std::memory_order_relaxed);
+      Py_DECREF(fast);
+      return NULL;
+    }
+    events.emplace_back(static_cast<vsomeip::event_t>(event_id), payload);
+#ifndef __unix__
+    notify_events(entity, service_id, instance_id, events);  // shared static buffer, fire before next
+    events.clear();
+#endif
+  }
+  Py_DECREF(fast);
+
+  notify_events(entity, service_id, instance_id, events);
+
+  return Py_BuildValue("i", result);
+}
+
+/* notify_frame(handle, service, instance, events, data, offsets), event data from its offset up to the next (last to end) */
+static PyObject *vsomeip_notify_frame(PyObject *self, PyObject *args) {
+  PyObject *handle, *events_object, *offsets_object;
+  Py_buffer view;
+  int service_id, instance_id;
+  int result = 0;
+  std::vector<int> event_ids, offsets;
+
+  if (!PyArg_ParseTuple(args, "OiiOy*O", &handle, &service_id, &instance_id, &events_object, &view, &offsets_object)) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
+
+  vsomeip_Entity *entity = handle_unpack(handle);
+  if (!entity || !sequence_ints(events_object, event_ids) || !sequence_ints(offsets_object, offsets)) {
+    PyBuffer_Release(&view);
+    return NULL;
+  }
+
+  if (event_ids.size() != offsets.size()) {
+    PyBuffer_Release(&view);
+    PyErr_SetString(PyExc_ValueError, "need an offset per event!");
+    return NULL;
+  }
+  for (size_t i = 0; i < offsets.size(); i++) {
+    Py_ssize_t end = i + 1 < offsets.size() ? offsets[i + 1] : view.len;
+    if (offsets[i] < 0 || offsets[i] > end || end > view.len) {
+      PyBuffer_Release(&view);
+      PyErr_SetString(PyExc_ValueError, "offsets must be ascending within data!");
+      return NULL;
+    }
+  }
+
+  vsomeip_Events events;
+  events.reserve(event_ids.size());
+  {
+    PAYLOAD_LOCK();
+    for (size_t i = 0; i < event_ids.size(); i++) {
+      Py_ssize_t end = i + 1 < offsets.size() ? offsets[i + 1] : view.len;
+      events.emplace_back(static_cast<vsomeip::event_t>(event_ids[i]),
+                          payload_create((const vsomeip::byte_t *)view.buf + offsets[i], end - offsets[i]));
+#ifndef __unix__
+      notify_events(entity, service_id, instance_id, events);  // shared static buffer, fire before next
+      events.clear();
+#endif
+    }
+  }
+  PyBuffer_Release(&view);
+
+  notify_events(entity, service_id, instance_id, events);
+
+  return Py_BuildValue("i", result);
+}
 
+static PyObject *vsomeip_notify_clients(PyObject *self, PyObject *args) {
   int service_id, instance_id, event_id;
   PyObject *data;
-  int result = 0;
   std::string name;
   char* str_pointer;
 
-  if (!PyArg_ParseTuple(args, "siiiO", &str_pointer, &service_id, &instance_id, &event_id, &data))
+  if (!PyArg_ParseTuple(args, "siiiO", &str_pointer, &service_id, &instance_id, &event_id, &data)) {
     PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
   name = std::string(str_pointer);
 
-  {
-    std::lock_guard<std::mutex> its_lock(_payload_mutex);
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
 
-    std::shared_ptr<vsomeip::payload> payload = payload_unpack(data);
-    auto app = _entity_mapping[name][service_id][instance_id].app;
-    app->notify(service_id, instance_id, event_id, payload, true);
+  return notify_event(entity.get(), service_id, instance_id, event_id, data);
+}
+
+/* notify(handle, service, instance, event, data) */
+static PyObject *vsomeip_notify(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+  int values[3];  // service, instance, event
+
+  if (nargs != 5) {
+    PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
   }
-  //Py_DECREF(data);
+  vsomeip_Entity *entity = handle_unpack(args[0]);
+  if (!entity || !fast_ints(args, 1, 3, values))
+    return NULL;
 
-  return Py_BuildValue("i", result);
+  return notify_event(entity, values[0], values[1], values[2], args[4]);
 }
 
 static PyObject *vsomeip_offer_event_service(PyObject *self, PyObject *args) {
-  std::lock_guard<std::mutex> guard(_mutex);
-
   int service_id, instance_id, event_id, group_id;
   int result = 0;
   std::string name;
   char* str_pointer;
 
-  if (!PyArg_ParseTuple(args, "siiii",&str_pointer, &service_id, &instance_id, &event_id, &group_id))
+  if (!PyArg_ParseTuple(args, "siiii",&str_pointer, &service_id, &instance_id, &event_id, &group_id)) {
     PyErr_SetString(PyExc_TypeError, PY_INVALID_ARGUMENTS);
+    return NULL;
+  }
   name = std::string(str_pointer);
 
+  std::shared_ptr<vsomeip_Entity> entity = find_entity(name);
+  if (!entity)
+    return NULL;
+
   std::set<vsomeip::eventgroup_t> its_groups;
   its_groups.insert((uint16_t) group_id);
 
-  auto app = _entity_mapping[name][service_id][instance_id].app;
+  auto app = entity->app;
 
+  Py_BEGIN_ALLOW_THREADS
+  {  // GIL restored after unlocking
+    std::lock_guard<std::mutex> its_lock(*entity->mutex);
 // windows creates a tightly coupled library and thus cannot pass complex data types, see: patch file for changes needed to vsomeip!
 #ifdef __unix__
-  app->offer_event(service_id, instance_id, static_cast<vsomeip::event_t>(event_id), its_groups,  
-                        vsomeip::event_type_e::ET_FIELD, std::chrono::milliseconds::zero(), // std::chrono::milliseconds(1000)
-                        false, true, nullptr, vsomeip::reliability_type_e::RT_UNKNOWN);
+    app->offer_event(service_id, instance_id, static_cast<vsomeip::event_t>(event_id), its_groups,  
+                          vsomeip::event_type_e::ET_FIELD, std::chrono::milliseconds::zero(), // std::chrono::milliseconds(1000)
+                          false, true, nullptr, vsomeip::reliability_type_e::RT_UNKNOWN);
 #else
-  uint16_t _groups[] = {(uint16_t)group_id};
-  app->offer_event_std(service_id, instance_id, static_cast<vsomeip::event_t>(event_id), _groups,
-                        vsomeip::event_type_e::ET_FIELD, std::chrono::milliseconds::zero(), // std::chrono::milliseconds(1000)
-                        false, true, nullptr, vsomeip::reliability_type_e::RT_UNKNOWN);
+    uint16_t _groups[] = {(uint16_t)group_id};
+    app->offer_event_std(service_id, instance_id, static_cast<vsomeip::event_t>(event_id), _groups,
+                          vsomeip::event_type_e::ET_FIELD, std::chrono::milliseconds::zero(), // std::chrono::milliseconds(1000)
+                          false, true, nullptr, vsomeip::reliability_type_e::RT_UNKNOWN);
 #endif
+  }
+  Py_END_ALLOW_THREADS
 
   return Py_BuildValue("i", result);
 }
 
+/* message_types(enum), 'Message.type' values */
+static PyObject *vsomeip_message_types(PyObject *self, PyObject *args) {
+  PyObject *types_object;
+
+  if (!PyArg_ParseTuple(args, "O", &types_object))
+    return NULL;
+
+  if (!PyCallable_Check(types_object)) {
+    PyErr_SetString(PyExc_TypeError, "need a callable object!");
+    return NULL;
+  }
+
+  Py_INCREF(types_object);
+  Py_XSETREF(_message_types, types_object);
+
+  Py_RETURN_NONE;
+}
+
 static PyObject *vsomeip_testing(PyObject *self, PyObject *args) {
   int result = 0;
-  vsomeip_create_app(self, args);
+  Py_XDECREF(vsomeip_create_app(self, args));
 
   return Py_BuildValue("i", result);
 }
@@ -587,15 +2863,40 @@ static PyMethodDef PyMethodDef_vsomeip[] = {
     {"create", vsomeip_create_app, METH_VARARGS, "create application"},
     {"start", vsomeip_start, METH_VARARGS, "start vsomeip application"},
     {"stop", vsomeip_stop, METH_VARARGS, "stop vsomeip application"},
+    {"stop_all", vsomeip_stop_all, METH_VARARGS, "stop all vsomeip applications"},
+    {"withdraw", vsomeip_withdraw, METH_VARARGS, "stop offering/requesting a service instance (handle)"},
+    {"wait_registered", vsomeip_wait_registered, METH_VARARGS, "wait until application registered"},
+    {"wait_available", vsomeip_wait_available, METH_VARARGS, "wait until service available"},
     {"register_message", vsomeip_register_message, METH_VARARGS, "register message"},
     {"offer_service", vsomeip_offer_service, METH_VARARGS, "offer service"},
     {"request_service", vsomeip_request_service, METH_VARARGS, "request service"},
     {"send_service", vsomeip_send_service, METH_VARARGS, "request message to service"},
+    {"send", (PyCFunction)(void(*)(void))vsomeip_send, METH_FASTCALL, "request message to service (handle)"},
+    {"respond", vsomeip_respond, METH_VARARGS, "response to request (handle)"},
+    {"call_rtt", vsomeip_call_rtt, METH_VARARGS, "round trip time of responded request"},
+    {"expire_calls", vsomeip_expire_calls, METH_VARARGS, "remove timed out requests"},
     {"offer_event_service", vsomeip_offer_event_service, METH_VARARGS, "offering events"},
+    {"offer_events", vsomeip_offer_events, METH_VARARGS, "offering events, bulk (handle)"},
+    {"request_events", vsomeip_request_events, METH_VARARGS, "requesting/subscribing events, bulk (handle)"},
     {"request_event_service", vsomeip_request_event_service, METH_VARARGS, "requesting/subscribing event"},
     {"unrequest_event_service", vsomeip_unrequest_event_service, METH_VARARGS, "unrequesting/unsubscribing event"},
     {"notify_clients", vsomeip_notify_clients, METH_VARARGS, "fire event"},
+    {"notify", (PyCFunction)(void(*)(void))vsomeip_notify, METH_FASTCALL, "fire event (handle)"},
+    {"notify_many", vsomeip_notify_many, METH_VARARGS, "fire events, bulk (handle)"},
+    {"notify_frame", vsomeip_notify_frame, METH_VARARGS, "fire events from one buffer, bulk (handle)"},
+    {"poll", vsomeip_poll, METH_VARARGS, "drain queued messages"},
+    {"poll_handle", (PyCFunction)(void(*)(void))vsomeip_poll_handle, METH_FASTCALL, "drain queued messages (handle)"},
+    {"queue_status", vsomeip_queue_status, METH_VARARGS, "queue depth and dropped count"},
+    {"stats", vsomeip_stats, METH_VARARGS, "runtime metrics (handle)"},
+    {"inbox_critical", vsomeip_inbox_critical, METH_VARARGS, "methods blocking once inbox full (handle)"},
+    {"inbox_status", vsomeip_inbox_status, METH_VARARGS, "inbox depth and policy counts (handle)"},
+    {"request_fields", vsomeip_request_fields, METH_VARARGS, "requesting/subscribing fields, cached (handle)"},
+    {"get_field", vsomeip_get_field, METH_VARARGS, "latest value of field (handle)"},
+    {"filters", vsomeip_filters, METH_VARARGS, "filters evaluated before the GIL (handle)"},
+    {"capture", vsomeip_capture, METH_VARARGS, "record events into buffer instead of callbacks (handle)"},
+    {"capture_swap", vsomeip_capture_swap, METH_VARARGS, "swap capture buffer, records and dropped"},
     {"discovery_services", vsomeip_discovery_services, METH_VARARGS, "when services discovered"},
+    {"message_types", vsomeip_message_types, METH_VARARGS, "enum of message types, for 'Message.type'"},
     {"testing", vsomeip_testing, METH_VARARGS, "testing..."},
     {NULL, NULL, 0, NULL} /* Sentinel */
 };
@@ -612,7 +2913,32 @@ static struct PyModuleDef PyModuleDef_vsomeip = {
 
 /* Module entry-point */
 PyMODINIT_FUNC PyInit_vsomeip_ext(void) {
+  vsomeip_PayloadType.tp_basicsize = sizeof(vsomeip_PayloadObject);
+  vsomeip_PayloadType.tp_dealloc = payload_dealloc;
+  vsomeip_PayloadType.tp_as_buffer = &vsomeip_PayloadBuffer;
+  vsomeip_PayloadType.tp_flags = Py_TPFLAGS_DEFAULT;
+  vsomeip_PayloadType.tp_doc = "received payload (read-only buffer)";
+  if (PyType_Ready(&vsomeip_PayloadType) < 0)
+    return NULL;
+
+  vsomeip_MessageType.tp_basicsize = sizeof(vsomeip_MessageObject);
+  vsomeip_MessageType.tp_dealloc = message_dealloc;
+  vsomeip_MessageType.tp_getset = vsomeip_MessageGetSet;
+  vsomeip_MessageType.tp_flags = Py_TPFLAGS_DEFAULT;
+  vsomeip_MessageType.tp_doc = "received message (read-only), fields materialized on access";
+  if (PyType_Ready(&vsomeip_MessageType) < 0)
+    return NULL;
+
   auto module = PyModule_Create(&PyModuleDef_vsomeip);
+  if (module == NULL)
+    return NULL;
+
+  Py_INCREF(&vsomeip_MessageType);
+  if (PyModule_AddObject(module, "Message", (PyObject *)&vsomeip_MessageType) < 0) {
+    Py_DECREF(&vsomeip_MessageType);
+    Py_DECREF(module);
+    return NULL;
+  }
   return module;
 }
 